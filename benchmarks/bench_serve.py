@@ -0,0 +1,222 @@
+"""Lasttest des Deployments: ``cinemate.serve`` mit echten Streamlit-Workern.
+
+Startet für jede Worker-Zahl ``python -m cinemate.serve`` (Proxy plus
+Streamlit-Prozesse, gemeinsamer SQLite-Cache) und spielt Teilnehmer-Sessions
+über HTTP und WebSocket ab, wie ein Browser: ``GET /`` durch den Proxy (Cookie
+``cinemate_worker``), dann ``/_stcore/stream`` mit Genre-Auswahl, Klick auf
+"Empfehlung generieren" samt kompletter Reasoning-Wiedergabe und einem
+abschließenden Rerun. Die Genre-Tripel wechseln je Session (alle
+Kombinationen und Reihenfolgen), damit nicht alle Sessions dasselbe Script
+teilen.
+
+    python benchmarks/bench_serve.py --workers 1,2,4 --sessions 64 --concurrency 16
+
+Berichtet je Worker-Zahl Durchsatz, Latenz des Klick-Runs und den Speedup
+gegenüber der kleinsten Worker-Zahl. Sinnvoll nur mit mindestens so vielen
+freien Kernen wie Workern; der Lastgenerator selbst läuft in einem Prozess.
+Benötigt ``websockets``.
+"""
+
+import argparse
+import asyncio
+import http.client
+import itertools
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_sessions import percentile
+
+try:
+    import websockets
+except ImportError:  # optionale Abhängigkeit
+    websockets = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cinemate.catalog import GENRES  # noqa: E402
+
+SELECTIONS = list(itertools.permutations(GENRES, 3))
+
+
+def wait_healthy(ports, timeout):
+    """Wartet, bis alle Worker (nach ``cinemate.warmup``) antworten."""
+    deadline = time.monotonic() + timeout
+    pending = set(ports)
+    while pending:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Worker auf Ports {sorted(pending)} nicht erreichbar")
+        for port in list(pending):
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+                conn.request("GET", "/_stcore/health")
+                if conn.getresponse().status == 200:
+                    pending.discard(port)
+            except OSError:
+                pass
+        time.sleep(0.2)
+
+
+def start_serve(app, workers, port, shared_cache, time_scale):
+    env = {**os.environ, "CINEMATE_SHARED_CACHE": shared_cache, "CINEMATE_TIME_SCALE": str(time_scale)}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "cinemate.serve", app, "--workers", str(workers), "--port", str(port),
+         "--address", "127.0.0.1", "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return proc
+
+
+def affinity_cookie(port):
+    """Erster Request durch den Proxy; liefert das Cookie-Header-Feld (Worker-Bindung)."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.request("GET", "/")
+    response = conn.getresponse()
+    response.read()
+    cookies = [v.split(";")[0] for k, v in response.getheaders() if k.lower() == "set-cookie"]
+    return "; ".join(cookies)
+
+
+async def script_run(ws, widgets, timeout):
+    """Ein Rerun mit den gegebenen Widget-Zuständen; liefert (Widget-IDs, Nachrichten, Bytes)."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.widget_states.widgets.extend(widgets)
+    await ws.send(msg.SerializeToString())
+    ids, n, size = {}, 0, 0
+    while True:
+        data = await asyncio.wait_for(ws.recv(), timeout)
+        n += 1
+        size += len(data)
+        fm = ForwardMsg()
+        fm.ParseFromString(data)
+        kind = fm.WhichOneof("type")
+        if kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+            element = fm.delta.new_element
+            widget = getattr(element, element.WhichOneof("type"))
+            if getattr(widget, "id", ""):
+                ids[element.WhichOneof("type")] = widget.id
+        elif kind == "script_finished":
+            return ids, n, size
+
+
+async def run_session(port, genres, timeout):
+    """Eine Browser-Session; liefert Laufzeiten je Script-Run, Nachrichten und Bytes."""
+    from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+    cookie = await asyncio.to_thread(affinity_cookie, port)
+    latencies, msgs, sent = [], 0, 0
+    async with websockets.connect(
+        f"ws://127.0.0.1:{port}/_stcore/stream",
+        subprotocols=["streamlit"],
+        additional_headers={"Cookie": cookie},
+        max_size=None,
+    ) as ws:
+        async def timed(widgets):
+            nonlocal msgs, sent
+            t = time.perf_counter()
+            ids, n, size = await script_run(ws, widgets, timeout)
+            latencies.append(time.perf_counter() - t)
+            msgs += n
+            sent += size
+            return ids
+
+        ids = await timed([])
+        selection = WidgetState(id=ids["multiselect"])
+        selection.string_array_value.data.extend(genres)
+        ids = await timed([selection])
+        await timed([selection, WidgetState(id=ids["button"], trigger_value=True)])
+        await timed([selection])
+    return latencies, msgs, sent
+
+
+async def run_load(port, sessions, concurrency, timeout):
+    gate = asyncio.Semaphore(concurrency)
+    errors = []
+
+    async def one(i):
+        async with gate:
+            try:
+                return await run_session(port, SELECTIONS[i % len(SELECTIONS)], timeout)
+            except Exception as exc:
+                errors.append(f"{type(exc).__name__}: {exc}")
+                return None
+
+    results = await asyncio.gather(*(one(i) for i in range(sessions)))
+    return [r for r in results if r is not None], errors
+
+
+def bench(args, workers):
+    port = args.port
+    with tempfile.TemporaryDirectory() as tmp:
+        proc = start_serve(args.app, workers, port, os.path.join(tmp, "shared.sqlite"), args.time_scale)
+        try:
+            wait_healthy([port, *(port + 1 + i for i in range(workers))], args.startup_timeout)
+            t_start = time.perf_counter()
+            results, errors = asyncio.run(run_load(port, args.sessions, args.concurrency, args.timeout))
+            wall = time.perf_counter() - t_start
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            proc.wait(30)
+
+    clicks = [lat[2] for lat, _, _ in results]
+    runs = [t for lat, _, _ in results for t in lat]
+    return {
+        "workers": workers,
+        "sessions": args.sessions,
+        "completed": len(results),
+        "wall_s": round(wall, 3),
+        "sessions_per_s": round(len(results) / wall, 2),
+        "click_latency_p50_s": round(percentile(clicks, 50), 4),
+        "click_latency_p95_s": round(percentile(clicks, 95), 4),
+        "run_latency_p95_s": round(percentile(runs, 95), 4),
+        "msgs_per_session": round(statistics.mean(m for _, m, _ in results), 1) if results else 0,
+        "bytes_per_session": round(statistics.mean(b for _, _, b in results)) if results else 0,
+        "errors": errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--app", default="streamlit_app.py")
+    parser.add_argument("--workers", default="1,2", help="Worker-Zahlen, Komma-getrennt")
+    parser.add_argument("--sessions", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8, help="gleichzeitig offene Sessions")
+    parser.add_argument("--time-scale", type=float, default=0.01,
+                        help="Faktor für INTER_MESSAGE_PAUSE/CHAR_DELAY usw. (1 = Echtzeit)")
+    parser.add_argument("--port", type=int, default=8590)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Sekunden je Script-Run")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--json", help="Ergebnis zusätzlich als JSON schreiben")
+    args = parser.parse_args(argv)
+    if not args.time_scale > 0:
+        parser.error("--time-scale muss größer als 0 sein")
+    if websockets is None:
+        sys.exit("bench_serve.py benötigt das Paket 'websockets'")
+
+    reports = []
+    for workers in (int(n) for n in args.workers.split(",")):
+        report = bench(args, workers)
+        base = reports[0] if reports else report
+        report["speedup"] = round(report["sessions_per_s"] / base["sessions_per_s"], 2) if base["sessions_per_s"] else 0
+        reports.append(report)
+        for key, value in report.items():
+            print(f"{key:>22}: {value}")
+        print()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    return 1 if any(r["errors"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
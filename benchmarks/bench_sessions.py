@@ -0,0 +1,188 @@
+"""Headless-Benchmark: N simulierte Teilnehmer-Sessions gegen eine CineMate-App.
+
+Jede Session läuft über ``streamlit.testing.v1.AppTest`` durch Genre-Auswahl,
+Klick auf "Empfehlung generieren" (inkl. kompletter Reasoning-Wiedergabe) und
+einen abschließenden Rerun. Die Wartezeiten der App werden über
+``CINEMATE_TIME_SCALE`` gestaucht.
+
+Beispiel:
+
+    python benchmarks/bench_sessions.py --app streamlit_app.py --sessions 20 \\
+        --concurrency 8 --time-scale 0.01 --json bench.json
+
+Mit ``--processes`` laufen die Sessions in mehreren Interpretern mit
+gemeinsamem SQLite-Cache (``--concurrency`` gilt je Prozess). Das misst die
+Engine und den geteilten Cache, nicht das Deployment – Proxy, Cookie-Affinität
+und echte Streamlit-Server misst ``benchmarks/bench_serve.py``:
+
+    for p in 1 2 4; do
+        python benchmarks/bench_sessions.py --processes $p --sessions $((16 * p)) \\
+            --shared-cache /tmp/cinemate-bench.sqlite
+    done
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GENRES = ["Drama", "Action", "Horror"]
+
+
+class DeltaCounter:
+    """Zählt ForwardMsgs und ihre Größe je Session über den Enqueue-Hook von Streamlit."""
+
+    def __init__(self):
+        self.msgs = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def install(self):
+        from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+        from streamlit.runtime.scriptrunner_utils.script_run_context import get_script_run_ctx
+
+        def before_enqueue(msg):
+            ctx = get_script_run_ctx()
+            if ctx is None:
+                return
+            # Pro Lauf ein neuer Wrapper, der innere SessionState bleibt je AppTest gleich
+            key = id(ctx.session_state._state)
+            size = msg.ByteSize()
+            with self._lock:
+                self.msgs[key] += 1
+                self.bytes[key] += size
+
+        ForwardMsgQueue.on_before_enqueue_msg(before_enqueue)
+
+    def uninstall(self):
+        from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+
+        ForwardMsgQueue.on_before_enqueue_msg(None)
+
+
+def run_session(app_path, timeout):
+    """Eine Session; liefert (Laufzeiten je Script-Run, SessionState, Fehler).
+
+    Der SessionState wird zurückgegeben (nicht nur seine id), damit er bis zur
+    Auswertung lebt und ids nicht an spätere Sessions vergeben werden.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=timeout)
+    latencies = []
+
+    def timed(run):
+        t = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - t)
+
+    timed(at.run)
+    timed(lambda: at.multiselect[0].set_value(GENRES).run())
+    button = next(b for b in at.button if b.label.startswith("Empfehlung generieren"))
+    timed(lambda: button.click().run())
+    timed(at.run)  # Rerun nach Abschluss (z. B. Widget-Interaktion)
+
+    errors = [e.message for e in at.exception]
+    return latencies, at._session_state._state, errors
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return float("nan")
+    idx = min(len(values) - 1, max(0, round(p / 100 * (len(values) - 1))))
+    return values[idx]
+
+
+def run_batch(app_path, sessions, concurrency, timeout):
+    """``sessions`` Sessions mit ``concurrency`` Threads in diesem Prozess."""
+    sys.path.insert(0, ROOT)
+    counter = DeltaCounter()
+    counter.install()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda _: run_session(app_path, timeout), range(sessions)))
+    finally:
+        counter.uninstall()
+    return {
+        "latencies": [t for lat, _, _ in results for t in lat],
+        "msgs": [counter.msgs[id(state)] for _, state, _ in results],
+        "bytes": [counter.bytes[id(state)] for _, state, _ in results],
+        "errors": [e for _, _, errs in results for e in errs],
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--app", default="streamlit_app.py")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=1,
+                        help="AppTest-Prozesse; die Sessions werden gleichmäßig verteilt")
+    parser.add_argument("--shared-cache", help="gemeinsamer SQLite-Cache (CINEMATE_SHARED_CACHE)")
+    parser.add_argument("--time-scale", type=float, default=0.01,
+                        help="Faktor für INTER_MESSAGE_PAUSE/CHAR_DELAY usw. (1 = Echtzeit)")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--json", help="Ergebnis zusätzlich als JSON schreiben")
+    args = parser.parse_args(argv)
+    if not args.time_scale > 0:
+        parser.error("--time-scale muss größer als 0 sein")
+
+    os.environ["CINEMATE_TIME_SCALE"] = str(args.time_scale)
+    if args.shared_cache:
+        os.environ["CINEMATE_SHARED_CACHE"] = args.shared_cache
+    os.chdir(ROOT)  # relative Katalogpfade wie beim normalen Start
+    app_path = os.path.join(ROOT, args.app)
+
+    shares = [args.sessions // args.processes + (i < args.sessions % args.processes) for i in range(args.processes)]
+    t_start = time.perf_counter()
+    if args.processes == 1:
+        batches = [run_batch(app_path, args.sessions, args.concurrency, args.timeout)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            futures = [
+                pool.submit(run_batch, app_path, n, args.concurrency, args.timeout) for n in shares if n
+            ]
+            batches = [f.result() for f in futures]
+    wall = time.perf_counter() - t_start
+
+    latencies = [t for b in batches for t in b["latencies"]]
+    msgs = [m for b in batches for m in b["msgs"]]
+    sent = [n for b in batches for n in b["bytes"]]
+    errors = [e for b in batches for e in b["errors"]]
+
+    report = {
+        "app": args.app,
+        "sessions": args.sessions,
+        "processes": args.processes,
+        "concurrency": args.concurrency,
+        "time_scale": args.time_scale,
+        "wall_s": round(wall, 3),
+        "sessions_per_s": round(args.sessions / wall, 2),
+        "run_latency_p50_s": round(percentile(latencies, 50), 4),
+        "run_latency_p95_s": round(percentile(latencies, 95), 4),
+        "deltas_per_session": round(statistics.mean(msgs), 1) if msgs else 0,
+        "bytes_per_session": round(statistics.mean(sent)) if sent else 0,
+        "peak_rss_mb": round(max(b["peak_rss_mb"] for b in batches), 1),
+        "errors": errors,
+    }
+
+    for key, value in report.items():
+        print(f"{key:>22}: {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Kaltstart-Benchmark: Importzeit je Modul (``python -X importtime``) und Aufwärmzeit.
+
+Jede Messung läuft in einem frischen Interpreter. Gezählt wird nur, was nach
+``--preload`` importiert wird – standardmäßig das, was der Streamlit-Server vor
+dem ersten Script-Run ohnehin geladen hat; übrig bleibt, was die App selbst
+mitbringt (NumPy, Ranking, optionale Abhängigkeiten). ``--warmup`` misst
+zusätzlich ``cinemate.warmup.prestart`` (Importe, Katalog, Ressourcen).
+
+Beispiel:
+
+    python benchmarks/bench_startup.py --repeat 5 --top 15 --budget-ms 250
+
+Mit ``--budget-ms`` endet das Skript mit Status 1, wenn der Import das Budget
+überschreitet (etwa als Prüfung, bevor neue Worker automatisch skaliert werden).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MARKER = "--- cinemate bench_startup ---"
+DEFAULT_PRELOAD = "streamlit.web.bootstrap"
+
+
+def parse_importtime(stderr: str):
+    """``import time: self | cumulative | name``-Zeilen nach der Markierung -> Liste."""
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cum_us), depth))
+    return entries
+
+
+def measure_imports(module, preload):
+    code = "".join(f"import {name}\n" for name in preload)
+    code += f"import sys\nsys.stderr.write({MARKER!r} + '\\n')\nimport {module}\n"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Import fehlgeschlagen")
+    return parse_importtime(proc.stderr)
+
+
+def measure_warmup(preload):
+    code = "".join(f"import {name}\n" for name in preload)
+    code += "import json\nfrom cinemate.warmup import prestart\nprint(json.dumps(prestart()))\n"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "prestart fehlgeschlagen")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--module", default="cinemate.app", help="zu importierendes Modul")
+    parser.add_argument("--preload", default=DEFAULT_PRELOAD,
+                        help="vorher geladene Module (Komma-getrennt, leer = keine)")
+    parser.add_argument("--repeat", type=int, default=5, help="Messungen; berichtet wird der Median")
+    parser.add_argument("--top", type=int, default=15, help="so viele Module nach kumulierter Zeit")
+    parser.add_argument("--budget-ms", type=float, help="Obergrenze für die Importzeit")
+    parser.add_argument("--warmup", action="store_true", help="auch cinemate.warmup.prestart messen")
+    parser.add_argument("--json", help="Ergebnis zusätzlich als JSON schreiben")
+    args = parser.parse_args(argv)
+
+    preload = [name.strip() for name in args.preload.split(",") if name.strip()]
+    runs = [measure_imports(args.module, preload) for _ in range(args.repeat)]
+
+    # Median je Modul über alle Läufe (Module, die nur manchmal auftauchen, zählen mit 0)
+    names = {name: depth for run in runs for name, _, _, depth in run}
+    per_run = [{name: (s, c) for name, s, c, _ in run} for run in runs]
+    modules = {
+        name: {
+            "cumulative_ms": round(statistics.median(r.get(name, (0, 0))[1] for r in per_run) / 1000, 2),
+            "self_ms": round(statistics.median(r.get(name, (0, 0))[0] for r in per_run) / 1000, 2),
+            "depth": depth,
+        }
+        for name, depth in names.items()
+    }
+    totals = [sum(c for _, _, c, depth in run if depth == 0) / 1000 for run in runs]
+    import_ms = round(statistics.median(totals), 1)
+
+    top = sorted(modules.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)[:args.top]
+    print(f"{'kumuliert ms':>13} {'selbst ms':>10}  Modul")
+    for name, m in top:
+        print(f"{m['cumulative_ms']:>13.1f} {m['self_ms']:>10.1f}  {'  ' * m['depth']}{name}")
+    print()
+
+    report = {
+        "module": args.module,
+        "preload": preload,
+        "repeat": args.repeat,
+        "modules_imported": len(modules),
+        "import_ms": import_ms,
+        "import_ms_min": round(min(totals), 1),
+        "import_ms_max": round(max(totals), 1),
+    }
+    if args.warmup:
+        report["warmup_s"] = measure_warmup(preload)
+    over = args.budget_ms is not None and import_ms > args.budget_ms
+    if args.budget_ms is not None:
+        report["budget_ms"] = args.budget_ms
+        report["over_budget"] = over
+
+    for key, value in report.items():
+        print(f"{key:>22}: {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({**report, "modules": dict(top)}, f, indent=2, ensure_ascii=False)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
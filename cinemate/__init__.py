@@ -0,0 +1,12 @@
+"""Gemeinsame Bausteine für die CineMate-Apps (Katalog, Filter, Ranking)."""
+
+__all__ = ["Catalog", "ERAS", "GENRES", "STYLES", "load_tsv"]
+
+
+def __getattr__(name):
+    # Katalog (und damit NumPy) erst bei Bedarf laden: Proxy, Protokoll usw. kommen ohne aus
+    if name in __all__:
+        from cinemate import catalog
+
+        return getattr(catalog, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
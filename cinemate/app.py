@@ -0,0 +1,618 @@
+"""CineMate-Engine: gemeinsamer Ablauf aller Studienvarianten.
+
+Die Skripte (``streamlit_app.py``, ``cinemate3.py``) rufen nur noch
+``run(variant)`` auf; Texte, Ton und Abschlusscode kommen aus
+``cinemate.variants``. Katalog und Ergebnis-Cache werden dabei einmal pro
+Prozess geladen und von allen Varianten geteilt.
+"""
+
+import math
+import os
+import time
+from contextlib import nullcontext
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from cinemate import events, llm, metrics
+from cinemate.cache import ComputeAborted, ResultCache, SqliteStore
+from cinemate.catalog import ERAS, GENRES, STYLES
+from cinemate.playback import render_client_playback
+from cinemate.pool import RANKING_WORKERS, RankingPool
+from cinemate.recommend import catalog_recommendations, recommend, rng_for
+from cinemate.reload import CatalogWatcher
+from cinemate.script import PendingScript, render_preamble, render_script
+from cinemate.session import IDLE_TTL, MAX_ACTIVE_SESSIONS, SessionRecord, SessionRegistry
+from cinemate.signature import Signature
+from cinemate.speculate import Speculator
+from cinemate.timing import (
+    CHAR_DELAY, DOTS_DELAY, FLUSH_DELAY, INTER_MESSAGE_PAUSE, MAX_TYPING_FRAMES,
+    MIN_TYPING_TIME, PRE_TYPING, RENDER_BREAK, STREAM_FPS, TYPING_FPS,
+)
+
+# ----------------------------------------------------------
+# Filmkatalog (optional; ohne Datei werden fiktive Titel gezeigt)
+# ----------------------------------------------------------
+CATALOG_PATH = os.environ.get("CINEMATE_CATALOG", "data/catalog")
+RATINGS_PATH = os.environ.get("CINEMATE_RATINGS")  # separate title.ratings.tsv, falls nötig
+CATALOG_SOURCE = os.environ.get("CINEMATE_CATALOG_SOURCE")  # Verzeichnis mit TSV-Dumps (optional)
+# Unter cinemate.serve baut nur Worker 0 neue Versionen, alle übrigen lesen nur CURRENT
+if os.environ.get("CINEMATE_WORKER", "0") != "0":
+    CATALOG_SOURCE = None
+RELOAD_INTERVAL = float(os.environ.get("CINEMATE_RELOAD_INTERVAL", "60"))
+
+
+@st.cache_resource
+def get_catalog_watcher():
+    """Einmal pro Prozess: hält den Katalog und tauscht neue Versionen im Hintergrund ein."""
+    return CatalogWatcher(CATALOG_PATH, RATINGS_PATH, CATALOG_SOURCE, RELOAD_INTERVAL).start()
+
+
+def get_catalog():
+    """Aktueller Katalog (memory-mapped Verzeichnis, TSV oder ``None``)."""
+    return get_catalog_watcher().catalog
+
+
+class _NoCatalogYet(Exception):
+    """Noch kein gespeicherter Katalog – Pool später anlegen (Ausnahmen cacht st.cache_resource nicht)."""
+
+
+@st.cache_resource
+def _create_ranking_pool():
+    catalog = get_catalog()
+    if catalog is None or catalog.path is None:
+        raise _NoCatalogYet
+    pool = RankingPool(RANKING_WORKERS)
+    pool.warm(catalog.path)
+    return pool
+
+
+def get_ranking_pool():
+    """Vorgewärmter Prozess-Pool fürs Ranking oder ``None`` (CINEMATE_RANKING_WORKERS=0).
+
+    Solange kein gespeicherter Katalog da ist (z. B. vor dem ersten Publish des
+    Watchers), ebenfalls ``None``; angelegt wird der Pool beim ersten Aufruf danach.
+    """
+    if RANKING_WORKERS <= 0:
+        return None
+    try:
+        return _create_ranking_pool()
+    except _NoCatalogYet:
+        return None
+
+
+@st.cache_resource
+def _create_speculator(with_pool):
+    return Speculator(get_result_cache(), get_ranking_pool() if with_pool else None)
+
+
+def get_speculator():
+    """Ranking-Jobs im Voraus (während der Auswahl) und beim Klick, geteilt von allen Sessions.
+
+    Ohne Pool rechnen Threads; sobald der Pool läuft, übernimmt ein Speculator mit Pool.
+    """
+    return _create_speculator(get_ranking_pool() is not None)
+
+
+# Gemeinsamer Cache aller Worker-Prozesse (SQLite, siehe cinemate.serve)
+SHARED_CACHE = os.environ.get("CINEMATE_SHARED_CACHE")
+
+
+@st.cache_resource
+def get_result_cache():
+    """Prozessweiter Cache: (Katalog-Version, Signatur) -> Zeilen-IDs der Empfehlungen."""
+    store = SqliteStore(SHARED_CACHE, ttl=6 * 3600, table="rows") if SHARED_CACHE else None
+    return ResultCache(maxsize=2048, ttl=6 * 3600, store=store)
+
+
+@st.cache_resource
+def get_llm_cache():
+    """Generierte Texte je (Modell, Variante, Signatur, Genre-Reihenfolge, Schritt); optional SQLite-gestützt."""
+    path = llm.LLM_CACHE or SHARED_CACHE
+    store = SqliteStore(path, table="llm" if path == SHARED_CACHE else "cache") if path else None
+    return ResultCache(maxsize=4096, ttl=24 * 3600, store=store)
+
+
+@st.cache_resource
+def get_event_log():
+    """Ereignisprotokoll der Studie oder ``None`` (siehe cinemate.events)."""
+    return events.open_event_log()
+
+
+def log_event(kind, **fields):
+    """Ereignis einreihen (blockiert den Script-Run nicht)."""
+    event_log = get_event_log()
+    if event_log is not None:
+        event_log.emit(kind, **fields)
+
+
+# Ausfall, Zeitüberschreitung oder abgebrochene geteilte Generierung -> geskriptete Texte
+LLM_ERRORS = (llm.LLMUnavailable, TimeoutError, ComputeAborted)
+
+
+# ----------------------------------------------------------
+# Session State
+# ----------------------------------------------------------
+SESSION_IDLE_TTL = float(os.environ.get("CINEMATE_SESSION_IDLE_TTL", IDLE_TTL))
+
+
+@st.cache_resource
+def get_session_registry():
+    return SessionRegistry(MAX_ACTIVE_SESSIONS, SESSION_IDLE_TTL)
+
+
+@st.cache_resource
+def get_script_cache():
+    """Gerenderte Scripts je (Variante, Katalog-Version, Signatur, Genre-Reihenfolge, Teilnehmer-ID), geteilt von allen Sessions."""
+    return ResultCache(maxsize=4096, ttl=6 * 3600)
+
+
+def session_record() -> SessionRecord:
+    """Der kompakte Zustand dieser Session (einziger eigener Eintrag im Session State)."""
+    if "cinemate" not in st.session_state:
+        st.session_state.cinemate = SessionRecord()
+    record = st.session_state.cinemate
+    get_session_registry().touch(record)
+    return record
+
+
+def process_stats():
+    """Zähler der prozessweiten Ressourcen für ``metrics.export_stats``."""
+    stats = {
+        "result_cache": get_result_cache().stats,
+        "script_cache": get_script_cache().stats,
+        "llm_cache": get_llm_cache().stats,
+        "speculator": get_speculator().stats,
+        "sessions": get_session_registry().stats,
+    }
+    event_log = get_event_log()
+    if event_log is not None:
+        stats["events"] = event_log.stats
+    return stats
+
+
+# ----------------------------------------------------------
+# Chat-Hilfsfunktionen (nur für die Reasoning-Box)
+# ----------------------------------------------------------
+def typing_frames(text: str, perf):
+    """Liefert wachsende Textpräfixe an Wortgrenzen – höchstens TYPING_FPS pro Sekunde."""
+    duration = len(text) * CHAR_DELAY
+    n_frames = max(1, min(MAX_TYPING_FRAMES, math.ceil(duration * TYPING_FPS)))
+    frame_delay = duration / n_frames
+
+    t_start = time.monotonic()
+    pos = 0
+    for k in range(1, n_frames + 1):
+        target = len(text) * k // n_frames
+        cut = text.find(" ", target) if target < len(text) else -1
+        target = len(text) if cut == -1 else cut
+        if target > pos:
+            pos = target
+            yield text[:pos]
+        # Zeitbasiert schlafen, damit übersprungene Frames die Gesamtdauer nicht verkürzen
+        perf.sleep(t_start + k * frame_delay - time.monotonic())
+
+
+def type_into(ph, final_text: str, perf):
+    """Typing-Punkte, dann wortweise Ausgabe in einen Platzhalter."""
+    typing_duration = max(PRE_TYPING, MIN_TYPING_TIME)
+
+    t_start = time.time()
+    dots = ["", ".", "..", "..."]
+    i = 0
+    while time.time() - t_start < typing_duration:
+        ph.markdown(f"*CineMate schreibt{dots[i % 4]}*")
+        perf.count("markdown_calls")
+        i += 1
+        perf.sleep(DOTS_DELAY)
+
+    perf.sleep(FLUSH_DELAY)  # Flush
+
+    for frame in typing_frames(final_text, perf):
+        ph.markdown(frame)
+        perf.count("markdown_calls")
+    perf.count("chars_streamed", len(final_text))
+
+
+def assistant_typing_then_message(container, final_text: str, perf):
+    """Typing + Text in derselben Chat-Bubble (nur in Reasoning-Box)."""
+    with container:
+        with st.chat_message("assistant"):
+            type_into(st.empty(), final_text, perf)
+
+
+def assistant_llm_message(container, key, template_text: str, style: str, perf):
+    """Zeigt die LLM-Fassung eines Schritts in der Bubble; liefert (Text, LLM ok).
+
+    Gleiche Schritte gleicher Signaturen werden nur einmal generiert: der erste
+    Aufrufer streamt die Tokens live, gleichzeitige Aufrufer warten auf ihn,
+    spätere bekommen den Text aus dem Cache (jeweils normal getippt). Fällt
+    das Backend aus oder ist zu langsam, wird die Vorlage getippt.
+    """
+    with container:
+        with st.chat_message("assistant"):
+            ph = st.empty()
+            ph.markdown("*CineMate schreibt...*")
+            streamed = False
+
+            def generate():
+                nonlocal streamed
+                streamed = True
+                text, last = "", 0.0
+                for token in llm.stream_step(template_text, style):
+                    text += token
+                    perf.count("llm_tokens")
+                    now = time.monotonic()
+                    if now - last >= 1 / STREAM_FPS:
+                        ph.markdown(text)
+                        perf.count("markdown_calls")
+                        last = now
+                return text
+
+            try:
+                text = get_llm_cache().get_or_compute(key, generate, wait=llm.LLM_STEP_TIMEOUT)
+            except LLM_ERRORS:
+                perf.count("llm_fallbacks")
+                type_into(ph, template_text, perf)
+                return template_text, False
+            if streamed:
+                ph.markdown(text)
+                perf.count("chars_streamed", len(text))
+            else:
+                perf.count("llm_cache_hits")
+                type_into(ph, text, perf)
+            return text, True
+
+
+def llm_descriptions(variant, catalog_version, sig, genres, recs, perf):
+    """Beschreibungen per LLM (gecacht je Signatur und Genre-Reihenfolge); bei Ausfall bleiben die Originale."""
+    key = (llm.LLM_MODEL, variant.name, catalog_version, sig.digest, tuple(genres), "desc")
+    try:
+        texts = get_llm_cache().get_or_compute(
+            key,
+            lambda: llm.rewrite_descriptions([r["desc"] for r in recs], variant.llm_style),
+            wait=llm.LLM_TIMEOUT + 1,
+        )
+    except LLM_ERRORS:
+        perf.count("llm_fallbacks")
+        return recs
+    return [{**r, "desc": text} for r, text in zip(recs, texts)]
+
+
+def assistant_message(container, text: str):
+    with container:
+        with st.chat_message("assistant"):
+            st.markdown(text)
+
+
+def user_message(container, text: str):
+    with container:
+        with st.chat_message("user"):
+            st.markdown(text)
+
+
+# ----------------------------------------------------------
+# Eingaben
+# ----------------------------------------------------------
+def render_inputs(variant):
+    """Eingabe-Widgets; liefert (Genres, Ära, Stil, Laufzeit, Rating, Button geklickt)."""
+    boxed = variant.inputs_layout == "container"
+    with st.container(border=True) if boxed else nullcontext():
+        if boxed:
+            st.subheader(variant.inputs_title)
+
+        selected = st.multiselect(
+            variant.genres_label,
+            options=GENRES,
+            key="genres_select",
+            placeholder="Drei Genres auswählen",
+        )
+
+        # Validierung direkt unter der Genre-Auswahl
+        if not selected:
+            if variant.genres_hint:
+                st.info(variant.genres_hint)
+            can_generate = False
+        elif len(selected) != 3:
+            st.warning("Bitte wähle genau drei Genres.")
+            can_generate = False
+        else:
+            can_generate = True
+
+        if not boxed:
+            st.markdown("---")
+            st.subheader(variant.inputs_title)
+
+        era = st.selectbox(variant.era_label, ERAS, key="era")
+        style = st.radio(variant.style_label, STYLES, horizontal=variant.radio_horizontal, key="style")
+
+        runtime = st.slider(
+            variant.runtime_label,
+            min_value=60,
+            max_value=240,
+            value=(90, 120),
+            step=5,
+            key="runtime_range",
+        )
+
+        st.markdown(variant.rating_heading)
+        st.caption(variant.rating_caption)
+        rating = st.slider(
+            "Gewünschtes IMDb-Rating",
+            min_value=1.0,
+            max_value=10.0,
+            value=(6.0, 8.5),
+            step=0.1,
+            key="rating_range",
+        )
+
+        generate = st.button(
+            variant.button_label,
+            type=variant.button_type,
+            disabled=variant.validation == "disable" and not can_generate,
+        )
+
+    if generate and not can_generate:
+        st.error("Bitte wähle genau drei Genres, bevor du fortfährst.")
+        generate = False
+
+    return selected, era, style, runtime, rating, generate
+
+
+def make_sig(genres_sel, era_sel, style_sel, runtime, rating):
+    # Genre-Reihenfolge egal (Ranking und Ergebnis-Cache); die Texte nutzen die gewählte Reihenfolge
+    return Signature.from_inputs(genres_sel, era_sel, style_sel, runtime, rating)
+
+
+# ----------------------------------------------------------
+# Ablauf
+# ----------------------------------------------------------
+# Wiedergabe für alle Varianten festlegen ("server"/"client"); leer = wie in der Variante
+PLAYBACK = os.environ.get("CINEMATE_PLAYBACK", "").strip().lower() or None
+if PLAYBACK not in (None, "server", "client"):
+    raise ValueError(f"CINEMATE_PLAYBACK muss 'server' oder 'client' sein, nicht {PLAYBACK!r}")
+
+
+def run(variant):
+    """Rendert die komplette App für eine Studienvariante (ein Script-Run)."""
+    st.set_page_config(page_title="CineMate", page_icon="🎬")
+
+    # Messpunkte dieses Script-Runs (Export/Profiling per Umgebungsvariable, siehe cinemate.metrics)
+    ctx = get_script_run_ctx()
+    perf = metrics.begin_run(variant.name, ctx.session_id if ctx else "bare")
+    perf.count("reruns")
+
+    record = session_record()
+    catalog = get_catalog()  # geteilter, nur lesbarer Handle – keine Kopie pro Session
+    get_ranking_pool()  # beim ersten Run starten, damit die Worker beim ersten Klick warm sind
+    metrics.export_stats(variant.name, process_stats)
+
+    st.markdown(
+        """
+        <style>
+          .stMarkdown p { margin-bottom: 0.4rem; }
+          div[data-testid="stContainer"] { border-radius: 14px; }
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+    st.title("🎬 CineMate — Dein digitaler Film-Finder")
+    st.markdown(variant.greeting)
+
+    perf.start("widgets")
+    selected, era, style, runtime, rating, generate = render_inputs(variant)
+    perf.stop("widgets")
+
+    # Signatur der Eingaben: bei Änderung Empfehlungen/Reasoning zurücksetzen
+    with perf.span("signature"):
+        current_sig = make_sig(selected, era, style, runtime, rating)
+
+    # Auch die Reihenfolge zählt: die Texte nennen die Genres so, wie sie gewählt wurden
+    genre_order = tuple(selected)
+    if record.script is not None and (record.sig != current_sig or record.genres != genre_order):
+        record.reset()
+        st.info("Du hast deine Auswahl geändert – bitte generiere die Empfehlungen erneut.")
+
+    # Während die Slider noch bewegt werden: Ranking für die aktuelle Auswahl vorausrechnen
+    if catalog is not None and not generate and record.script is None:
+        speculator = get_speculator()
+        if len(selected) == 3:
+            record.speculative = speculator.speculate(current_sig, len(variant.films), catalog, record.speculative)
+        elif record.speculative is not None:
+            speculator.release(record.speculative)
+            record.speculative = None
+
+    # Klick auf Button → Empfehlungen erzeugen + Reasoning starten
+    if generate:
+        record.speculative = None  # der Klick übernimmt den Job
+        pid = st.query_params.get("pid")
+        version = catalog.version if catalog is not None else None
+        inputs = {
+            "genres": selected,
+            "era": era,
+            "style": style,
+            "runtime_min": int(runtime[0]),
+            "runtime_max": int(runtime[1]),
+            "rating_min": float(rating[0]),
+            "rating_max": float(rating[1]),
+        }
+
+        # Das Script wird über den Script-Cache geteilt: alles, was die Closures
+        # festhalten, steckt im Cache-Schlüssel; die Messpunkte kommen vom Aufrufer
+        def finish_script(recs, perf):
+            if llm.enabled():
+                with perf.span("llm_descriptions"):
+                    recs = llm_descriptions(variant, version, current_sig, genre_order, recs, perf)
+            with perf.span("render_script"):
+                return render_script(variant, inputs, recs, fictional=catalog is None)
+
+        def build_script(perf):
+            # Seed aus Signatur (+ Teilnehmer-ID aus ?pid=...) -> reproduzierbare Ausgabe
+            with perf.span("recommend"):
+                recs = recommend(
+                    current_sig, variant.films, catalog, get_result_cache(),
+                    rng=rng_for(current_sig, pid),
+                    genres=selected,
+                )
+            return finish_script(recs, perf)
+
+        def start_script():
+            # Ranking läuft (bzw. lief schon voraus) im Hintergrund, die ersten Schritte werden schon getippt
+            if catalog is None:
+                return build_script(perf)
+            with perf.span("recommend"):
+                rows = get_speculator().rows(current_sig, len(variant.films), catalog)
+            if rows.done() and rows.exception() is None:
+                return finish_script(catalog_recommendations(catalog, rows.result()), perf)
+            return PendingScript(
+                *render_preamble(variant, inputs),
+                rows,
+                lambda rows, perf: finish_script(catalog_recommendations(catalog, rows), perf),
+                build_script,
+            )
+
+        # Gleiche Auswahl (inkl. Genre-Reihenfolge) -> dasselbe Script-Objekt für alle Sessions
+        key = (variant.name, version, current_sig, genre_order, pid, llm.LLM_MODEL if llm.enabled() else None)
+        script = get_script_cache().get_or_compute(key, start_script)
+        record.reset(current_sig, version, script, genres=genre_order)
+        log_event(
+            "recommendations",
+            app=variant.name,
+            completion_code=variant.completion_code,
+            session=perf.session_id,
+            pid=pid,
+            sig=current_sig.digest,
+            catalog_version=version,
+            inputs=inputs,
+            timings={name: round(t, 4) for name, t in perf.spans.items()},
+        )
+
+    if record.script is not None:
+        render_reasoning(variant, record, perf)
+
+    perf.finish()
+
+
+def resolve_script(record, perf):
+    """Wartet ggf. auf das Ranking im Pool und legt das fertige Script im Record ab."""
+    if isinstance(record.script, PendingScript):
+        with perf.span("await_ranking"):
+            record.script = record.script.result(perf)
+    return record.script
+
+
+def films_field(script):
+    return [{"name": name, "year": year} for name, year in script.films]
+
+
+def log_completed(variant, record, perf, script, elapsed, playback):
+    """Ereignis "completed" mit den angezeigten Filmen, genau einmal je Generierung.
+
+    Server-Wiedergabe: im ersten Run, der die Karten zeigt (auch nach einem
+    Rerun in der letzten Pause). Client-Wiedergabe: beim Senden, mit dem
+    geplanten Ende der Wiedergabe im Browser.
+    """
+    if record.completed:
+        return
+    record.completed = True
+    log_event(
+        "completed",
+        app=variant.name,
+        completion_code=variant.completion_code,
+        session=perf.session_id,
+        sig=record.sig.digest,
+        playback=playback,
+        elapsed_s=round(elapsed, 3),
+        llm_steps=bin(record.llm_steps).count("1"),
+        films=films_field(script),
+    )
+
+
+def render_reasoning(variant, record, perf):
+    """Auswahlprozess (erst nach Klick sichtbar); setzt nach Reruns fort."""
+    script = record.script  # evtl. noch PendingScript: nur Eingaben und erste Schritte
+
+    if variant.intro:
+        st.markdown("---")
+        st.markdown(variant.intro)
+
+    st.markdown("<div id='auswahlprozess'></div>", unsafe_allow_html=True)
+    st.subheader("🧠 Auswahlprozess")
+
+    if not record.jumped:
+        import streamlit.components.v1 as components
+
+        components.html(
+            """
+            <script>
+                const el = window.parent.document.getElementById("auswahlprozess");
+                if (el) {
+                    el.scrollIntoView({ behavior: "smooth", block: "start" });
+                }
+            </script>
+            """,
+            height=0,
+        )
+        record.jumped = True
+
+    if (PLAYBACK or variant.playback) == "client":
+        script = resolve_script(record, perf)  # der Browser bekommt alles auf einmal
+        tail = ["—\n\n## 🍿 Empfohlene Filme", *script.cards, script.closing]
+        if script.footnote:
+            tail.append(f"*{script.footnote}*")
+        record.steps_done = len(script.steps)  # Wiedergabe läuft ab hier im Browser
+        end = render_client_playback(script.inputs, script.steps, tail, record.started)
+        log_completed(variant, record, perf, script, end, "client")
+        return
+
+    reasoning_box = st.container(height=520, border=True)
+    user_message(reasoning_box, script.inputs)
+
+    def llm_key(idx):
+        # Die Vorlagen nennen die Genres in gewählter Reihenfolge -> gehört in den Schlüssel
+        return (llm.LLM_MODEL, variant.name, record.catalog_version, record.sig.digest, record.genres, idx)
+
+    # Fertige Schritte (z. B. nach einem Rerun) sofort zeigen, nur den Rest animieren;
+    # LLM-Texte kommen aus dem geteilten Cache (sonst die Vorlage)
+    for idx in range(record.steps_done):
+        step = script.steps[idx]
+        if record.llm_steps >> idx & 1:
+            step = get_llm_cache().get(llm_key(idx), step)
+        assistant_message(reasoning_box, step)
+
+    perf.start("reasoning")
+    use_llm = llm.enabled()  # nach dem ersten Ausfall für den Rest des Runs geskriptet
+    for idx in range(record.steps_done, len(variant.steps)):
+        if idx == len(script.steps):
+            # Ab hier nennen die Schritte Filmtitel: spätestens jetzt muss das Ranking fertig sein
+            script = resolve_script(record, perf)
+        step = script.steps[idx]
+        if use_llm:
+            step, use_llm = assistant_llm_message(reasoning_box, llm_key(idx), step, variant.llm_style, perf)
+            record.llm_steps |= use_llm << idx
+        else:
+            assistant_typing_then_message(reasoning_box, step, perf)
+        record.steps_done = idx + 1
+        perf.sleep(RENDER_BREAK)
+        perf.sleep(INTER_MESSAGE_PAUSE)
+    perf.stop("reasoning")
+    script = resolve_script(record, perf)
+
+    perf.start("cards")
+    assistant_message(reasoning_box, "—\n\n## 🍿 Empfohlene Filme")
+
+    with reasoning_box:
+        for card in script.cards:
+            with st.chat_message("assistant"):
+                st.markdown(card)  # eine Karte = ein Markdown-Block
+            st.divider()
+
+    if variant.closing_style == "assistant":
+        assistant_message(reasoning_box, script.closing)
+    else:
+        st.success(script.closing)
+    if script.footnote:
+        st.caption(script.footnote)
+    perf.stop("cards")
+
+    log_completed(variant, record, perf, script, time.time() - record.started, "server")
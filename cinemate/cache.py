@@ -0,0 +1,200 @@
+"""Prozessweite LRU/TTL-Caches (Ranking-Ergebnisse, generierte Texte).
+
+``ResultCache.get_or_compute`` bündelt gleichzeitige Misses mit demselben
+Schlüssel (single-flight): nur ein Aufrufer rechnet, die anderen warten auf
+sein Ergebnis. Optional schreibt der Cache in einen ``SqliteStore`` durch,
+der Neustarts des Prozesses überlebt.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class ComputeAborted(RuntimeError):
+    """Die geteilte Berechnung wurde abgebrochen (z. B. Rerun der rechnenden Session)."""
+
+
+class _Flight:
+    """Eine laufende Berechnung, auf die weitere Aufrufer warten können."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        if not self.done.wait(timeout):
+            raise TimeoutError("Berechnung läuft noch")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SqliteStore:
+    """Persistente Schlüssel/Wert-Ablage mit Ablaufzeit (Schlüssel und Werte als JSON).
+
+    Mehrere Prozesse dürfen dieselbe Datei nutzen (WAL); ``table`` trennt
+    Caches mit verschiedenen Schlüsseln in einer Datei.
+    """
+
+    def __init__(self, path, ttl=7 * 24 * 3600.0, table="cache"):
+        if not table.isidentifier():
+            raise ValueError(f"ungültiger Tabellenname: {table!r}")
+        self.path = path
+        self.ttl = ttl
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT, expires REAL)"
+        )
+
+    @staticmethod
+    def _key(key):
+        return json.dumps(key, ensure_ascii=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires >= ?", (self._key(key), time.time())
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def put(self, key, value):
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires) VALUES (?, ?, ?)",
+                (self._key(key), json.dumps(value, ensure_ascii=False), time.time() + self.ttl),
+            )
+
+    def purge(self):
+        """Abgelaufene Einträge löschen."""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE expires < ?", (time.time(),))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+
+class ResultCache:
+    """Begrenzter, threadsicherer LRU-Cache mit Ablaufzeit und Trefferzählern.
+
+    Mit ``store`` (z. B. ``SqliteStore``) werden Speicher-Misses dort
+    nachgeschlagen und neue Werte durchgeschrieben; Schlüssel und Werte müssen
+    dann JSON-serialisierbar sein.
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600.0, store=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.store = store
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}  # key -> _Flight
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.store_hits = 0
+        self.coalesced = 0
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] >= now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+        if self.store is not None:
+            value = self.store.get(key, _MISSING)
+            if value is not _MISSING:
+                self._put_memory(key, value)
+                with self._lock:
+                    self.store_hits += 1
+                return value
+        return default
+
+    def _put_memory(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def put(self, key, value):
+        self._put_memory(key, value)
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def get_or_compute(self, key, compute, wait=None):
+        """Wert aus dem Cache oder ``compute()`` ausführen und ablegen.
+
+        ``compute`` läuft außerhalb des Locks und pro Schlüssel nur einmal
+        gleichzeitig; weitere Aufrufer warten höchstens ``wait`` Sekunden
+        (sonst ``TimeoutError``) und bekommen dasselbe Ergebnis bzw. dieselbe
+        Ausnahme. Ausnahmen werden nicht gecacht.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            entry = self._data.get(key)  # evtl. gerade vom Vorgänger abgelegt
+            if entry is not None and entry[0] >= time.monotonic():
+                return entry[1]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.wait(wait)
+
+        try:
+            value = compute()
+        except Exception as e:
+            flight.error = e
+            raise
+        except BaseException:
+            # Abbruch des Rechnenden (Rerun/Stop) nicht in fremde Script-Threads tragen
+            flight.error = ComputeAborted()
+            raise
+        else:
+            self.put(key, value)
+            flight.value = value
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "store_hits": self.store_hits,
+                "coalesced": self.coalesced,
+            }
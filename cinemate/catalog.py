@@ -0,0 +1,306 @@
+"""Filmkatalog als Spalten-Arrays mit vorberechneten Indizes.
+
+Die Filter der App (Genres, Ära, Stil, Laufzeit, IMDb-Rating) werden über
+Genre-Bitmasken und sortierte Bereichsindizes beantwortet, statt jede Anfrage
+linear über alle Titel laufen zu lassen.
+"""
+
+import csv
+import gzip
+import hashlib
+import os
+from array import array
+
+import numpy as np
+
+GENRES = ("Komödie", "Drama", "Action", "Science-Fiction", "Horror", "Thriller")
+ERAS = ("Klassiker (<2000)", "Modern (2000+)")
+STYLES = ("Realfilm", "Animation", "Schwarz-Weiß")
+
+ERA_SPLIT_YEAR = 2000
+BW_UNTIL_YEAR = 1950  # ohne Stil-Spalte: ältere Titel gelten als Schwarz-Weiß
+MAX_RUNTIME = int(np.iinfo(np.int16).max)  # Spaltentyp; längere Laufzeiten (IMDb: bis 51420 min) werden gekappt
+
+# IMDb-Genrenamen -> Genres der App
+IMDB_GENRES = {
+    "Comedy": "Komödie",
+    "Drama": "Drama",
+    "Action": "Action",
+    "Sci-Fi": "Science-Fiction",
+    "Horror": "Horror",
+    "Thriller": "Thriller",
+}
+
+GENRE_BITS = {g: 1 << i for i, g in enumerate(GENRES)}
+
+
+def genre_mask(genres) -> int:
+    """Bitmaske für eine Menge von App-Genres."""
+    mask = 0
+    for g in genres:
+        mask |= GENRE_BITS[g]
+    return mask
+
+
+def file_version(paths) -> str:
+    """Version eines Katalogs ohne Manifest: Hash über Name, Größe und Änderungszeit der Dateien.
+
+    Stabil über Prozesse und Neustarts, ändert sich aber mit den Daten – Zeilen-IDs
+    im gemeinsamen Cache gelten nur für eine Version.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        st = os.stat(path)
+        h.update(f"{os.path.basename(path)}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def era_of(year: int) -> str:
+    return ERAS[0] if year < ERA_SPLIT_YEAR else ERAS[1]
+
+
+class RangeIndex:
+    """Sortierte Werte mit Zeilen-IDs; Bereichsabfragen per Binärsuche."""
+
+    def __init__(self, order: np.ndarray, sorted_values: np.ndarray):
+        self.order = order
+        self.sorted = sorted_values
+
+    @classmethod
+    def build(cls, values: np.ndarray) -> "RangeIndex":
+        order = np.argsort(values, kind="stable").astype(np.int32)
+        return cls(order, values[order])
+
+    def bounds(self, lo, hi):
+        a = int(np.searchsorted(self.sorted, lo, side="left"))
+        b = int(np.searchsorted(self.sorted, hi, side="right"))
+        return a, b
+
+    def rows(self, lo, hi) -> np.ndarray:
+        a, b = self.bounds(lo, hi)
+        return self.order[a:b]
+
+
+class Catalog:
+    """Spaltenorientierter, nur lesbarer Filmkatalog.
+
+    Die numerischen Spalten und Indizes dürfen memory-mapped Arrays sein
+    (siehe ``cinemate.store``); ``names``/``descs``/``ids`` müssen nur
+    Indexzugriff per Zeilennummer unterstützen.
+    """
+
+    NUMERIC_COLUMNS = ("year", "runtime", "rating", "votes", "genres", "style")
+
+    def __init__(self, ids, names, descs, year, runtime, rating, votes, genres, style, indexes=None):
+        self.ids = ids
+        self.names = names
+        self.descs = descs
+        self.year = np.asarray(year, dtype=np.int16)
+        self.runtime = np.asarray(runtime, dtype=np.int16)
+        self.rating = np.asarray(rating, dtype=np.float32)
+        self.votes = np.asarray(votes, dtype=np.int32)
+        self.genres = np.asarray(genres, dtype=np.uint8)  # Bitmaske, siehe GENRE_BITS
+        self.style = np.asarray(style, dtype=np.uint8)  # Index in STYLES
+        self.text_index = None  # optional cinemate.textindex.TextIndex (nur gespeicherte Kataloge)
+        self.combo_table = None  # optional cinemate.combos.ComboTable (nur gespeicherte Kataloge)
+        self.version = None  # Version, Erstellzeit oder Datei-Hash (cinemate.reload, cinemate.store, file_version)
+        self.path = None  # Bundle-Verzeichnis (nur gespeicherte Kataloge, z. B. für cinemate.pool)
+        self._attach_indexes(indexes if indexes is not None else self._build_indexes())
+
+    def _build_indexes(self) -> dict:
+        """Alle Indizes als flaches Dict von Arrays (so werden sie auch gespeichert)."""
+        arrays = {}
+        # Sortierte Zeilenlisten je Genre und Stil
+        for i, bit in enumerate(GENRE_BITS.values()):
+            arrays[f"genre_rows_{i}"] = np.flatnonzero(self.genres & bit).astype(np.int32)
+        for i in range(len(STYLES)):
+            arrays[f"style_rows_{i}"] = np.flatnonzero(self.style == i).astype(np.int32)
+        # Bereichsindizes für die Slider bzw. die Ära
+        for col in ("year", "runtime", "rating"):
+            index = RangeIndex.build(getattr(self, col))
+            arrays[f"{col}_order"] = index.order
+            arrays[f"{col}_sorted"] = index.sorted
+        return arrays
+
+    def _attach_indexes(self, arrays: dict):
+        self.index_arrays = arrays
+        self.genre_rows = {g: arrays[f"genre_rows_{i}"] for i, g in enumerate(GENRES)}
+        self.style_rows = {s: arrays[f"style_rows_{i}"] for i, s in enumerate(STYLES)}
+        self.year_index = RangeIndex(arrays["year_order"], arrays["year_sorted"])
+        self.runtime_index = RangeIndex(arrays["runtime_order"], arrays["runtime_sorted"])
+        self.rating_index = RangeIndex(arrays["rating_order"], arrays["rating_sorted"])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def query(self, genres, era, style, runtime, rating) -> np.ndarray:
+        """Zeilen-IDs aller Titel, die mindestens eines der Genres haben und alle Filter erfüllen."""
+        year_lo, year_hi = (-1, ERA_SPLIT_YEAR - 1) if era == ERAS[0] else (ERA_SPLIT_YEAR, 9999)
+        # Rating-Grenzen auf float32 bringen, damit z. B. 8.5 exakt getroffen wird
+        rating_lo, rating_hi = np.float32(rating[0]), np.float32(rating[1])
+
+        # Kleinste Kandidatenmenge wählen (Bereichsindex, Stil- oder Genre-Listen),
+        # die übrigen Filter werden nur noch auf diesen Zeilen geprüft
+        spans = [
+            index.bounds(lo, hi) + (index,)
+            for index, lo, hi in (
+                (self.year_index, year_lo, year_hi),
+                (self.runtime_index, runtime[0], runtime[1]),
+                (self.rating_index, rating_lo, rating_hi),
+            )
+        ]
+        a, b, index = min(spans, key=lambda span: span[1] - span[0])
+        style_rows = self.style_rows[style]
+        genre_total = sum(len(self.genre_rows[g]) for g in genres)
+        if len(style_rows) <= min(b - a, genre_total):
+            rows = style_rows
+        elif genre_total < b - a:
+            rows = np.unique(np.concatenate([self.genre_rows[g] for g in genres]))
+        else:
+            rows = np.sort(index.order[a:b])
+
+        keep = (
+            ((self.genres[rows] & genre_mask(genres)) != 0)
+            & (self.style[rows] == STYLES.index(style))
+            & (self.year[rows] >= year_lo) & (self.year[rows] <= year_hi)
+            & (self.runtime[rows] >= runtime[0]) & (self.runtime[rows] <= runtime[1])
+            & (self.rating[rows] >= rating_lo) & (self.rating[rows] <= rating_hi)
+        )
+        return rows[keep]
+
+    def genre_names(self, row: int):
+        mask = int(self.genres[row])
+        return [g for g, bit in GENRE_BITS.items() if mask & bit]
+
+    def record(self, row: int) -> dict:
+        """Eine Katalogzeile im Format der Empfehlungskarten."""
+        genres = self.genre_names(row)
+        year = int(self.year[row])
+        desc = self.descs[row] or f"{', '.join(genres)} aus dem Jahr {year}."
+        return {
+            "name": self.names[row],
+            "year": year,
+            "genres": genres,
+            "style": STYLES[int(self.style[row])],
+            "runtime": int(self.runtime[row]),
+            "imdb": round(float(self.rating[row]), 1),
+            "votes": int(self.votes[row]),
+            "desc": desc,
+        }
+
+
+# ----------------------------------------------------------
+# Laden aus IMDb-artigen TSV-Dumps
+# ----------------------------------------------------------
+def _open_text(path):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+
+class Ratings:
+    """Rating und Stimmen je ``tconst`` als sortierte Arrays statt als Dict.
+
+    IDs der Form ``tt1234567`` werden als Zahl gespeichert (16 Byte pro
+    Eintrag statt ~200 Byte für Dict, Strings und Tupel); andere IDs landen
+    in einem kleinen Dict.
+    """
+
+    def __init__(self, keys, rating, votes, other=None):
+        order = np.argsort(keys, kind="stable")
+        self.keys = np.asarray(keys, dtype=np.int64)[order]
+        self.rating = np.asarray(rating, dtype=np.float32)[order]
+        self.votes = np.asarray(votes, dtype=np.int32)[order]
+        self.other = other or {}
+
+    @classmethod
+    def read(cls, path) -> "Ratings":
+        keys, rating, votes, other = array("q"), array("f"), array("i"), {}
+        with _open_text(path) as f:
+            for row in csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                tconst, avg, num = row["tconst"], row["averageRating"], row["numVotes"]
+                if r"\N" in (avg, num):
+                    continue
+                if tconst.startswith("tt") and tconst[2:].isdigit():
+                    keys.append(int(tconst[2:]))
+                    rating.append(float(avg))
+                    votes.append(int(num))
+                else:
+                    other[tconst] = (float(avg), int(num))
+        return cls(np.frombuffer(keys, dtype=np.int64), rating, votes, other)
+
+    def get(self, tconst):
+        """(Rating, Stimmen) oder ``None``."""
+        if not (tconst.startswith("tt") and tconst[2:].isdigit()):
+            return self.other.get(tconst)
+        key = int(tconst[2:])
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return float(self.rating[i]), int(self.votes[i])
+        return None
+
+
+def parse_row(row, ratings=None):
+    """Eine TSV-Zeile als (ID, Titel, Beschreibung, Jahr, Laufzeit, Rating, Stimmen,
+    Genre-Maske, Stil-Code) oder ``None``, wenn der Titel übersprungen wird."""
+    if row.get("titleType", "movie") != "movie" or row.get("isAdult") == "1":
+        return None
+    if ratings is not None:
+        found = ratings.get(row["tconst"])
+        if found is None:
+            return None
+        avg, num = found
+    else:
+        avg, num = row.get("averageRating", r"\N"), row.get("numVotes", r"\N")
+        if r"\N" in (avg, num):
+            return None
+    if r"\N" in (row["startYear"], row["runtimeMinutes"]):
+        return None
+
+    imdb_genres = row["genres"].split(",")
+    mask = genre_mask(IMDB_GENRES[g] for g in imdb_genres if g in IMDB_GENRES)
+    if not mask:
+        return None
+
+    y = int(row["startYear"])
+    if row.get("style") in STYLES:
+        s = STYLES.index(row["style"])
+    elif "Animation" in imdb_genres:
+        s = STYLES.index("Animation")
+    elif y < BW_UNTIL_YEAR:
+        s = STYLES.index("Schwarz-Weiß")
+    else:
+        s = STYLES.index("Realfilm")
+    return (
+        row["tconst"], row["primaryTitle"], row.get("description") or "",
+        y, min(int(row["runtimeMinutes"]), MAX_RUNTIME), float(avg), int(num), mask, s,
+    )
+
+
+def read_rows(path, ratings=None):
+    """Streamt die übernommenen Zeilen einer ``title.basics.tsv[.gz]`` (siehe ``parse_row``)."""
+    with _open_text(path) as f:
+        for row in csv.DictReader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+            parsed = parse_row(row, ratings)
+            if parsed is not None:
+                yield parsed
+
+
+def load_tsv(path, ratings_path=None) -> Catalog:
+    """Lädt einen Katalog aus einer TSV-Datei im Format von ``title.basics.tsv``.
+
+    Rating und Stimmen stehen entweder in den Spalten ``averageRating``/``numVotes``
+    derselben Datei oder in einer separaten ``title.ratings.tsv`` (``ratings_path``).
+    Optionale Spalten: ``description`` und ``style``. Titel ohne Jahr, Laufzeit,
+    Rating oder eines der App-Genres sowie Titel mit ``isAdult = 1`` werden
+    übersprungen; Laufzeiten über ``MAX_RUNTIME`` werden gekappt.
+
+    Lädt alles in den Speicher; für große Dumps ``cinemate.compiler`` verwenden.
+    """
+    ratings = Ratings.read(ratings_path) if ratings_path else None
+    rows = list(read_rows(path, ratings))
+    columns = list(zip(*rows)) if rows else [[] for _ in range(9)]
+    ids, names, descs = (list(c) for c in columns[:3])
+    catalog = Catalog(ids, names, descs, *columns[3:])
+    catalog.version = file_version([p for p in (path, ratings_path) if p])
+    return catalog
@@ -0,0 +1,111 @@
+"""Vorberechnete Kandidatenlisten für alle kategorialen Kombinationen.
+
+Sechs Genres, genau drei davon, zwei Ären und drei Stile ergeben nur
+C(6,3) · 2 · 3 = 120 Kombinationen. Für jede speichert die Tabelle die
+``LIMIT`` besten Titel nach dem Teil des Scores, der nicht von den Slidern
+abhängt (Genre, Ära, Stil, Konfidenz, Textähnlichkeit), samt Laufzeit und
+Rating. Innerhalb der Slider-Bereiche sind Laufzeit- und Rating-Score 1,
+die Reihenfolge der Treffer ist also genau die der Liste: eine Anfrage
+filtert nur noch die kurze Liste und nimmt die ersten k.
+
+Gebaut wird offline (nach dem Textindex) und neben dem Katalog gespeichert:
+
+    python -m cinemate.combos data/catalog
+"""
+
+import sys
+from itertools import combinations
+
+import numpy as np
+
+from cinemate.catalog import ERA_SPLIT_YEAR, ERAS, GENRES, STYLES, genre_mask
+from cinemate.ranking import score, text_bonus, top_k
+
+LIMIT = 8192  # Titel je Kombination
+ARRAY_NAMES = ("rows", "scores", "runtime", "rating", "offsets")
+
+# Bereiche, in denen Laufzeit- und Rating-Score immer 1 sind
+FULL_RUNTIME = (np.iinfo(np.int16).min, np.iinfo(np.int16).max)
+FULL_RATING = (-np.inf, np.inf)
+
+COMBOS = [
+    (triple, era, style)
+    for triple in combinations(GENRES, 3)
+    for era in ERAS
+    for style in STYLES
+]
+COMBO_INDEX = {(genre_mask(g), era, style): i for i, (g, era, style) in enumerate(COMBOS)}
+
+
+class ComboTable:
+    """Nur lesbare Tabelle; Kombination i = Einträge ``offsets[i]:offsets[i + 1]``."""
+
+    def __init__(self, rows, scores, runtime, rating, offsets):
+        self.rows = rows  # Zeilen-IDs, je Kombination nach Teilscore absteigend
+        self.scores = scores  # Teilscore (float32)
+        self.runtime = runtime  # Kopien der Spalten für zusammenhängende Zugriffe
+        self.rating = rating
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, catalog, limit=LIMIT) -> "ComboTable":
+        year = np.asarray(catalog.year)
+        parts = []
+        for triple, era, style in COMBOS:
+            in_era = (year < ERA_SPLIT_YEAR) if era == ERAS[0] else (year >= ERA_SPLIT_YEAR)
+            keep = (
+                ((catalog.genres & genre_mask(triple)) != 0)
+                & (catalog.style == STYLES.index(style))
+                & in_era
+            )
+            rows = np.flatnonzero(keep)
+            scores = score(catalog, triple, era, style, FULL_RUNTIME, FULL_RATING, rows)
+            scores += text_bonus(catalog, triple, style, rows, exact=True)
+            best = top_k(scores, limit)
+            parts.append((rows[best].astype(np.int32), scores[best]))
+
+        offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        np.cumsum([len(r) for r, _ in parts], out=offsets[1:])
+        rows = np.concatenate([r for r, _ in parts])
+        return cls(
+            rows,
+            np.concatenate([s for _, s in parts]).astype(np.float32),
+            np.asarray(catalog.runtime)[rows],
+            np.asarray(catalog.rating)[rows],
+            offsets,
+        )
+
+    @property
+    def arrays(self) -> dict:
+        return {name: getattr(self, name) for name in ARRAY_NAMES}
+
+    def best(self, genres, era, style, runtime, rating, k=3):
+        """Top-k Zeilen-IDs wie ``ranking.best_matches`` oder ``None``.
+
+        ``None`` heißt: die Kombination ist nicht tabelliert oder die Liste
+        enthält weniger als k Titel in den Slider-Bereichen – dann muss der
+        Katalog regulär durchsucht werden.
+        """
+        i = COMBO_INDEX.get((genre_mask(genres), era, style))
+        if i is None:
+            return None
+        a, b = self.offsets[i], self.offsets[i + 1]
+        # wie Catalog.query: Rating-Grenzen als float32
+        rating_lo, rating_hi = np.float32(rating[0]), np.float32(rating[1])
+        runtime_col, rating_col = self.runtime[a:b], self.rating[a:b]
+        keep = (
+            (runtime_col >= runtime[0]) & (runtime_col <= runtime[1])
+            & (rating_col >= rating_lo) & (rating_col <= rating_hi)
+        )
+        hits = np.flatnonzero(keep)[:k]
+        if len(hits) < k:
+            return None
+        return self.rows[a + hits].astype(np.int64)
+
+
+if __name__ == "__main__":
+    # python -m cinemate.combos data/catalog  (Tabelle für einen gespeicherten Katalog neu bauen)
+    from cinemate.store import open_catalog, save_combo_table
+
+    directory = sys.argv[1]
+    save_combo_table(ComboTable.build(open_catalog(directory)), directory)
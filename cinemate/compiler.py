@@ -0,0 +1,144 @@
+"""Offline-Compiler: TSV-Dumps -> Katalog-Bundle (Format von ``cinemate.store``).
+
+Die Dumps werden zeilenweise gestreamt; übernommene Titel landen blockweise
+(``CHUNK_ROWS`` Zeilen) in Rohdateien je Spalte bzw. im UTF-8-Heap der
+String-Spalten. Genres und Stil werden dabei auf ihre Codes abgebildet
+(Bitmaske bzw. Index in ``STYLES``). Erst am Ende werden die Rohdateien mit
+``.npy``-Header versehen – der Speicherbedarf hängt also von der Blockgröße
+ab, nicht von der Größe der Dumps. Ratings aus ``title.ratings.tsv`` liegen
+als sortierte Arrays vor (``catalog.Ratings``).
+
+    python -m cinemate.compiler title.basics.tsv.gz [title.ratings.tsv.gz] data/catalog/neu
+
+Für versionierte Verzeichnisse mit Umschalten ohne Neustart siehe
+``cinemate.reload publish`` (nutzt diesen Compiler).
+"""
+
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+
+from cinemate.catalog import Catalog, Ratings, read_rows
+from cinemate.store import (
+    MANIFEST, STRING_COLUMNS, BundleError, StringColumn, build_search_tables, save_indexes, write_manifest,
+)
+
+CHUNK_ROWS = 100_000
+COPY_BUFFER = 16 * 1024 * 1024
+
+# Spaltentypen wie in ``Catalog`` (Reihenfolge wie in ``catalog.parse_row``)
+NUMERIC_DTYPES = {
+    "year": np.int16,
+    "runtime": np.int16,
+    "rating": np.float32,
+    "votes": np.int32,
+    "genres": np.uint8,
+    "style": np.uint8,
+}
+
+
+class _ColumnWriter:
+    """Hängt Blöcke eines Arrays roh an eine Datei an; ``finish`` macht daraus eine ``.npy``."""
+
+    def __init__(self, path, dtype):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.count = 0
+        self._raw = open(path + ".raw", "wb")
+
+    def append(self, values):
+        arr = np.asarray(values, dtype=self.dtype)
+        arr.tofile(self._raw)
+        self.count += len(arr)
+
+    def finish(self):
+        self._raw.close()
+        header = {"descr": np.lib.format.dtype_to_descr(self.dtype), "fortran_order": False, "shape": (self.count,)}
+        with open(self.path, "wb") as out, open(self.path + ".raw", "rb") as raw:
+            np.lib.format.write_array_header_1_0(out, header)
+            shutil.copyfileobj(raw, out, COPY_BUFFER)
+        os.remove(self.path + ".raw")
+
+
+class _StringWriter:
+    """String-Spalte als Heap plus Offsets (wie ``store.StringColumn``), blockweise."""
+
+    def __init__(self, directory, name):
+        self.heap = _ColumnWriter(os.path.join(directory, f"{name}.heap.npy"), np.uint8)
+        self.offsets = _ColumnWriter(os.path.join(directory, f"{name}.offsets.npy"), np.int64)
+        self.offsets.append([0])
+
+    def append(self, values):
+        offsets, heap = StringColumn.encode(values)
+        self.offsets.append(offsets[1:] + self.heap.count)
+        self.heap.append(heap)
+
+    def finish(self):
+        self.heap.finish()
+        self.offsets.finish()
+
+
+def compile_catalog(path, ratings_path, directory, chunk_rows=CHUNK_ROWS) -> int:
+    """Schreibt Spalten, String-Heaps und Indizes; liefert die Zahl der Titel."""
+    os.makedirs(directory, exist_ok=True)
+    ratings = Ratings.read(ratings_path) if ratings_path else None
+    strings = {name: _StringWriter(directory, name) for name in STRING_COLUMNS}
+    numeric = {
+        name: _ColumnWriter(os.path.join(directory, f"{name}.npy"), dtype)
+        for name, dtype in NUMERIC_DTYPES.items()
+    }
+    writers = [*strings.values(), *numeric.values()]  # Reihenfolge wie parse_row
+
+    def flush(block):
+        for writer, values in zip(writers, zip(*block)):
+            writer.append(values)
+
+    block = []
+    for row in read_rows(path, ratings):
+        block.append(row)
+        if len(block) >= chunk_rows:
+            flush(block)
+            block = []
+    if block:
+        flush(block)
+    for writer in writers:
+        writer.finish()
+
+    # Indizes aus den gemappten Spalten (nur numerische Arrays im Speicher)
+    def load(name):
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+    catalog = Catalog(
+        *(StringColumn(load(f"{name}.offsets"), load(f"{name}.heap")) for name in STRING_COLUMNS),
+        *(load(name) for name in NUMERIC_DTYPES),
+    )
+    save_indexes(catalog, directory)
+    return len(catalog)
+
+
+def compile_bundle(sources, directory, chunk_rows=CHUNK_ROWS) -> int:
+    """Komplettes Bundle (Katalog, Textindex, Kombinationstabelle, Manifest).
+
+    Nur in ein neues Verzeichnis: die Spalten werden an Ort und Stelle
+    geschrieben, laufende Worker mit gemappten Dateien würden abstürzen.
+    """
+    if os.path.exists(os.path.join(directory, MANIFEST)):
+        raise BundleError(f"{directory}: enthält schon ein Bundle (neues Verzeichnis oder cinemate.reload publish)")
+    path, ratings_path = sources[0], (sources[1] if len(sources) > 1 else None)
+    rows = compile_catalog(path, ratings_path, directory, chunk_rows)
+    build_search_tables(directory)
+    write_manifest(directory, rows, sources=[os.path.basename(p) for p in sources])
+    return rows
+
+
+if __name__ == "__main__":
+    # python -m cinemate.compiler title.basics.tsv[.gz] [title.ratings.tsv[.gz]] ziel/
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+    *sources, target = sys.argv[1:]
+    t = time.perf_counter()
+    n = compile_bundle(sources, target)
+    print(f"{n} Titel -> {target} ({time.perf_counter() - t:.1f} s)")
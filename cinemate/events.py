@@ -0,0 +1,189 @@
+"""Protokoll der Studieninteraktionen (Eingaben, Empfehlungen, Abschluss, Zeiten).
+
+Script-Runs legen Ereignisse nur in eine begrenzte Warteschlange; ein
+Hintergrund-Thread schreibt sie gesammelt weg. Ziel per Umgebungsvariable:
+
+- ``CINEMATE_EVENT_LOG=events.jsonl``: JSON Lines, ab ``CINEMATE_EVENT_ROTATE_MB``
+  (Standard 64) wird die Datei mit Zeitstempel umbenannt und neu begonnen.
+- ``CINEMATE_EVENT_LOG=events.sqlite`` (Endung ``.db``/``.sqlite``/``.sqlite3``):
+  SQLite im WAL-Modus, Tabelle ``events``.
+
+Ist die Warteschlange voll (Schreibziel zu langsam), wartet ``emit`` höchstens
+``PUT_TIMEOUT`` Sekunden und verwirft das Ereignis dann (``dropped`` zählt mit),
+statt den Script-Run aufzuhalten. Beim Beenden des Prozesses wird der Rest
+geschrieben.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+EVENT_LOG = os.environ.get("CINEMATE_EVENT_LOG")
+ROTATE_BYTES = int(float(os.environ.get("CINEMATE_EVENT_ROTATE_MB", "64")) * 1024 * 1024)
+QUEUE_SIZE = 10_000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0  # Sekunden bis ein angefangener Batch spätestens geschrieben wird
+PUT_TIMEOUT = 0.05
+CLOSE_TIMEOUT = 10.0
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class JsonlSink:
+    """Append-only JSON Lines mit Rotation nach Größe."""
+
+    def __init__(self, path, rotate_bytes=ROTATE_BYTES):
+        self.path = path
+        self.rotate_bytes = rotate_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, events):
+        data = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in events)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+            size = f.tell()
+        if self.rotate_bytes and size >= self.rotate_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        stem, ext = os.path.splitext(self.path)
+        target = f"{stem}-{time.strftime('%Y%m%d-%H%M%S')}{ext}"
+        while os.path.exists(target):
+            target = f"{os.path.splitext(target)[0]}a{ext}"
+        os.replace(self.path, target)
+
+    def close(self):
+        pass
+
+
+class SqliteSink:
+    """Tabelle ``events(id, ts, kind, session, data)``; ein Batch = eine Transaktion."""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "id INTEGER PRIMARY KEY, ts REAL, kind TEXT, session TEXT, data TEXT)"
+        )
+
+    def write(self, events):
+        rows = [
+            (e["ts"], e["kind"], e.get("session"), json.dumps(e, ensure_ascii=False))
+            for e in events
+        ]
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO events (ts, kind, session, data) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def close(self):
+        self._conn.close()
+
+
+def open_sink(path):
+    if path.lower().endswith(SQLITE_SUFFIXES):
+        return SqliteSink(path)
+    return JsonlSink(path)
+
+
+class EventLog:
+    """Warteschlange plus Schreib-Thread; ``emit`` ist aus jedem Thread erlaubt."""
+
+    def __init__(self, sink, maxsize=QUEUE_SIZE, batch_size=BATCH_SIZE, interval=FLUSH_INTERVAL):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name="cinemate-events", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def emit(self, kind, **fields) -> bool:
+        """Ereignis einreihen; ``False``, wenn es wegen Überlast verworfen wurde."""
+        if self._closed:
+            return False
+        event = {"ts": time.time(), "kind": kind, **fields}
+        try:
+            self._queue.put(event, timeout=PUT_TIMEOUT)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                log.warning("Ereignisprotokoll überlastet, %d Ereignisse verworfen", self.dropped)
+            return False
+        return True
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.interval)
+            except queue.Empty:
+                continue
+            batch = []
+            item = first
+            deadline = time.monotonic() + self.interval
+            while True:
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    # Beim Beenden nur noch leeren, sonst kurz auf weitere Ereignisse warten
+                    item = self._queue.get(timeout=0 if stopping else max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            self._write(batch)
+        self.sink.close()
+
+    def _write(self, batch):
+        if not batch:
+            return
+        try:
+            self.sink.write(batch)
+        except Exception:
+            self.failed += len(batch)
+            log.exception("Ereignisprotokoll: %d Ereignisse nicht geschrieben", len(batch))
+        else:
+            self.written += len(batch)
+
+    def close(self, timeout=CLOSE_TIMEOUT):
+        """Keine neuen Ereignisse mehr annehmen, Rest schreiben und Thread beenden."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)  # wartet notfalls, bis der Schreiber Platz gemacht hat
+        self._thread.join(timeout)
+
+    @property
+    def stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+def open_event_log(path=EVENT_LOG):
+    """``EventLog`` für ``path`` oder ``None`` (Protokoll abgeschaltet)."""
+    return EventLog(open_sink(path)) if path else None
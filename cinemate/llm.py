@@ -0,0 +1,185 @@
+"""Optionale LLM-Formulierung des Auswahlprozesses über eine OpenAI-kompatible API.
+
+Aktiv nur mit gesetztem ``CINEMATE_LLM_URL`` (z. B. ``http://127.0.0.1:8008/v1``)
+und installiertem ``httpx``; sonst bleibt es bei den geskripteten Texten.
+
+- ``CINEMATE_LLM_MODEL``: Modellname (Standard ``cinemate-stub``)
+- ``CINEMATE_LLM_API_KEY``: optionaler Bearer-Token
+- ``CINEMATE_LLM_TIMEOUT``: Sekunden bis zum ersten bzw. zwischen zwei Tokens (Standard 3)
+- ``CINEMATE_LLM_STEP_TIMEOUT``: Höchstdauer einer Nachricht (Standard 30)
+- ``CINEMATE_LLM_CACHE``: SQLite-Datei, in der generierte Texte Neustarts überleben
+
+Alle Anfragen laufen auf einer eigenen asyncio-Schleife in einem Hintergrund-
+Thread über einen gemeinsamen ``httpx.AsyncClient`` (Connection-Pool). Der
+Script-Thread liest nur Tokens aus einer Queue – immer mit Timeout. Bei
+Fehlern oder Zeitüberschreitung wird ``LLMUnavailable`` ausgelöst und die App
+greift auf die geskriptete Vorlage zurück.
+
+Zum Testen: ``python -m cinemate.llm_stub`` (siehe dort).
+"""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+from importlib.util import find_spec
+
+# Optionale Abhängigkeit; importiert wird erst beim ersten Client (Kaltstart ohne LLM)
+HAS_HTTPX = find_spec("httpx") is not None
+
+LLM_URL = os.environ.get("CINEMATE_LLM_URL", "").rstrip("/")
+LLM_MODEL = os.environ.get("CINEMATE_LLM_MODEL", "cinemate-stub")
+LLM_API_KEY = os.environ.get("CINEMATE_LLM_API_KEY")
+LLM_TIMEOUT = float(os.environ.get("CINEMATE_LLM_TIMEOUT", "3"))
+LLM_STEP_TIMEOUT = float(os.environ.get("CINEMATE_LLM_STEP_TIMEOUT", "30"))
+LLM_CACHE = os.environ.get("CINEMATE_LLM_CACHE")
+MAX_CONNECTIONS = 32
+
+SYSTEM_PROMPT = (
+    "Du bist CineMate, ein digitaler Film-Assistent. Formuliere den folgenden Schritt "
+    "deines Auswahlprozesses in ein bis drei Sätzen neu. Ton: {style}. "
+    "Behalte alle Filmtitel, Genres und Zahlen bei und erfinde keine neuen."
+)
+DESC_PROMPT = (
+    "Du bist CineMate, ein digitaler Film-Assistent. Formuliere die folgende "
+    "Filmbeschreibung in einem Satz neu. Ton: {style}."
+)
+
+_END = object()
+_lock = threading.Lock()
+_loop = None
+_client = None
+
+
+class LLMUnavailable(Exception):
+    """Backend nicht erreichbar, fehlerhaft oder zu langsam."""
+
+
+def enabled() -> bool:
+    return bool(LLM_URL) and HAS_HTTPX
+
+
+def connect():
+    """Schleife und Client vorab starten (Pre-Start, siehe ``cinemate.warmup``)."""
+    if enabled():
+        _ensure_loop()
+
+
+def _ensure_loop():
+    """Startet Hintergrund-Schleife und Client beim ersten Aufruf (einmal pro Prozess)."""
+    global _loop, _client
+    with _lock:
+        if _loop is not None:
+            return _loop
+        import httpx
+
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="cinemate-llm", daemon=True).start()
+
+        async def make_client():
+            headers = {"Authorization": f"Bearer {LLM_API_KEY}"} if LLM_API_KEY else None
+            return httpx.AsyncClient(
+                base_url=LLM_URL,
+                headers=headers,
+                timeout=httpx.Timeout(LLM_STEP_TIMEOUT, connect=LLM_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+                ),
+            )
+
+        _client = asyncio.run_coroutine_threadsafe(make_client(), loop).result()
+        _loop = loop
+        return loop
+
+
+def _payload(system, text, stream):
+    return {
+        "model": LLM_MODEL,
+        "stream": stream,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": text},
+        ],
+    }
+
+
+async def _stream_chat(payload, out: queue.Queue):
+    try:
+        async with _client.stream("POST", "/chat/completions", json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    out.put(delta)
+        out.put(_END)
+    except Exception as e:  # jeder Backend-Fehler führt zum Fallback
+        out.put(e)
+
+
+def stream_step(text: str, style: str):
+    """Formuliert einen Reasoning-Schritt neu; liefert die Tokens, sobald sie eintreffen.
+
+    Löst ``LLMUnavailable`` aus, wenn das erste Token (oder das nächste) nicht
+    innerhalb von ``LLM_TIMEOUT`` kommt oder die Nachricht ``LLM_STEP_TIMEOUT``
+    überschreitet. Bricht der Aufrufer ab (Rerun), wird die Anfrage verworfen.
+    """
+    loop = _ensure_loop()
+    out = queue.Queue()
+    payload = _payload(SYSTEM_PROMPT.format(style=style), text, stream=True)
+    future = asyncio.run_coroutine_threadsafe(_stream_chat(payload, out), loop)
+    deadline = time.monotonic() + LLM_STEP_TIMEOUT
+    try:
+        while True:
+            wait = min(LLM_TIMEOUT, deadline - time.monotonic())
+            try:
+                item = out.get(timeout=max(0.0, wait))
+            except queue.Empty:
+                raise LLMUnavailable("Zeitüberschreitung") from None
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise LLMUnavailable(str(item) or type(item).__name__) from item
+            yield item
+    finally:
+        future.cancel()
+
+
+async def _complete(payload) -> str:
+    resp = await _client.post("/chat/completions", json=payload)
+    resp.raise_for_status()
+    return resp.json()["choices"][0]["message"]["content"].strip()
+
+
+def rewrite_descriptions(descs, style: str):
+    """Alle Beschreibungen parallel neu formulieren; Gesamtbudget ``LLM_TIMEOUT``.
+
+    Liefert die neuen Texte in derselben Reihenfolge oder löst
+    ``LLMUnavailable`` aus, sobald auch nur eine Antwort fehlt.
+    """
+    loop = _ensure_loop()
+    system = DESC_PROMPT.format(style=style)
+
+    async def run_all():
+        tasks = [asyncio.ensure_future(_complete(_payload(system, d, stream=False))) for d in descs]
+        done, pending = await asyncio.wait(tasks, timeout=LLM_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        return [
+            task.result() if task in done and task.exception() is None else None
+            for task in tasks
+        ]
+
+    try:
+        texts = asyncio.run_coroutine_threadsafe(run_all(), loop).result(timeout=LLM_TIMEOUT + 1)
+    except Exception as e:
+        raise LLMUnavailable(str(e) or type(e).__name__) from e
+    if not all(texts):
+        raise LLMUnavailable("unvollständige Antworten")
+    return texts
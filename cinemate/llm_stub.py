@@ -0,0 +1,99 @@
+"""Lokaler Platzhalter für ein OpenAI-kompatibles Sprachmodell (nur für Tests).
+
+Beantwortet ``POST /v1/chat/completions`` – mit ``"stream": true`` als
+Server-Sent Events, sonst als einzelnes JSON. Die "Antwort" ist die letzte
+Nutzernachricht, Wort für Wort zurückgeschickt; Latenz bis zum ersten Token
+und Pause zwischen Tokens sind einstellbar, um Timeouts und Fallbacks zu prüfen.
+
+Beispiel:
+
+    python -m cinemate.llm_stub --port 8008 --latency 0.3 --token-delay 0.02
+    CINEMATE_LLM_URL=http://127.0.0.1:8008/v1 streamlit run streamlit_app.py
+"""
+
+import argparse
+import json
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(latency, token_delay):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-Alive, damit der Client-Pool greift
+
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/v1/chat/completions":
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            user = [m["content"] for m in body.get("messages", []) if m.get("role") == "user"]
+            text = user[-1] if user else ""
+            model = body.get("model", "cinemate-stub")
+
+            time.sleep(latency)
+            if body.get("stream"):
+                self._stream(text, model)
+            else:
+                self._send_json({
+                    "object": "chat.completion",
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }],
+                })
+
+        def _send_json(self, obj):
+            data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _chunk(self, data: bytes):
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        def _stream(self, text, model):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for token in re.findall(r"\S+\s*", text):
+                event = {
+                    "object": "chat.completion.chunk",
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+                }
+                self._chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+                time.sleep(token_delay)
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8008)
+    parser.add_argument("--latency", type=float, default=0.2, help="Sekunden bis zum ersten Token")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Sekunden zwischen Tokens")
+    args = parser.parse_args(argv)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.latency, args.token_delay))
+    print(f"LLM-Stub auf http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
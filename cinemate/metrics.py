@@ -0,0 +1,174 @@
+"""Laufzeit-Messpunkte für Script-Runs: Spans, Zähler, JSONL-Export, optionales Profiling.
+
+Gesteuert über Umgebungsvariablen (ohne Codeänderung in Produktion nutzbar):
+
+- ``CINEMATE_METRICS_FILE``: Pfad einer JSONL-Datei, eine Zeile pro Script-Run
+  (``"kind": "run"``) und periodisch eine pro Prozess (``"kind": "process"``).
+- ``CINEMATE_METRICS_STATS_INTERVAL``: Mindestabstand der Prozess-Zeilen in
+  Sekunden (Standard 60).
+- ``CINEMATE_PROFILE``: ``cprofile`` oder ``pyinstrument`` – profiliert jeden Run.
+- ``CINEMATE_PROFILE_DIR``: Zielverzeichnis der Profile (Standard ``profiles``).
+
+Ein Run wird mit ``begin_run`` gestartet und mit ``Run.finish`` abgeschlossen.
+Wird ein Run durch einen Rerun abgebrochen, schließt der nächste ``begin_run``
+derselben Session ihn als ``interrupted`` ab. ``export_stats`` schreibt die
+Zähler der prozessweiten Ressourcen (Caches, Spekulation, Sessions, Protokoll).
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+
+METRICS_FILE = os.environ.get("CINEMATE_METRICS_FILE")
+PROFILER = os.environ.get("CINEMATE_PROFILE", "").lower()
+PROFILE_DIR = os.environ.get("CINEMATE_PROFILE_DIR", "profiles")
+STATS_INTERVAL = float(os.environ.get("CINEMATE_METRICS_STATS_INTERVAL", "60"))
+MAX_TRACKED_SESSIONS = 10_000
+
+_lock = threading.Lock()
+_sessions = OrderedDict()  # session_id -> {"runs": int, "open": Run | None}
+_stats_due = 0.0  # time.monotonic(), ab dem die nächste Prozess-Zeile fällig ist
+
+
+def _start_profiler():
+    if PROFILER == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    if PROFILER == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            return None
+        profiler = Profiler()
+        profiler.start()
+        return profiler
+    return None
+
+
+def _stop_profiler(profiler, name):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, name)
+    if PROFILER == "cprofile":
+        profiler.disable()
+        profiler.dump_stats(path + ".prof")
+    else:
+        profiler.stop()
+        with open(path + ".html", "w", encoding="utf-8") as f:
+            f.write(profiler.output_html())
+
+
+def _export(record):
+    if not METRICS_FILE:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    with _lock:
+        with open(METRICS_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class Run:
+    """Messwerte eines einzelnen Script-Runs."""
+
+    def __init__(self, app, session_id, run_no):
+        self.app = app
+        self.session_id = session_id
+        self.run_no = run_no
+        self.t_start = time.perf_counter()
+        self.spans = defaultdict(float)
+        self._open_spans = {}
+        self.counters = defaultdict(int)
+        self.sleep_s = 0.0
+        self.finished = False
+        self._profiler = _start_profiler()
+
+    @contextmanager
+    def span(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] += time.perf_counter() - t
+
+    def start(self, name):
+        """Wie ``span``, für längere Abschnitte ohne Einrückung; mit ``stop`` beenden."""
+        self._open_spans[name] = time.perf_counter()
+
+    def stop(self, name):
+        t = self._open_spans.pop(name, None)
+        if t is not None:
+            self.spans[name] += time.perf_counter() - t
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def sleep(self, seconds):
+        """``time.sleep`` mit Buchführung über die geschlafene Zeit."""
+        if seconds > 0:
+            self.sleep_s += seconds
+            time.sleep(seconds)
+
+    def finish(self, interrupted=False):
+        if self.finished:
+            return
+        self.finished = True
+        if self._profiler is not None:
+            _stop_profiler(self._profiler, f"{self.app}-{self.session_id}-{self.run_no}")
+        _export({
+            "ts": time.time(),
+            "kind": "run",
+            "app": self.app,
+            "session": self.session_id,
+            "run": self.run_no,
+            "interrupted": interrupted,
+            "duration_s": round(time.perf_counter() - self.t_start, 6),
+            "sleep_s": round(self.sleep_s, 6),
+            "spans": {k: round(v, 6) for k, v in self.spans.items()},
+            "counters": dict(self.counters),
+        })
+
+
+def begin_run(app, session_id) -> Run:
+    """Startet die Messung eines Script-Runs; ein offener Vorgänger gilt als abgebrochen."""
+    with _lock:
+        state = _sessions.pop(session_id, None) or {"runs": 0, "open": None}
+        _sessions[session_id] = state
+        while len(_sessions) > MAX_TRACKED_SESSIONS:
+            _sessions.popitem(last=False)
+        previous, state["open"] = state["open"], None
+        state["runs"] += 1
+        run_no = state["runs"]
+    # Vorgänger zuerst schließen, damit sein Profiler vor dem neuen gestoppt wird
+    if previous is not None:
+        previous.finish(interrupted=True)
+    run = Run(app, session_id, run_no)
+    state["open"] = run
+    return run
+
+
+def export_stats(app, collect):
+    """Höchstens alle ``STATS_INTERVAL`` Sekunden eine Zeile mit dem Zustand des Prozesses.
+
+    ``collect`` liefert ``{Name: stats}`` und wird nur aufgerufen, wenn eine Zeile
+    fällig ist. Ausgelöst von Script-Runs; ein Prozess ohne Runs schreibt nichts.
+    """
+    global _stats_due
+    if not METRICS_FILE:
+        return
+    now = time.monotonic()
+    with _lock:
+        if now < _stats_due:
+            return
+        _stats_due = now + STATS_INTERVAL
+    _export({
+        "ts": time.time(),
+        "kind": "process",
+        "app": app,
+        "pid": os.getpid(),
+        "stats": collect(),
+    })
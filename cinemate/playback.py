@@ -0,0 +1,147 @@
+"""Client-seitige Wiedergabe des Auswahlprozesses (``Variant.playback = "client"``
+oder für alle Varianten ``CINEMATE_PLAYBACK=client``).
+
+Der Server schickt das komplette Skript mit Zeitstempeln in einer einzigen
+Nachricht; Typing-Animation und Pausen laufen im Browser.
+"""
+
+import html
+import json
+import re
+import time
+
+from cinemate.timing import (
+    CHAR_DELAY, DOTS_DELAY, FLUSH_DELAY, INTER_MESSAGE_PAUSE, MIN_TYPING_TIME, PRE_TYPING,
+    RENDER_BREAK, TYPING_FPS,
+)
+
+
+def md_to_html(text: str) -> str:
+    """Minimales Markdown (Überschriften, Listen, fett/kursiv) für die Client-Wiedergabe."""
+    def inline(line):
+        line = html.escape(line)
+        line = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", line)
+        return re.sub(r"\*(.+?)\*", r"<em>\1</em>", line)
+
+    out, in_list = [], False
+    for line in text.strip().split("\n"):
+        line = line.rstrip()
+        if line.startswith("- "):
+            if not in_list:
+                out.append("<ul>")
+                in_list = True
+            out.append(f"<li>{inline(line[2:])}</li>")
+            continue
+        if in_list:
+            out.append("</ul>")
+            in_list = False
+        if line.startswith("### "):
+            out.append(f"<h3>{inline(line[4:])}</h3>")
+        elif line.startswith("## "):
+            out.append(f"<h2>{inline(line[3:])}</h2>")
+        elif line:
+            out.append(f"<p>{inline(line)}</p>")
+    if in_list:
+        out.append("</ul>")
+    return "".join(out)
+
+
+def build_playback_script(user_text: str, steps, tail):
+    """Zeitplan aller Nachrichten – gleiche Abstände wie die Server-Wiedergabe."""
+    typing_duration = max(PRE_TYPING, MIN_TYPING_TIME) + FLUSH_DELAY
+    events = [{"role": "user", "html": md_to_html(user_text), "at": 0.0}]
+    t = 0.0
+    for text in steps:
+        type_dur = len(text) * CHAR_DELAY
+        events.append({
+            "role": "assistant",
+            "text": text,
+            "at": t,
+            "type_at": t + typing_duration,
+            "type_dur": type_dur,
+        })
+        t += typing_duration + type_dur + RENDER_BREAK + INTER_MESSAGE_PAUSE
+    for md in tail:
+        events.append({"role": "assistant", "html": md_to_html(md), "at": t})
+    return {"events": events, "dots_delay": DOTS_DELAY, "fps": TYPING_FPS, "offset": 0.0}
+
+
+PLAYBACK_HTML = """
+<style>
+  body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333F; }
+  #chat { height: 520px; overflow-y: auto; padding: 8px 12px;
+          border: 1px solid rgba(49,51,63,0.2); border-radius: 14px; box-sizing: border-box; }
+  .msg { display: flex; gap: 10px; margin: 10px 0; }
+  .avatar { flex: 0 0 32px; height: 32px; border-radius: 8px; text-align: center; line-height: 32px; }
+  .assistant .avatar { background: #FFBD45; }
+  .user .avatar { background: #FF4B4B; }
+  .body { flex: 1; line-height: 1.6; }
+  .body p { margin: 0 0 0.4rem 0; }
+  .user .body { background: rgba(240,242,246,0.6); border-radius: 8px; padding: 4px 10px; }
+</style>
+<div id="chat"></div>
+<script>
+  const script = __SCRIPT__;
+  const chat = document.getElementById("chat");
+  const t0 = performance.now() - script.offset * 1000;
+  const nodes = [];
+
+  function cut(text, frac) {
+    if (frac >= 1) return text;
+    const sp = text.indexOf(" ", Math.floor(text.length * frac));
+    return sp === -1 ? text : text.slice(0, sp);
+  }
+
+  function tick() {
+    const elapsed = (performance.now() - t0) / 1000;
+    let grew = false;
+    script.events.forEach((ev, i) => {
+      if (elapsed < ev.at) return;
+      if (!nodes[i]) {
+        const msg = document.createElement("div");
+        msg.className = "msg " + ev.role;
+        msg.innerHTML = '<div class="avatar">' + (ev.role === "user" ? "🙂" : "🤖") + '</div><div class="body"></div>';
+        chat.appendChild(msg);
+        nodes[i] = { body: msg.querySelector(".body"), last: null };
+        if (ev.html !== undefined) nodes[i].body.innerHTML = ev.html;
+        grew = true;
+      }
+      if (ev.text === undefined) return;
+      const node = nodes[i];
+      let shown;
+      if (elapsed < ev.type_at) {
+        const dots = ["", ".", "..", "..."][Math.floor((elapsed - ev.at) / script.dots_delay) % 4];
+        shown = "<em>CineMate schreibt" + dots + "</em>";
+      } else {
+        const p = document.createElement("p");
+        p.textContent = cut(ev.text, ev.type_dur > 0 ? (elapsed - ev.type_at) / ev.type_dur : 1);
+        shown = p.outerHTML;
+      }
+      if (shown !== node.last) {
+        node.body.innerHTML = shown;
+        node.last = shown;
+        grew = true;
+      }
+    });
+    if (grew) chat.scrollTop = chat.scrollHeight;
+    const last = script.events[script.events.length - 1];
+    if (elapsed < last.at + 1) setTimeout(tick, 1000 / script.fps);
+  }
+  tick();
+</script>
+"""
+
+
+def render_client_playback(user_text: str, steps, tail, started: float) -> float:
+    """Eine einzige Nachricht an den Browser; Typing und Pausen laufen clientseitig.
+
+    Bei einem Rerun setzt die Wiedergabe an der seit ``started`` verstrichenen Zeit fort.
+    Liefert den geplanten Zeitpunkt der letzten Nachricht (Sekunden nach ``started``).
+    """
+    import streamlit.components.v1 as components
+
+    script = build_playback_script(user_text, steps, tail)
+    script["offset"] = time.time() - started
+    payload = json.dumps(script).replace("</", "<\\/")
+    components.html(PLAYBACK_HTML.replace("__SCRIPT__", payload), height=530)
+    return script["events"][-1]["at"]
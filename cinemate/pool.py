@@ -0,0 +1,101 @@
+"""Ranking in einem vorgewärmten Prozess-Pool.
+
+``ranking.best_matches`` über einen großen Katalog hält den GIL; im
+Script-Thread würde es die Tipp-Animation aller anderen Sessions des Prozesses
+stocken lassen. Der Pool öffnet den Katalog in jedem Worker einmal (mmap –
+dieselben Seiten im Page-Cache wie im Hauptprozess) und bekommt pro Anfrage nur
+Verzeichnis, Filter und k; zurück kommen k Zeilen-IDs.
+
+Aktivierung: ``CINEMATE_RANKING_WORKERS=<n>`` (Standard 0: Ranking im
+Script-Thread). Nur für gespeicherte Kataloge (``store.open_catalog``).
+
+Streamlit führt das App-Script als ``__main__`` aus; ``spawn`` würde es in
+jedem neuen Worker erneut ausführen. Beim Einreichen (dabei startet der
+Executor seine Worker) steht deshalb kurz ein leeres ``__main__`` in
+``sys.modules``.
+"""
+
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor
+from contextlib import contextmanager
+
+from cinemate.ranking import best_matches
+from cinemate.store import open_catalog, touch_pages
+
+RANKING_WORKERS = int(os.environ.get("CINEMATE_RANKING_WORKERS", "0"))
+WORKER_CATALOGS = 2  # je Worker offene Versionen (aktuelle + Vorgänger)
+
+_catalogs = OrderedDict()  # nur im Worker: Verzeichnis -> Catalog
+
+
+def _catalog(directory):
+    catalog = _catalogs.pop(directory, None) or open_catalog(directory)
+    _catalogs[directory] = catalog
+    while len(_catalogs) > WORKER_CATALOGS:
+        _catalogs.popitem(last=False)
+    return catalog
+
+
+def _warm(directory):
+    """Katalog öffnen und die Indexseiten einmal anfassen."""
+    touch_pages(_catalog(directory))
+    return os.getpid()
+
+
+def _best_matches(directory, query, k):
+    return [int(row) for row in best_matches(_catalog(directory), *query, k=k)]
+
+
+@contextmanager
+def _plain_main():
+    main = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+class RankingPool:
+    """``ProcessPoolExecutor`` mit ``spawn`` (der Server-Prozess hat Threads; kein ``fork``).
+
+    Ist der Pool kaputt (Worker abgestürzt), wird er beim nächsten Einreichen
+    neu aufgebaut; die betroffenen Futures scheitern und ihre Aufrufer rechnen
+    selbst (siehe ``script.PendingScript``).
+    """
+
+    def __init__(self, workers=RANKING_WORKERS):
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+
+    def _new_executor(self):
+        # multiprocessing erst hier importieren: ohne Pool bleibt der Kaltstart schlanker
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        return ProcessPoolExecutor(self.workers, mp_context=get_context("spawn"))
+
+    def _submit(self, fn, *args):
+        with self._lock, _plain_main():
+            try:
+                return self._executor.submit(fn, *args)
+            except BrokenExecutor:  # BrokenProcessPool
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+                return self._executor.submit(fn, *args)
+
+    def warm(self, directory):
+        """Startet alle Worker und öffnet dort den Katalog, bevor die erste Anfrage kommt."""
+        return [self._submit(_warm, directory) for _ in range(self.workers)]
+
+    def submit(self, catalog, query, k):
+        """Future mit den Top-k-Zeilen-IDs für ``Signature.query()``-Argumente."""
+        return self._submit(_best_matches, catalog.path, query, k)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,105 @@
+"""Vektorisierter Gesamtscore über den Katalog und Top-k-Auswahl.
+
+Alle Teilscores liegen in [0, 1] und werden in einem Durchlauf über die
+Spalten-Arrays berechnet; für die Top-k wird nur partitioniert
+(``np.argpartition``) und anschließend die kleine Restmenge sortiert.
+"""
+
+import numpy as np
+
+from cinemate.catalog import ERA_SPLIT_YEAR, ERAS, STYLES, genre_mask
+from cinemate.textindex import query_text
+
+# Gewichte der Teilscores (Summe = 1)
+WEIGHTS = {
+    "genre": 0.35,
+    "runtime": 0.15,
+    "rating": 0.15,
+    "era": 0.10,
+    "style": 0.10,
+    "confidence": 0.15,
+}
+
+RUNTIME_FALLOFF = 30.0  # Minuten außerhalb des Bereichs bis Score 0.5
+RATING_FALLOFF = 1.0  # Rating-Punkte außerhalb des Bereichs bis Score 0.5
+VOTES_SATURATION = 1_000_000  # ab so vielen Stimmen volle Konfidenz
+TEXT_WEIGHT = 0.10  # Zusatzpunkte für Textähnlichkeit der Beschreibung (nur mit Textindex)
+
+# Anzahl gesetzter Bits je Genre-Bitmaske (uint8)
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.float32)
+
+
+def _window_score(values, lo, hi, falloff):
+    """1 innerhalb [lo, hi], danach hyperbolisch abfallend mit dem Abstand."""
+    dist = np.maximum(lo - values, 0) + np.maximum(values - hi, 0)
+    return 1.0 / (1.0 + dist.astype(np.float32) / falloff)
+
+
+def score(catalog, genres, era, style, runtime, rating, rows=None) -> np.ndarray:
+    """Gesamtscore für ``rows`` (Standard: alle Titel), gleiche Reihenfolge wie ``rows``."""
+    def col(arr):
+        return arr if rows is None else arr[rows]
+
+    mask = genre_mask(genres)
+    genre = POPCOUNT[col(catalog.genres) & mask] / max(len(genres), 1)
+
+    year = col(catalog.year)
+    era_match = (year < ERA_SPLIT_YEAR) if era == ERAS[0] else (year >= ERA_SPLIT_YEAR)
+    style_match = col(catalog.style) == STYLES.index(style)
+
+    confidence = np.log1p(col(catalog.votes).astype(np.float32)) / np.float32(np.log1p(VOTES_SATURATION))
+
+    total = WEIGHTS["genre"] * genre
+    total += WEIGHTS["runtime"] * _window_score(col(catalog.runtime), runtime[0], runtime[1], RUNTIME_FALLOFF)
+    total += WEIGHTS["rating"] * _window_score(col(catalog.rating), rating[0], rating[1], RATING_FALLOFF)
+    total += WEIGHTS["era"] * era_match
+    total += WEIGHTS["style"] * style_match
+    total += WEIGHTS["confidence"] * np.minimum(confidence, 1.0)
+    return total.astype(np.float32, copy=False)
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positionen der k höchsten Scores, absteigend sortiert."""
+    k = min(k, len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.lexsort((part, -scores[part]))]
+
+
+def text_bonus(catalog, genres, style, rows=None, exact=False):
+    """``TEXT_WEIGHT`` · Textähnlichkeit je Zeile (0 ohne Textindex)."""
+    if catalog.text_index is None:
+        return np.float32(0)
+    limit = len(catalog) if exact else 50_000
+    return TEXT_WEIGHT * catalog.text_index.scores(query_text(genres, style), rows, exact_limit=limit)
+
+
+def rank(catalog, genres, era, style, runtime, rating, k=3, rows=None, text=False):
+    """Top-k Zeilen-IDs und ihre Scores; ``rows`` schränkt die Kandidaten ein.
+
+    Mit ``text=True`` und vorhandenem Textindex zählt zusätzlich die
+    Ähnlichkeit der Beschreibungen zu den Genres/dem Stil (``TEXT_WEIGHT``).
+    """
+    scores = score(catalog, genres, era, style, runtime, rating, rows)
+    if text:
+        scores += text_bonus(catalog, genres, style, rows)
+    best = top_k(scores, k)
+    ids = best if rows is None else np.asarray(rows)[best]
+    return ids, scores[best]
+
+
+def best_matches(catalog, genres, era, style, runtime, rating, k=3) -> np.ndarray:
+    """Top-k unter den Titeln, die alle Filter erfüllen.
+
+    Gibt es weniger als k solche Titel, wird der ganze Katalog bewertet und die
+    nächstliegenden Treffer geliefert. Mit vorberechneter ``ComboTable``
+    (siehe ``cinemate.combos``) reicht meist ein Blick in deren kurze Liste.
+    """
+    if catalog.combo_table is not None:
+        ids = catalog.combo_table.best(genres, era, style, runtime, rating, k)
+        if ids is not None:
+            return ids
+    rows = catalog.query(genres, era, style, runtime, rating)
+    ids, _ = rank(catalog, genres, era, style, runtime, rating, k, rows if len(rows) >= k else None, text=True)
+    return ids
@@ -0,0 +1,120 @@
+"""Empfehlungs-Pipeline mit explizitem, reproduzierbarem Zufallsgenerator.
+
+Alle Zufallswerte kommen aus einem ``numpy.random.Generator``, dessen Seed aus
+der Signatur (und optional einer Teilnehmer-ID) abgeleitet wird. Gleiche
+Eingaben liefern damit dieselben Empfehlungen – wiederholbar für Studien-
+Replays, Lasttests und Caches.
+"""
+
+import hashlib
+from concurrent.futures import Future
+
+import numpy as np
+
+from cinemate.catalog import ERAS
+from cinemate.ranking import best_matches
+
+ERA_YEARS = {ERAS[0]: (1970, 1999), ERAS[1]: (2000, 2024)}
+VOTES_RANGE = (5_000, 250_000)
+RATING_OFFSETS = (0.0, -0.3, 0.2)  # Abstand der fiktiven Titel untereinander
+
+
+def seed_for(sig, participant_id=None) -> int:
+    """64-bit-Seed aus Signatur-Digest und optionaler Teilnehmer-ID."""
+    raw = f"{sig.digest}|{participant_id or ''}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+
+def rng_for(sig, participant_id=None) -> np.random.Generator:
+    return np.random.default_rng(seed_for(sig, participant_id))
+
+
+def fictional_recommendations(films, sig, rng, genres=None):
+    """Fiktive Titel mit Jahr/Laufzeit/Rating/Stimmen aus einem einzigen Batch-Draw."""
+    n = len(films)
+    draws = rng.random((n, 4))
+
+    r_lo, r_hi = sig.rating_range
+    offsets = np.resize(np.asarray(RATING_OFFSETS), n)
+    imdb = np.clip(r_lo + draws[:, 0] * (r_hi - r_lo) + offsets, r_lo, r_hi).round(1)
+
+    def ints(col, lo, hi):
+        return lo + (draws[:, col] * (hi - lo + 1)).astype(np.int64)
+
+    runtime = ints(1, *sig.runtime)
+    year = ints(2, *ERA_YEARS[sig.era])
+    votes = ints(3, *VOTES_RANGE)
+
+    genres = list(genres or sig.genres)
+    return [
+        {
+            "name": film["name"],
+            "year": int(year[i]),
+            "genres": list(genres),
+            "style": sig.style,
+            "runtime": int(runtime[i]),
+            "imdb": float(imdb[i]),
+            "votes": int(votes[i]),
+            "desc": film["desc"],
+        }
+        for i, film in enumerate(films)
+    ]
+
+
+def catalog_recommendations(catalog, rows):
+    return [catalog.record(row) for row in rows]
+
+
+def recommend(sig, films, catalog=None, cache=None, rng=None, genres=None):
+    """Empfehlungen für eine Signatur – aus dem Katalog (gecacht) oder fiktiv mit ``rng``.
+
+    ``rng`` wird nur für die fiktiven Titel gebraucht; ohne Angabe wird er aus
+    der Signatur abgeleitet.
+    """
+    k = len(films)
+    if catalog is not None:
+        if catalog.version is None:
+            cache = None  # ohne Version keine Zuordnung der Zeilen-IDs (siehe catalog.file_version)
+
+        def compute():
+            return [int(row) for row in best_matches(catalog, *sig.query(), k=k)]
+
+        # Zeilen-IDs gelten nur für eine Katalog-Version; Schlüssel JSON-fähig
+        # und prozessübergreifend stabil (gemeinsamer SQLite-Cache)
+        key = (catalog.version, sig.digest)
+        rows = cache.get_or_compute(key, compute) if cache is not None else compute()
+        return catalog_recommendations(catalog, rows)
+    return fictional_recommendations(films, sig, rng or rng_for(sig), genres)
+
+
+def submit_rows(sig, k, catalog, cache=None, pool=None) -> Future:
+    """Zeilen-IDs der Empfehlungen als Future – schnelle Wege sofort, sonst im ``pool``
+    (``pool.RankingPool`` oder ``speculate.ThreadRanking``).
+
+    Cache-Treffer und Kombinationstabelle kosten Mikrosekunden und werden
+    direkt beantwortet; nur das volle Ranking geht an den Prozess-Pool.
+    """
+    if catalog.version is None:
+        cache = None
+    key = (catalog.version, sig.digest)
+    rows = cache.get(key) if cache is not None else None
+    if rows is None and catalog.combo_table is not None:
+        ids = catalog.combo_table.best(*sig.query(), k)
+        if ids is not None:
+            rows = [int(row) for row in ids]
+    if rows is None and pool is None:
+        rows = [int(row) for row in best_matches(catalog, *sig.query(), k=k)]
+        if cache is not None:
+            cache.put(key, rows)
+    if rows is not None:
+        future = Future()
+        future.set_result(rows)
+        return future
+
+    future = pool.submit(catalog, sig.query(), k)
+    if cache is not None:
+        # Abgebrochene Vorausjobs (speculate.Speculator.release) liefern nichts
+        future.add_done_callback(
+            lambda f: not f.cancelled() and f.exception() is None and cache.put(key, f.result())
+        )
+    return future
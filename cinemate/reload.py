@@ -0,0 +1,222 @@
+"""Katalog-Aktualisierung im laufenden Betrieb.
+
+Ein versioniertes Katalogverzeichnis enthält je Version ein Unterverzeichnis
+(Format von ``cinemate.store``) und eine Datei ``CURRENT`` mit dem Namen der
+aktiven Version::
+
+    data/catalog/
+        CURRENT                 -> "20261018-060000"
+        20261017-060000/        (Vorgänger, wird beim nächsten Publish gelöscht)
+        20261018-060000/
+
+``publish`` baut eine neue Version in ein temporäres Verzeichnis, benennt es
+um und ersetzt ``CURRENT`` atomar. ``CatalogWatcher`` prüft im Hintergrund,
+ob ``CURRENT`` sich geändert hat, öffnet die neue Version (nur mmap) und
+tauscht den geteilten Handle aus. Laufende Script-Runs rechnen mit dem Handle
+weiter, den sie zu Beginn geholt haben; gelöschte Versionsdateien bleiben
+unter Linux gemappt, bis der letzte Verweis verschwindet.
+
+Mit ``source`` beobachtet der Watcher zusätzlich ein Verzeichnis mit den
+TSV-Dumps (``title.basics.tsv[.gz]``, optional ``title.ratings.tsv[.gz]``)
+und veröffentlicht bei Änderung selbst – in einem eigenen Prozess, damit
+Parsen und Indexbau weder Script-Threads noch den Heap des Servers belasten.
+Unter ``cinemate.serve`` tut das nur Worker 0 (``CINEMATE_WORKER``); die
+übrigen Worker sehen die neue Version über ``CURRENT``.
+
+Von Hand bzw. per Cronjob:
+
+    python -m cinemate.reload publish title.basics.tsv [title.ratings.tsv] data/catalog
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: Publish ohne Sperre (dann nur ein Publisher gleichzeitig)
+    fcntl = None
+
+from cinemate.catalog import load_tsv
+from cinemate.compiler import compile_bundle
+from cinemate.store import open_catalog
+
+CURRENT = "CURRENT"
+KEEP_VERSIONS = 2  # aktuelle Version + Vorgänger
+LOCK_FILE = ".publish.lock"
+MAX_RETRY_DELAY = 6 * 3600.0  # Obergrenze der Wartezeit nach fehlgeschlagenem Publish
+SOURCE_FILES = ("title.basics.tsv", "title.ratings.tsv")
+
+log = logging.getLogger(__name__)
+
+
+def current_version(root):
+    """Name der aktiven Version oder ``None`` (kein versioniertes Verzeichnis)."""
+    try:
+        with open(os.path.join(root, CURRENT), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _prune(root, keep):
+    versions = sorted(
+        d for d in os.listdir(root)
+        if os.path.isdir(os.path.join(root, d)) and not d.startswith(".")
+    )
+    for d in versions[:-keep]:
+        shutil.rmtree(os.path.join(root, d), ignore_errors=True)
+
+
+def publish(sources, root) -> str:
+    """Baut eine neue Version aus TSV-Dumps und schaltet ``CURRENT`` atomar um.
+
+    Gleichzeitige Aufrufe (Cronjob und Watcher) laufen über ``.publish.lock``
+    nacheinander (nur POSIX); jeder baut in ein eigenes temporäres Verzeichnis.
+    """
+    os.makedirs(root, exist_ok=True)
+    with open(os.path.join(root, LOCK_FILE), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        version = time.strftime("%Y%m%d-%H%M%S")
+        while os.path.exists(os.path.join(root, version)):
+            version += "a"
+        tmp = tempfile.mkdtemp(prefix=f".{version}.", suffix=".tmp", dir=root)
+        try:
+            compile_bundle(sources, tmp)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        os.rename(tmp, os.path.join(root, version))
+
+        pointer = os.path.join(root, f".{CURRENT}.tmp")
+        with open(pointer, "w", encoding="utf-8") as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(pointer, os.path.join(root, CURRENT))
+        _prune(root, KEEP_VERSIONS)
+    return version
+
+
+def source_files(source):
+    """Vorhandene Dumps im Quellverzeichnis (Basics zuerst, ``.gz`` erlaubt)."""
+    found = []
+    for name in SOURCE_FILES:
+        for candidate in (name, name + ".gz"):
+            path = os.path.join(source, candidate)
+            if os.path.isfile(path):
+                found.append(path)
+                break
+    return found
+
+
+def _fingerprint(paths):
+    return tuple((p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths)
+
+
+class CatalogWatcher:
+    """Hält den aktuellen Katalog; ``catalog`` liefert immer den neuesten Handle.
+
+    ``path`` darf ein versioniertes Verzeichnis (mit ``CURRENT``), ein
+    einfaches Katalogverzeichnis oder eine TSV-Datei sein; nur Ersteres wird
+    beobachtet.
+    """
+
+    def __init__(self, path, ratings_path=None, source=None, interval=60.0):
+        self.path = path
+        self.ratings_path = ratings_path
+        self.source = source
+        self.interval = interval
+        self.version = None
+        self.catalog = self._load()
+        self._seen_source = None
+        self._failed_source = None  # Fingerabdruck des zuletzt gescheiterten Publish
+        self._failures = 0
+        self._retry_at = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _load(self):
+        if os.path.isdir(self.path):
+            version = current_version(self.path)
+            if version is None:
+                return open_catalog(self.path)
+            catalog = open_catalog(os.path.join(self.path, version))
+            catalog.version = self.version = version
+            return catalog
+        if os.path.isfile(self.path):
+            return load_tsv(self.path, self.ratings_path)
+        return None
+
+    def start(self):
+        if self._thread is None and (self.source or os.path.isdir(self.path)):
+            self._thread = threading.Thread(target=self._run, name="cinemate-catalog", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        if self.source and current_version(self.path) is not None:
+            # Vorhandene Dumps gelten als veröffentlicht; ohne Version sofort bauen
+            self._seen_source = _fingerprint(source_files(self.source))
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                log.exception("Katalog-Aktualisierung fehlgeschlagen; alte Version bleibt aktiv")
+
+    def check(self):
+        """Einmal prüfen: ggf. neue Dumps veröffentlichen, dann neue Version eintauschen."""
+        if self.source:
+            self._publish_if_changed()
+        version = current_version(self.path) if os.path.isdir(self.path) else None
+        if version is not None and version != self.version:
+            catalog = open_catalog(os.path.join(self.path, version))
+            catalog.version = version
+            # Eine Referenzzuweisung: neue Runs sehen sofort die neue Version
+            self.catalog, self.version = catalog, version
+            log.info("Katalog-Version %s aktiv", version)
+
+    def _publish_if_changed(self):
+        paths = source_files(self.source)
+        if not paths:
+            return
+        fingerprint = _fingerprint(paths)
+        if fingerprint == self._seen_source:
+            return
+        if fingerprint == self._failed_source and time.monotonic() < self._retry_at:
+            return
+        # Nur veröffentlichen, wenn die Dateien nicht gerade noch geschrieben werden
+        time.sleep(min(self.interval, 5.0))
+        if _fingerprint(paths) != fingerprint:
+            return
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "cinemate.reload", "publish", *paths, self.path],
+                check=True,
+            )
+        except Exception:
+            # Dieselben Dumps erst nach wachsender Pause erneut versuchen, neue sofort
+            self._failures = self._failures + 1 if fingerprint == self._failed_source else 1
+            self._failed_source = fingerprint
+            self._retry_at = time.monotonic() + min(self.interval * 2 ** self._failures, MAX_RETRY_DELAY)
+            raise
+        self._seen_source = fingerprint
+        self._failed_source, self._failures = None, 0
+
+
+if __name__ == "__main__":
+    # python -m cinemate.reload publish title.basics.tsv [title.ratings.tsv] data/catalog
+    command, *args = sys.argv[1:]
+    if command != "publish" or len(args) < 2:
+        sys.exit(__doc__)
+    *sources, root = args
+    print(publish(sources, root))
@@ -0,0 +1,119 @@
+"""Fertig gerenderter Reasoning-Ablauf einer Empfehlung.
+
+Die Vorlagen einer Variante werden einmal pro Signatur (beim Klick auf
+"Empfehlung generieren") ausgefüllt und von allen Sessions geteilt; Reruns
+zeigen nur noch die fertigen Strings an. Jede Karte ist ein einziger
+Markdown-Block und damit ein einziges Delta im Frontend.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+RANKING_TIMEOUT = 30.0  # danach wird ohne Pool gerechnet (fallback)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Script:
+    inputs: str  # Nachricht des Nutzers mit den Eingaben
+    steps: tuple  # Reasoning-Schritte des Assistenten
+    cards: tuple  # eine Markdown-Karte pro Empfehlung
+    closing: str
+    footnote: str = ""
+    films: tuple = ()  # (Titel, Jahr) je Empfehlung, z. B. fürs Ereignisprotokoll
+
+
+def template_fields(variant, inputs, recs=None) -> dict:
+    """Felder für die Vorlagen; ohne ``recs`` fehlen ``top``/``mid``/``last``."""
+    trait1, trait2, trait3 = inputs["genres"]
+    fields = {
+        "trait1": trait1,
+        "trait2": trait2,
+        "trait3": trait3,
+        "era": inputs["era"],
+        "style": inputs["style"],
+        "runtime_min": inputs["runtime_min"],
+        "runtime_max": inputs["runtime_max"],
+        "rating_min": inputs["rating_min"],
+        "rating_max": inputs["rating_max"],
+    }
+    fields["cfg"] = variant.cfg_template.format(**fields)
+    if recs is not None:
+        fields["top"], fields["mid"], fields["last"] = (r["name"] for r in recs[:3])
+    return fields
+
+
+def render_card(variant, idx, rec, era) -> str:
+    return variant.card_template.format(
+        idx=idx,
+        name=rec["name"],
+        year=rec["year"],
+        desc=rec["desc"],
+        genres=", ".join(rec["genres"]),
+        era=era,
+        style=rec["style"],
+        runtime=rec["runtime"],
+        imdb=rec["imdb"],
+        votes=f"{rec['votes']:,}".replace(",", "."),
+    )
+
+
+def render_script(variant, inputs, recs, fictional=True) -> Script:
+    """Füllt alle Vorlagen der Variante für Eingaben und Empfehlungen aus.
+
+    ``fictional``: Titel ohne Katalog erfunden (Abschluss und Fußnote sagen das).
+    """
+    fields = template_fields(variant, inputs, recs)
+    return Script(
+        inputs=variant.inputs_template.format(**fields),
+        steps=tuple(template.format(**fields) for template in variant.steps),
+        cards=tuple(render_card(variant, idx, r, inputs["era"]) for idx, r in enumerate(recs, start=1)),
+        closing=variant.closing_text(fictional),
+        footnote=variant.footnote_text(fictional),
+        films=tuple((r["name"], r["year"]) for r in recs),
+    )
+
+
+def render_preamble(variant, inputs):
+    """Nutzernachricht und die ersten Schritte, die noch keine Empfehlungen brauchen."""
+    fields = template_fields(variant, inputs)
+    steps = variant.steps[:variant.steps_before_recs]
+    return variant.inputs_template.format(**fields), tuple(template.format(**fields) for template in steps)
+
+
+class PendingScript:
+    """Script, dessen Empfehlungen noch berechnet werden (siehe ``cinemate.pool``).
+
+    ``inputs`` und die ersten ``steps`` stehen schon fest und können gezeigt
+    werden, während das Ranking läuft; ``result(perf)`` wartet auf die Zeilen-IDs
+    und rendert das vollständige ``Script`` (einmal, auch bei mehreren
+    wartenden Sessions). Scheitert oder hängt der Pool, rechnet ``fallback``.
+    Das Objekt wird über den Script-Cache geteilt: ``finish`` und ``fallback``
+    bekommen die Messpunkte (``metrics.Run``) der Session, die gerade rendert,
+    statt die der Session festzuhalten, die das Script angelegt hat.
+    """
+
+    def __init__(self, inputs, steps, future, finish, fallback):
+        self.inputs = inputs
+        self.steps = steps
+        self._future = future  # Zeilen-IDs
+        self._finish = finish  # (Zeilen-IDs, perf) -> Script
+        self._fallback = fallback  # perf -> Script ohne Pool
+        self._script = None
+        self._lock = threading.Lock()
+
+    def result(self, perf) -> Script:
+        with self._lock:
+            if self._script is None:
+                try:
+                    rows = self._future.result(RANKING_TIMEOUT)
+                except Exception:
+                    log.warning("Ranking im Pool fehlgeschlagen; rechne im Script-Thread", exc_info=True)
+                    self._script = self._fallback(perf)
+                else:
+                    self._script = self._finish(rows, perf)
+                # Closures (Katalog, Run) nicht länger als nötig festhalten
+                self._future = self._finish = self._fallback = None
+            return self._script
@@ -0,0 +1,189 @@
+"""Mehrere App-Prozesse hinter einem lokalen Reverse-Proxy mit Session-Affinität.
+
+Ein Streamlit-Prozess führt alle Sessions in Threads unter dem GIL aus. Für
+mehr Durchsatz startet dieser Launcher ``--workers`` Streamlit-Prozesse auf
+den Ports ``port + 1`` ... ``port + n`` und nimmt selbst Verbindungen auf
+``port`` entgegen:
+
+    python -m cinemate.serve streamlit_app.py --workers 4 --port 8501
+
+Der Proxy arbeitet auf Verbindungsebene (HTTP und WebSocket werden nach dem
+ersten Request-Kopf nur noch durchgereicht). Neue Browser landen beim Worker
+mit den wenigsten offenen Verbindungen und bekommen das Cookie
+``cinemate_worker``; alle weiteren Verbindungen (Reconnects des WebSockets,
+Medien, Komponenten) gehen an denselben Worker. Fällt ein Worker aus (oder
+wärmt er sich noch auf, siehe ``cinemate.warmup``), wird auf den nächsten
+ausgewichen.
+
+Geteilt wird über das Dateisystem: der memory-mapped Katalog liegt einmal im
+Page-Cache, Empfehlungen und generierte Texte liegen zusätzlich in einem
+gemeinsamen SQLite-Cache (``CINEMATE_SHARED_CACHE``, Standard
+``data/shared-cache.sqlite``).
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import subprocess
+import sys
+from http.cookies import SimpleCookie
+
+COOKIE = "cinemate_worker"
+HEAD_LIMIT = 64 * 1024
+PIPE_BUFFER = 64 * 1024
+CLOSE_TIMEOUT = 5.0
+DEFAULT_SHARED_CACHE = "data/shared-cache.sqlite"
+
+log = logging.getLogger(__name__)
+
+
+def start_workers(app, n, base_port, extra_args=()):
+    """Startet ``n`` Streamlit-Prozesse (über ``cinemate.warmup``); alle nutzen denselben gemeinsamen Cache."""
+    env = dict(os.environ)
+    env.setdefault("CINEMATE_SHARED_CACHE", DEFAULT_SHARED_CACHE)
+    os.makedirs(os.path.dirname(env["CINEMATE_SHARED_CACHE"]) or ".", exist_ok=True)
+    workers = []
+    for i in range(n):
+        port = base_port + 1 + i
+        cmd = [
+            sys.executable, "-m", "cinemate.warmup", app,  # = streamlit run, nach dem Aufwärmen
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true",
+            *extra_args,
+        ]
+        workers.append(subprocess.Popen(cmd, env={**env, "CINEMATE_WORKER": str(i)}))
+    return workers
+
+
+def _worker_from_cookie(head: bytes, n):
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() != b"cookie":
+            continue
+        cookie = SimpleCookie()
+        try:
+            cookie.load(value.decode("latin-1"))
+        except Exception:
+            return None
+        morsel = cookie.get(COOKIE)
+        if morsel is not None and morsel.value.isdigit() and int(morsel.value) < n:
+            return int(morsel.value)
+    return None
+
+
+class StickyProxy:
+    """Verteilt Verbindungen auf Worker-Ports; Affinität per Cookie."""
+
+    def __init__(self, ports, host="127.0.0.1"):
+        self.ports = list(ports)
+        self.host = host
+        self.active = [0] * len(self.ports)  # offene Verbindungen je Worker
+        self._open = {}  # Task -> (Client-Writer, Worker-Writer) laufender Verbindungen
+
+    def _candidates(self, preferred):
+        n = len(self.ports)
+        if preferred is None:
+            preferred = min(range(n), key=self.active.__getitem__)
+        return [(preferred + k) % n for k in range(n)]
+
+    async def handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        pinned = _worker_from_cookie(head, len(self.ports))
+        for worker in self._candidates(pinned):
+            try:
+                up_reader, up_writer = await asyncio.open_connection(self.host, self.ports[worker])
+            except OSError:
+                continue
+            break
+        else:
+            writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        self.active[worker] += 1
+        task = asyncio.current_task()
+        self._open[task] = (writer, up_writer)
+        try:
+            up_writer.write(head)
+            # Neue Browser (oder Ausweichen nach Ausfall) an diesen Worker binden
+            set_cookie = pinned != worker
+            await asyncio.gather(
+                self._pipe(reader, up_writer),
+                self._pipe(up_reader, writer, worker if set_cookie else None),
+            )
+        finally:
+            self.active[worker] -= 1
+            self._open.pop(task, None)
+
+    async def _pipe(self, reader, writer, cookie_worker=None):
+        try:
+            if cookie_worker is not None:
+                head = await reader.readuntil(b"\r\n\r\n")
+                cookie = f"Set-Cookie: {COOKIE}={cookie_worker}; Path=/; HttpOnly; SameSite=Lax\r\n"
+                writer.write(head[:-2] + cookie.encode("latin-1") + b"\r\n")
+            while data := await reader.read(PIPE_BUFFER):
+                writer.write(data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    async def serve(self, port, address="0.0.0.0"):
+        server = await asyncio.start_server(self.handle, address, port, limit=HEAD_LIMIT)
+        log.info("Proxy auf %s:%d -> Worker %s", address, port, self.ports)
+        # SIGTERM über die Schleife: offene Verbindungen schließen, statt Tasks zu unterbrechen
+        stop = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+        async with server:
+            await stop.wait()
+            for writers in list(self._open.values()):
+                for writer in writers:
+                    writer.close()
+            if self._open:
+                await asyncio.wait(list(self._open), timeout=CLOSE_TIMEOUT)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("app", help="z. B. streamlit_app.py oder cinemate3.py")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--address", default="0.0.0.0")
+    args, streamlit_args = parser.parse_known_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    workers = start_workers(args.app, args.workers, args.port, streamlit_args)
+
+    def shutdown():
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        for proc in workers:
+            proc.terminate()  # Streamlit beendet sich sauber (atexit: Ereignisprotokoll)
+        for proc in workers:
+            try:
+                proc.wait(10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    proxy = StickyProxy([args.port + 1 + i for i in range(args.workers)])
+    try:
+        asyncio.run(proxy.serve(args.port, args.address))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutdown()
+
+
+if __name__ == "__main__":
+    main()
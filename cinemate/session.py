@@ -0,0 +1,86 @@
+"""Kompakter Zustand je Session und Räumung inaktiver Sessions.
+
+Eine Session hält nur einen ``SessionRecord`` mit festen Slots: Signatur,
+Katalog-Version, Fortschritt als Zahlen und einen Verweis auf das gerenderte
+``Script``. Das Script selbst liegt in einem prozessweiten Cache und wird
+von allen Sessions mit derselben Auswahl geteilt – der Speicher wächst mit
+der Zahl verschiedener Auswahlen, nicht mit der Zahl der Teilnehmer.
+
+``SessionRegistry`` kennt die Records (schwach referenziert) in der
+Reihenfolge ihrer letzten Aktivität und setzt Sessions zurück, die länger
+als ``idle_ttl`` inaktiv sind oder über das Budget ``max_sessions`` hinaus
+am längsten ruhen.
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+MAX_ACTIVE_SESSIONS = 20_000
+IDLE_TTL = 2 * 3600.0
+
+
+class SessionRecord:
+    """Zustand einer Session; ``script is None`` heißt: kein Auswahlprozess aktiv."""
+
+    __slots__ = (
+        "sig", "genres", "catalog_version", "script", "steps_done", "llm_steps",
+        "jumped", "completed", "started", "speculative", "last_seen", "__weakref__",
+    )
+
+    def __init__(self):
+        self.reset()
+        self.speculative = None  # Schlüssel des Vorausjobs (cinemate.speculate)
+        self.last_seen = time.monotonic()
+
+    def reset(self, sig=None, catalog_version=None, script=None, genres=None):
+        self.sig = sig
+        self.genres = genres  # Genres in gewählter Reihenfolge (die Signatur sortiert sie)
+        self.catalog_version = catalog_version
+        self.script = script  # geteiltes Script (oder PendingScript, solange das Ranking läuft)
+        self.steps_done = 0  # bereits fertig getippte Schritte
+        self.llm_steps = 0  # Bitmaske: Schritt i kam vom Sprachmodell
+        self.jumped = False  # schon zum Auswahlprozess gescrollt
+        self.completed = False  # Ereignis "completed" geschrieben (genau einmal je Generierung)
+        self.started = time.time() if script is not None else None  # Klick auf "Generieren"
+
+
+class SessionRegistry:
+    """Zuletzt aktive Records; räumt die Inhalte inaktiver Sessions ab."""
+
+    def __init__(self, max_sessions=MAX_ACTIVE_SESSIONS, idle_ttl=IDLE_TTL):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._records = OrderedDict()  # id(record) -> weakref
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def touch(self, record: SessionRecord):
+        """Markiert ``record`` als aktiv und räumt dabei abgelaufene Sessions ab."""
+        now = time.monotonic()
+        record.last_seen = now
+        with self._lock:
+            key = id(record)
+            self._records[key] = weakref.ref(record)
+            self._records.move_to_end(key)
+            self._evict(now)
+
+    def _evict(self, now):
+        while self._records:
+            key, ref = next(iter(self._records.items()))
+            oldest = ref()
+            if oldest is not None:
+                if len(self._records) <= self.max_sessions and oldest.last_seen >= now - self.idle_ttl:
+                    break
+                oldest.reset()
+                self.evictions += 1
+            del self._records[key]
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {"active": len(self._records), "evictions": self.evictions}
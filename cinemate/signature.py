@@ -0,0 +1,52 @@
+"""Kanonische, hashbare Signatur der Eingaben."""
+
+import hashlib
+from dataclasses import dataclass
+
+RUNTIME_STEP = 5  # Slider-Schrittweite Laufzeit (Minuten)
+RATING_SCALE = 10  # Ratings als ganze Zehntel (Slider-Schrittweite 0.1)
+
+
+@dataclass(frozen=True, slots=True)
+class Signature:
+    """Eingaben in kanonischer Form: Genres sortiert, Bereiche als ganze Zahlen.
+
+    Gleiche Auswahl in anderer Reihenfolge ergibt dieselbe Signatur; als
+    Dict-/Cache-Schlüssel direkt verwendbar.
+    """
+
+    genres: tuple
+    era: str
+    style: str
+    runtime: tuple  # (min, max) in Minuten, auf RUNTIME_STEP gerundet
+    rating: tuple  # (min, max) in Zehnteln
+
+    @classmethod
+    def from_inputs(cls, genres, era, style, runtime, rating) -> "Signature":
+        def snap(value):
+            return int(round(float(value) / RUNTIME_STEP)) * RUNTIME_STEP
+
+        return cls(
+            genres=tuple(sorted(genres)),
+            era=era,
+            style=style,
+            runtime=(snap(runtime[0]), snap(runtime[1])),
+            rating=(int(round(float(rating[0]) * RATING_SCALE)), int(round(float(rating[1]) * RATING_SCALE))),
+        )
+
+    @property
+    def rating_range(self):
+        return self.rating[0] / RATING_SCALE, self.rating[1] / RATING_SCALE
+
+    def query(self):
+        """Argumente für ``Catalog.query``/``ranking.best_matches``."""
+        return self.genres, self.era, self.style, self.runtime, self.rating_range
+
+    @property
+    def digest(self) -> str:
+        """Prozessübergreifend stabiler Schlüssel (``hash()`` ist pro Prozess randomisiert)."""
+        raw = "|".join((
+            ",".join(self.genres), self.era, self.style,
+            f"{self.runtime[0]}-{self.runtime[1]}", f"{self.rating[0]}-{self.rating[1]}",
+        ))
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
@@ -0,0 +1,104 @@
+"""Empfehlungen vorausrechnen, während die Auswahl noch eingestellt wird.
+
+Jede Widget-Änderung löst ohnehin einen Rerun mit neuer Signatur aus. Sobald
+genau drei Genres gewählt sind, startet ``Speculator.speculate`` das Ranking
+für diese Signatur im Hintergrund; die nächste Signatur derselben Session
+gibt den vorigen Job frei und bricht ihn ab, falls er noch wartet und keine
+andere Session ihn braucht. Beim Klick übernimmt ``rows`` den laufenden oder
+fertigen Job – meist liegt das Ergebnis dann schon im Cache.
+
+Gerechnet wird im Prozess-Pool (``cinemate.pool``), sonst in wenigen
+Hintergrund-Threads dieses Prozesses.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cinemate.ranking import best_matches
+from cinemate.recommend import submit_rows
+
+SPECULATION_THREADS = 2
+
+
+class ThreadRanking:
+    """Wie ``pool.RankingPool``, aber mit Threads im eigenen Prozess."""
+
+    def __init__(self, threads=SPECULATION_THREADS):
+        self._executor = ThreadPoolExecutor(threads, thread_name_prefix="cinemate-ranking")
+
+    def submit(self, catalog, query, k):
+        return self._executor.submit(lambda: [int(row) for row in best_matches(catalog, *query, k=k)])
+
+
+class Speculator:
+    """Geteilte Ranking-Jobs je (Katalog-Version, Signatur) mit Abbruch ungenutzter Vorausjobs."""
+
+    def __init__(self, cache, ranker=None):
+        self.cache = cache
+        self.ranker = ranker if ranker is not None else ThreadRanking()
+        self._jobs = {}  # key -> Future (nur laufende)
+        self._owners = {}  # key -> Zahl der Sessions, die den Vorausjob noch wollen
+        self._lock = threading.RLock()  # Done-Callbacks können im selben Thread laufen (cancel)
+        self.started = 0
+        self.cancelled = 0
+
+    @staticmethod
+    def key(catalog, sig):
+        return catalog.version, sig.digest
+
+    def rows(self, sig, k, catalog):
+        """Zeilen-IDs als Future; ein laufender Job derselben Signatur wird geteilt.
+
+        Jeder Aufrufer zählt als Interessent; abgebrochen wird erst, wenn alle
+        per ``release`` verzichtet haben (ein Klick verzichtet nie).
+        """
+        key = self.key(catalog, sig)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.cancelled():
+                job = submit_rows(sig, k, catalog, self.cache, self.ranker)
+                if job.done():
+                    return job
+                self._jobs[key] = job
+                self.started += 1
+                job.add_done_callback(lambda f: self._finished(key, f))
+            self._owners[key] = self._owners.get(key, 0) + 1
+        return job
+
+    def speculate(self, sig, k, catalog, previous=None):
+        """Vorausjob für ``sig`` starten; ``previous`` ist der Schlüssel des letzten dieser Session.
+
+        Liefert den neuen Schlüssel (für den nächsten Aufruf bzw. ``release``).
+        """
+        key = self.key(catalog, sig)
+        if previous == key:
+            return key
+        if previous is not None:
+            self.release(previous)
+        self.rows(sig, k, catalog)
+        return key
+
+    def release(self, key):
+        """Vorausjob wird von dieser Session nicht mehr gebraucht; ggf. abbrechen."""
+        with self._lock:
+            owners = self._owners.get(key, 0) - 1
+            if owners > 0:
+                self._owners[key] = owners
+                return
+            self._owners.pop(key, None)
+            job = self._jobs.get(key)
+            # Nur Jobs, die noch in der Warteschlange stehen, lassen sich abbrechen
+            if job is not None and job.cancel():
+                self._jobs.pop(key, None)
+                self.cancelled += 1
+
+    def _finished(self, key, future):
+        with self._lock:
+            if self._jobs.get(key) is future:
+                del self._jobs[key]
+            self._owners.pop(key, None)
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {"running": len(self._jobs), "started": self.started, "cancelled": self.cancelled}
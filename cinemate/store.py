@@ -0,0 +1,193 @@
+"""Binäres Spaltenformat für den Katalog (ein Verzeichnis mit ``.npy``-Dateien).
+
+Beim Öffnen werden alle Arrays nur memory-mapped (``mmap_mode="r"``): mehrere
+Sessions und Prozesse teilen sich dieselben Seiten im Page-Cache, und der
+Start kostet kein Parsen und keine Kopien.
+
+``manifest.json`` hält Formatversion, Zeilenzahl und die Code-Tabellen
+(Genre-Bits, Stil-Codes); es wird zuletzt geschrieben und markiert damit ein
+vollständiges Bundle.
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from cinemate.catalog import GENRES, STYLES, Catalog, file_version
+from cinemate.combos import ARRAY_NAMES as COMBO_ARRAYS, ComboTable
+from cinemate.textindex import ARRAY_NAMES as TEXT_ARRAYS, TextIndex
+
+STRING_COLUMNS = ("ids", "names", "descs")
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+
+
+class BundleError(ValueError):
+    """Bundle unvollständig oder in einem Format, das dieser Code nicht lesen kann."""
+
+
+class StringColumn:
+    """Nur lesbare String-Spalte: UTF-8-Heap plus Offsets, dekodiert bei Zugriff."""
+
+    def __init__(self, offsets: np.ndarray, heap: np.ndarray):
+        self.offsets = offsets
+        self.heap = heap
+
+    @staticmethod
+    def encode(values):
+        """Liefert (offsets, heap) für eine Liste von Strings."""
+        blobs = [v.encode("utf-8") for v in values]
+        offsets = np.zeros(len(blobs) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in blobs], out=offsets[1:])
+        heap = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+        return offsets, heap
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        a, b = self.offsets[i], self.offsets[i + 1]
+        return self.heap[a:b].tobytes().decode("utf-8")
+
+
+def save_catalog(catalog: Catalog, directory):
+    """Schreibt Spalten, String-Heaps und Indizes eines Katalogs nach ``directory``."""
+    os.makedirs(directory, exist_ok=True)
+    for col in Catalog.NUMERIC_COLUMNS:
+        np.save(os.path.join(directory, f"{col}.npy"), getattr(catalog, col))
+    for col in STRING_COLUMNS:
+        offsets, heap = StringColumn.encode(getattr(catalog, col)[i] for i in range(len(catalog)))
+        np.save(os.path.join(directory, f"{col}.offsets.npy"), offsets)
+        np.save(os.path.join(directory, f"{col}.heap.npy"), heap)
+    save_indexes(catalog, directory)
+    write_manifest(directory, len(catalog))
+
+
+def save_indexes(catalog: Catalog, directory):
+    for name, arr in catalog.index_arrays.items():
+        np.save(os.path.join(directory, f"index.{name}.npy"), arr)
+
+
+def write_manifest(directory, rows, **extra):
+    """Schreibt ``manifest.json`` atomar (als letzte Datei eines Bundles)."""
+    manifest = {
+        "format": FORMAT_VERSION,
+        "rows": int(rows),
+        "genres": list(GENRES),
+        "styles": list(STYLES),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        **extra,
+    }
+    tmp = os.path.join(directory, f".{MANIFEST}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, os.path.join(directory, MANIFEST))
+
+
+def read_manifest(directory):
+    """Manifest eines Bundles; ``None`` bei Bundles aus der Zeit vor dem Manifest."""
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    if manifest.get("format") != FORMAT_VERSION:
+        raise BundleError(f"{directory}: Bundle-Format {manifest.get('format')}, erwartet {FORMAT_VERSION}")
+    # Genre-Bits und Stil-Codes sind im Bundle eingebrannt
+    if tuple(manifest["genres"]) != GENRES or tuple(manifest["styles"]) != STYLES:
+        raise BundleError(f"{directory}: Genre-/Stil-Codes passen nicht zu dieser Version der App")
+    return manifest
+
+
+def _replace_array(path, arr):
+    """Schreibt ``arr`` unter neuem Namen und benennt um: wer die alte Datei gemappt
+    hat, liest weiter die alte Inode statt halb überschriebener Seiten."""
+    if isinstance(arr, np.memmap) and arr.filename and arr.filename.endswith(".tmp"):
+        arr.flush()  # schon als .npy geschrieben (TextIndex.build mit vectors_path)
+        os.replace(arr.filename, path)
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, arr)
+    os.replace(tmp, path)
+
+
+def save_text_index(index, directory):
+    """Schreibt einen ``TextIndex`` neben den Katalog (``text.*.npy``)."""
+    for name, arr in index.arrays.items():
+        _replace_array(os.path.join(directory, f"text.{name}.npy"), arr)
+
+
+def save_combo_table(table, directory):
+    """Schreibt eine ``ComboTable`` neben den Katalog (``combo.*.npy``)."""
+    for name, arr in table.arrays.items():
+        _replace_array(os.path.join(directory, f"combo.{name}.npy"), arr)
+
+
+def build_text_index(directory):
+    """Textindex für einen gespeicherten Katalog; die Vektoren gehen direkt auf die Platte."""
+    vectors_path = os.path.join(directory, ".text.vectors.npy.tmp")
+    save_text_index(TextIndex.build(open_catalog(directory).descs, vectors_path=vectors_path), directory)
+
+
+def build_search_tables(directory):
+    """Textindex und Kombinationstabelle für einen gespeicherten Katalog."""
+    build_text_index(directory)
+    save_combo_table(ComboTable.build(open_catalog(directory)), directory)
+
+
+def build_bundle(catalog: Catalog, directory):
+    """Katalog plus Textindex und Kombinationstabelle – alles, was ``open_catalog`` liest."""
+    save_catalog(catalog, directory)
+    build_search_tables(directory)
+
+
+def touch_pages(catalog, stride=4096):
+    """Indizes und Kombinationstabelle einmal anfassen, damit ihre Seiten im Page-Cache liegen."""
+    arrays = list(catalog.index_arrays.values())
+    if catalog.combo_table is not None:
+        arrays.extend(catalog.combo_table.arrays.values())
+    for arr in arrays:
+        arr[::stride].sum()
+
+
+def open_catalog(directory) -> Catalog:
+    """Öffnet einen mit ``save_catalog`` geschriebenen Katalog ohne Kopien (read-only)."""
+    def load(name):
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+    manifest = read_manifest(directory)
+
+    strings = {
+        col: StringColumn(load(f"{col}.offsets"), load(f"{col}.heap")) for col in STRING_COLUMNS
+    }
+    indexes = {
+        fn[len("index."):-len(".npy")]: load(fn[:-len(".npy")])
+        for fn in os.listdir(directory)
+        if fn.startswith("index.") and fn.endswith(".npy")
+    }
+    numeric = {col: load(col) for col in Catalog.NUMERIC_COLUMNS}
+    catalog = Catalog(**strings, **numeric, indexes=indexes)
+    catalog.path = directory
+    if manifest is not None:
+        catalog.version = manifest["created"]  # versionierte Verzeichnisse: Name der Version (cinemate.reload)
+    else:
+        catalog.version = file_version(
+            os.path.join(directory, fn) for fn in sorted(os.listdir(directory)) if fn.endswith(".npy")
+        )
+    if os.path.exists(os.path.join(directory, "text.vectors.npy")):
+        catalog.text_index = TextIndex(**{name: load(f"text.{name}") for name in TEXT_ARRAYS})
+    if os.path.exists(os.path.join(directory, "combo.rows.npy")):
+        catalog.combo_table = ComboTable(**{name: load(f"combo.{name}") for name in COMBO_ARRAYS})
+    return catalog
+
+
+if __name__ == "__main__":
+    # python -m cinemate.store title.basics.tsv [title.ratings.tsv] data/catalog
+    from cinemate.compiler import compile_bundle
+
+    *sources, target = sys.argv[1:]
+    compile_bundle(sources, target)
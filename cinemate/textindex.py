@@ -0,0 +1,216 @@
+"""Textähnlichkeit über die Filmbeschreibungen (nur CPU, nur NumPy).
+
+Beschreibungen werden per Hashing-TF-IDF vektorisiert: Tokens landen in
+``BUCKETS`` Hash-Fächern (für die IDF), die anschließend per dünner
+Zufallsprojektion (je Fach ``SPREAD`` Dimensionen mit Vorzeichen) auf ``DIM``
+Dimensionen abgebildet werden – Kollisionen verteilen sich so als kleines
+Rauschen statt als volle Treffer. Die L2-normierten Vektoren liegen als
+``float16``-Matrix vor (128 Dimensionen = 256 Byte pro Titel).
+
+Für die Suche im ganzen Katalog gibt es einen IVF-Index (approximativ): die
+Vektoren sind nach k-Means-Zentren gruppiert, gesucht wird nur in den
+``nprobe`` ähnlichsten Gruppen. Gebaut wird offline und zusammen mit dem
+Katalog gespeichert:
+
+    python -m cinemate.textindex data/catalog
+"""
+
+import re
+import sys
+import zlib
+
+import numpy as np
+
+DIM = 128
+BUCKETS = 1 << 20
+SPREAD = 8
+# Multiplikative Hashes (ungerade 32-bit-Konstanten) für Dimension/Vorzeichen je Fach
+PROJECTION_SEEDS = np.array(
+    [0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F, 0x165667B1, 0xD3A2646C | 1, 0xFD7046C5, 0xB55A4F09],
+    dtype=np.uint64,
+)[:SPREAD]
+NPROBE = 16
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE = 50_000
+CHUNK = 25_000
+
+TOKEN_RE = re.compile(r"\w\w+")
+
+# Suchbegriffe je Genre/Stil für die Anfrage (deutsche und englische Beschreibungen)
+GENRE_TERMS = {
+    "Komödie": "komödie komisch lustig humor witzig comedy funny humorous hilarious",
+    "Drama": "drama schicksal familie beziehung emotional dramatic family relationship",
+    "Action": "action kampf verfolgung explosion fight chase explosive mission",
+    "Science-Fiction": "science fiction zukunft weltraum zeitreise roboter future space alien robot sci",
+    "Horror": "horror grauen angst monster dämon unheimlich terrifying haunted demon scary",
+    "Thriller": "thriller spannung ermittler verschwörung mord suspense detective conspiracy murder",
+}
+STYLE_TERMS = {
+    "Realfilm": "",
+    "Animation": "animation animiert zeichentrick animated cartoon",
+    "Schwarz-Weiß": "schwarzweiß klassiker noir black white classic",
+}
+
+ARRAY_NAMES = ("vectors", "idf", "centroids", "order", "offsets")
+
+
+def query_text(genres, style=None) -> str:
+    """Anfragetext aus Genres (und Stil) für ``TextIndex.scores``."""
+    terms = [GENRE_TERMS.get(g, g.lower()) for g in genres]
+    if style:
+        terms.append(STYLE_TERMS.get(style, ""))
+    return " ".join(terms)
+
+
+def _tokens_to_buckets(texts):
+    """(Dokument-Nr., Hash-Fach) je Token; Hashes stabil über Prozesse (crc32)."""
+    cache = {}
+    doc_ids, buckets = [], []
+    for doc, text in enumerate(texts):
+        for token in TOKEN_RE.findall(text.lower()):
+            bucket = cache.get(token)
+            if bucket is None:
+                bucket = cache[token] = zlib.crc32(token.encode("utf-8")) & (BUCKETS - 1)
+            doc_ids.append(doc)
+            buckets.append(bucket)
+    return np.asarray(doc_ids, dtype=np.int64), np.asarray(buckets, dtype=np.int64)
+
+
+def _term_counts(texts):
+    """Eindeutige (Dokument, Fach)-Paare mit Häufigkeit."""
+    doc_ids, buckets = _tokens_to_buckets(texts)
+    keys, counts = np.unique(doc_ids * BUCKETS + buckets, return_counts=True)
+    return keys // BUCKETS, keys % BUCKETS, counts
+
+
+def _fold(n_docs, docs, buckets, weights):
+    """Gewichtete Fächer per dünner Zufallsprojektion auf DIM Dimensionen, L2-normieren."""
+    h = (buckets.astype(np.uint64)[None, :] * PROJECTION_SEEDS[:, None]) & np.uint64(0xFFFFFFFF)
+    dims = (h >> np.uint64(16)) % np.uint64(DIM)
+    signs = np.where(h & np.uint64(1 << 15), -1.0, 1.0)
+    index = (docs[None, :] * DIM + dims.astype(np.int64)).ravel()
+    flat = np.bincount(index, weights=(signs * weights[None, :]).ravel(), minlength=n_docs * DIM)
+    vectors = flat.reshape(n_docs, DIM).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _kmeans(vectors, n_clusters, rng):
+    """Sphärisches k-Means auf einer Stichprobe; liefert normierte Zentren."""
+    sample = vectors[rng.choice(len(vectors), min(len(vectors), KMEANS_SAMPLE), replace=False)]
+    sample = sample.astype(np.float32)
+    centroids = sample[rng.choice(len(sample), n_clusters, replace=False)]
+    for _ in range(KMEANS_ITERATIONS):
+        assign = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, sample)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        empty = norms[:, 0] == 0
+        centroids = np.where(empty[:, None], centroids, sums / np.maximum(norms, 1e-12))
+    return centroids
+
+
+class TextIndex:
+    """Nur lesbarer Ähnlichkeitsindex; alle Arrays dürfen memory-mapped sein."""
+
+    def __init__(self, vectors, idf, centroids, order, offsets):
+        self.vectors = vectors  # (n, DIM) float16
+        self.idf = idf  # (BUCKETS,) float32
+        self.centroids = centroids  # (nlist, DIM) float32
+        self.order = order  # Zeilen nach Gruppe sortiert
+        self.offsets = offsets  # Gruppe g = order[offsets[g]:offsets[g + 1]]
+
+    @classmethod
+    def build(cls, texts, seed=0, vectors_path=None) -> "TextIndex":
+        """Baut den Index über eine Sequenz von Texten (``len`` und Indexzugriff).
+
+        Zwei Durchläufe in Blöcken von ``CHUNK`` Texten (erst Dokumentfrequenzen,
+        dann Vektoren), damit nie mehr als ein Block tokenisiert im Speicher liegt.
+        Mit ``vectors_path`` wird die Vektormatrix direkt in diese ``.npy``-Datei
+        geschrieben (memory-mapped) statt im Speicher aufgebaut.
+        """
+        n = len(texts)
+
+        def chunks():
+            for start in range(0, n, CHUNK):
+                stop = min(start + CHUNK, n)
+                yield start, stop, _term_counts([texts[i] for i in range(start, stop)])
+
+        df = np.zeros(BUCKETS, dtype=np.int64)
+        for _, _, (docs, buckets, counts) in chunks():
+            df += np.bincount(buckets, minlength=BUCKETS)
+        idf = (np.log((1 + n) / (1 + df)) + 1).astype(np.float32)
+
+        if vectors_path is None:
+            vectors = np.empty((n, DIM), dtype=np.float16)
+        else:
+            vectors = np.lib.format.open_memmap(vectors_path, mode="w+", dtype=np.float16, shape=(n, DIM))
+        for start, stop, (docs, buckets, counts) in chunks():
+            weights = (1 + np.log(counts)) * idf[buckets]
+            vectors[start:stop] = _fold(stop - start, docs, buckets, weights)
+        if n == 0:
+            return cls(vectors, idf, np.zeros((1, DIM), np.float32), np.empty(0, np.int32), np.zeros(2, np.int64))
+
+        n_clusters = int(np.clip(np.sqrt(n), 1, 4096))
+        centroids = _kmeans(vectors, n_clusters, np.random.default_rng(seed))
+        assign = np.concatenate([
+            np.argmax(vectors[s:s + CHUNK].astype(np.float32) @ centroids.T, axis=1)
+            for s in range(0, n, CHUNK)
+        ])
+        order = np.argsort(assign, kind="stable").astype(np.int32)
+        offsets = np.searchsorted(assign[order], np.arange(n_clusters + 1)).astype(np.int64)
+        return cls(vectors, idf, centroids.astype(np.float32), order, offsets)
+
+    @property
+    def arrays(self) -> dict:
+        return {name: getattr(self, name) for name in ARRAY_NAMES}
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        docs, buckets, counts = _term_counts([text])
+        weights = (1 + np.log(counts)) * self.idf[buckets]
+        return _fold(1, docs, buckets, weights)[0]
+
+    def search(self, text: str, k=100, nprobe=NPROBE):
+        """Approximative Top-k über den ganzen Katalog: (Zeilen-IDs, Kosinus-Ähnlichkeit)."""
+        q = self.vectorize(text)
+        groups = np.argsort(-(self.centroids @ q))[:nprobe]
+        rows = np.concatenate([self.order[self.offsets[g]:self.offsets[g + 1]] for g in groups])
+        sims = self.vectors[rows].astype(np.float32) @ q
+        k = min(k, len(rows))
+        best = np.argpartition(-sims, k - 1)[:k] if k else np.empty(0, dtype=np.int64)
+        best = best[np.argsort(-sims[best], kind="stable")]
+        return rows[best].astype(np.int64), sims[best]
+
+    def scores(self, text: str, rows=None, exact_limit=50_000, k=2_000) -> np.ndarray:
+        """Ähnlichkeit je Zeile aus ``rows`` (Standard: alle Titel).
+
+        Bis ``exact_limit`` Zeilen wird exakt gerechnet; darüber zählen nur die
+        ``k`` approximativ besten Treffer, alle anderen bekommen 0.
+        """
+        n = len(self) if rows is None else len(rows)
+        if n <= exact_limit:
+            vectors = self.vectors if rows is None else self.vectors[rows]
+            return vectors.astype(np.float32) @ self.vectorize(text)
+        hits, sims = self.search(text, k)
+        if rows is None:
+            out = np.zeros(len(self), dtype=np.float32)
+            out[hits] = sims
+            return out
+        rows = np.asarray(rows)
+        out = np.zeros(len(rows), dtype=np.float32)
+        sorter = np.argsort(rows, kind="stable")
+        pos = np.searchsorted(rows, hits, sorter=sorter)
+        pos = np.minimum(pos, len(rows) - 1)
+        found = rows[sorter[pos]] == hits
+        out[sorter[pos[found]]] = sims[found]
+        return out
+
+
+if __name__ == "__main__":
+    # python -m cinemate.textindex data/catalog  (Index für einen gespeicherten Katalog neu bauen)
+    from cinemate.store import build_text_index
+
+    build_text_index(sys.argv[1])
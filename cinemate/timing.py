@@ -0,0 +1,18 @@
+"""Typing-/Timing-Parameter der Reasoning-Wiedergabe."""
+
+import os
+
+TIME_SCALE = float(os.environ.get("CINEMATE_TIME_SCALE", "1"))  # < 1 beschleunigt (Benchmarks)
+if not TIME_SCALE > 0:
+    raise ValueError(f"CINEMATE_TIME_SCALE muss größer als 0 sein, nicht {TIME_SCALE!r} (z. B. 0.01 für Benchmarks)")
+
+INTER_MESSAGE_PAUSE = 5.0 * TIME_SCALE  # Pause zwischen Nachrichten
+CHAR_DELAY = 0.03 * TIME_SCALE  # Schreibgeschwindigkeit (pro Zeichen)
+DOTS_DELAY = 0.2 * TIME_SCALE  # Geschwindigkeit der Punkte
+PRE_TYPING = 0.8 * TIME_SCALE  # gewünschte Typing-Dauer
+MIN_TYPING_TIME = 1.2 * TIME_SCALE  # Mindestdauer für "CineMate schreibt..."
+FLUSH_DELAY = 0.05 * TIME_SCALE
+RENDER_BREAK = 0.15 * TIME_SCALE  # kleiner Render-Break, damit "schreibt..." nicht verschluckt wird
+TYPING_FPS = 12 / TIME_SCALE  # max. Aktualisierungen pro Sekunde (Frames je Nachricht unabhängig von TIME_SCALE)
+MAX_TYPING_FRAMES = 48  # Obergrenze an Deltas pro Nachricht
+STREAM_FPS = 12  # Token-Stream vom Sprachmodell: max. Aktualisierungen pro Sekunde (Echtzeit)
@@ -0,0 +1,226 @@
+"""Deklarative Studienvarianten: Texte, Schritt-Vorlagen, Ton und Abschlusscode.
+
+Die Vorlagen sind ``str.format``-Strings. Verfügbare Felder:
+
+- Eingaben/Schritte: ``trait1``–``trait3``, ``era``, ``style``, ``runtime_min``,
+  ``runtime_max``, ``rating_min``, ``rating_max``, ``cfg``, ``top``, ``mid``, ``last``
+- Karten: ``idx``, ``name``, ``year``, ``desc``, ``genres``, ``era``, ``style``,
+  ``runtime``, ``imdb``, ``votes`` (bereits mit Tausenderpunkten formatiert)
+- Abschluss: ``code``
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from string import Formatter
+
+CFG_TEMPLATE = (
+    "Ära: {era} | Stil: {style} | "
+    "Laufzeit: {runtime_min}–{runtime_max} min | "
+    "IMDb: {rating_min:.1f}–{rating_max:.1f}"
+)
+
+REC_FIELDS = frozenset({"top", "mid", "last"})  # Felder, die erst nach dem Ranking feststehen
+
+RATING_CAPTION = (
+    "IMDb ist eine große Online-Filmdatenbank. "
+    "Dort vergeben Nutzer*innen Bewertungen (1–10). "
+    "Das angezeigte Rating ist ein Durchschnitt aus vielen Einzelbewertungen "
+    "und dient als grober Hinweis darauf, wie positiv ein Film insgesamt bewertet wird."
+)
+
+
+@dataclass(frozen=True)
+class Variant:
+    name: str
+    completion_code: str
+    greeting: str
+    films: tuple  # fiktive Titel (name + desc) für den Betrieb ohne Katalog
+    steps: tuple
+    inputs_template: str
+    card_lines: tuple
+    closing: str  # ohne Katalog (fiktive Titel)
+    closing_style: str = "assistant"  # "assistant" (Chat-Bubble) oder "success"
+    footnote: str = ""
+    closing_catalog: str = ""  # mit echtem Katalog (leer: wie ``closing``)
+    footnote_catalog: str = ""
+    intro: str = ""  # Text vor dem Auswahlprozess
+    inputs_title: str = "🎛️ Eingaben"
+    genres_label: str = "1) Genres (genau 3)"
+    genres_hint: str = "Wähle drei Genres, damit ich anfangen kann."
+    era_label: str = "2) Ära / Erscheinungszeitraum"
+    style_label: str = "3) Visueller Stil"
+    runtime_label: str = "4) Laufzeit (Minuten) – Bereich"
+    rating_heading: str = "**5) IMDb-Rating – Bereich**"
+    rating_caption: str = RATING_CAPTION
+    inputs_layout: str = "container"  # "container" (Rahmen, Überschrift oben) oder "plain" (Genres, Trenner, Überschrift)
+    radio_horizontal: bool = True
+    button_label: str = "Empfehlung generieren"
+    button_type: str = "primary"
+    validation: str = "disable"  # "disable" (Button gesperrt) oder "error" (Meldung nach dem Klick)
+    playback: str = "server"  # "server" oder "client" (siehe cinemate.playback)
+    cfg_template: str = CFG_TEMPLATE
+    llm_style: str = "sachlich und neutral, ohne Emojis"  # Tonvorgabe für cinemate.llm
+
+    # Einmal pro Variante vorbereitet (cached_property umgeht das frozen-__setattr__)
+    @cached_property
+    def card_template(self) -> str:
+        """Alle Kartenzeilen als ein Markdown-Block – ein Delta pro Karte."""
+        return "\n\n".join(self.card_lines)
+
+    @cached_property
+    def steps_before_recs(self) -> int:
+        """Zahl der ersten Schritte, die noch keinen Filmtitel nennen (während des Rankings zeigbar)."""
+        for i, template in enumerate(self.steps):
+            if REC_FIELDS.intersection(field for _, field, _, _ in Formatter().parse(template) if field):
+                return i
+        return len(self.steps)
+
+    def closing_text(self, fictional=True) -> str:
+        template = self.closing if fictional else self.closing_catalog or self.closing
+        return template.format(code=self.completion_code)
+
+    def footnote_text(self, fictional=True) -> str:
+        return self.footnote if fictional else self.footnote_catalog
+
+
+# ----------------------------------------------------------
+# Variante "02": sachlicher Ton (streamlit_app.py)
+# ----------------------------------------------------------
+NEUTRAL = Variant(
+    name="streamlit_app",
+    completion_code="02",
+    greeting="""
+**Hallo!** 👋  
+Ich bin **CineMate** – dein digitaler Film-Assistent.
+
+Wähle bitte **genau drei Genres** und setze deine Filter.  
+Anschließend erstelle ich eine Empfehlung.
+""",
+    films=(
+        {"name": "Chronos V", "desc": "Beschreibung: Experimentelles Zeitsystem; Auswirkungen auf Vergangenheit und Gegenwart."},
+        {"name": "Das letzte Echo", "desc": "Beschreibung: Rätselhafte Tonaufnahmen; Reaktivierung lokaler Konflikte."},
+        {"name": "Schatten im Nebel", "desc": "Beschreibung: Ermittlungsfall mit zunehmender Komplexität; Netzwerk aus Täuschung."},
+    ),
+    inputs_template=(
+        "**Eingaben:**\n\n"
+        "- **Genres:** {trait1}, {trait2}, {trait3}\n"
+        "- **Ära / Erscheinungszeitraum:** {era}\n"
+        "- **Visueller Stil:** {style}\n"
+        "- **Laufzeit:** {runtime_min}–{runtime_max} min\n"
+        "- **IMDb-Rating:** {rating_min:.1f}–{rating_max:.1f}"
+    ),
+    steps=(
+        "Die Eingaben werden analysiert, um eine Liste relevanter Filme zu erstellen. "
+        "Gewählte Genres sind: {trait1}, {trait2} und {trait3}.",
+        "Die Konfiguration ({cfg}) dient als Filterbasis. "
+        "Die Datenbank wird nach Titeln durchsucht, die diesen Kriterien entsprechen.",
+        "Es wurden Filme identifiziert, die den Genres „{trait1}“ und „{trait2}“ entsprechen. "
+        "Eine eindeutige Übereinstimmung mit „{trait3}“ ist auf Basis der vorhandenen Metadaten nicht durchgängig gegeben.",
+        "Für die weitere Einordnung werden zusätzliche Textsignale (z. B. Kurzbeschreibungen und Tags) ausgewertet, "
+        "um qualitative Merkmale zu prüfen.",
+        "Der Titel „{last}“ wird in Textanalysen häufig mit dem Merkmal „{trait3}“ assoziiert "
+        "und liegt innerhalb der gesetzten Parameter.",
+        "Hinweis zur Datenqualität: Genre-Zuordnungen und Textsignale können uneinheitlich sein. "
+        "Daher wird eine Mehrkandidatenprüfung durchgeführt.",
+        "Eine weitere Analyse ergibt zwei alternative Titel: „{top}“ und „{mid}“. "
+        "Beide weisen in der Gesamtschau eine vergleichbare Passung zu den Kriterien auf.",
+        "Kontrollhinweis: Die IMDb-Datenbank umfasst aktuell über 6 Millionen Titel.",
+        "Hier sind die drei besten Treffer aus der Datenbank.",
+    ),
+    card_lines=(
+        "### {idx}) {name} ({year})",
+        "{desc}",
+        "Genres: {genres}",
+        "Ära: {era}",
+        "Visueller Stil: {style}",
+        "Laufzeit: {runtime} min",
+        "IMDb: {imdb:.1f}/10",
+        "Anzahl Bewertungen: {votes}",
+    ),
+    closing=(
+        "Hinweis: Die angezeigten Filmtitel und Inhalte sind fiktiv. "
+        "Bitte gib jetzt die **{code}** in das Textfeld unter dem Chatbot ein. "
+        "Danach kann mit dem Fragebogen fortgefahren werden."
+    ),
+    closing_catalog=(
+        "Hinweis: Die angezeigten Filmtitel und Angaben stammen aus der IMDb-Datenbank. "
+        "Bitte gib jetzt die **{code}** in das Textfeld unter dem Chatbot ein. "
+        "Danach kann mit dem Fragebogen fortgefahren werden."
+    ),
+)
+
+
+# ----------------------------------------------------------
+# Variante "03": lockerer Ton mit Emojis (cinemate3.py)
+# ----------------------------------------------------------
+EMOJI = Variant(
+    name="cinemate3",
+    completion_code="03",
+    greeting="""
+👋 Hallo!  
+🎥 Ich bin CineMate – dein digitaler Film-Finder. Ich helfe dir, einen Film zu finden, der zu deiner Stimmung passt. 🍿
+
+Bitte wähle **spontan** drei Genres aus, die dich gerade ansprechen.  
+""",
+    films=(
+        {"name": "Chronos V", "desc": "Ein Science-Fiction-Drama über ein experimentelles Zeitsystem, das unerwartete Folgen für Vergangenheit und Gegenwart hat."},
+        {"name": "Das letzte Echo", "desc": "Ein Mystery-Thriller über rätselhafte Tonaufnahmen, die in einer Kleinstadt alte Konflikte wieder sichtbar machen."},
+        {"name": "Schatten im Nebel", "desc": "Ein stilisierter Neo-Noir über einen Ermittler, der in einem scheinbar harmlosen Fall ein Netz aus Täuschung entdeckt."},
+    ),
+    intro="Detailauswahl abgeschlossen — danke! Ich erstelle jetzt Empfehlungen anhand deiner Eingaben.",
+    inputs_template=(
+        "**Deine Kriterien:**\n\n"
+        "- Genres: **{trait1}**, **{trait2}**, **{trait3}**\n"
+        "- Ära: **{era}**\n"
+        "- Visueller Stil: **{style}**\n"
+        "- Laufzeit: **{runtime_min}–{runtime_max} min**\n"
+        "- IMDb: **{rating_min:.1f}–{rating_max:.1f}**"
+    ),
+    steps=(
+        "🔎 Ich werte deine Präferenzen aus und erstelle ein Ranking. Du hast Lust auf: {trait1}, {trait2} und/oder {trait3}.",
+        "🎬 Deine Konfiguration ({cfg}) ist meine Grundlage. Ich durchforste meine Film-Datenbank nach passenden Streifen...",
+        "🤔 Hmm. Ich finde Filme, die ‘{trait1}’ und ‘{trait2}’ abdecken, aber ‘{trait3}’ fehlt oft dabei. Das ist gar nicht so einfach...",
+        "🔍 Vielleicht helfen zusätzliche Hinweise aus ähnlichen Suchmustern, manchmal sind solche Signale genauer als reine Tags.",
+        "✅ Und tatsächlich: ‘{last}’ taucht häufig im Zusammenhang mit ‘{trait3}’ auf. Das klingt vielversprechend!",
+        "⚠ Aber: Genre-Zuordnungen sind nicht immer eindeutig. Ich prüfe deshalb lieber mehrere Kandidaten.",
+        "📊 Ich habe weitergeschaut: Zwei Filme mit sehr ähnlichem Gesamtscore wären ‘{top}’ und ‘{mid}’. Sie liegen beim Rating sehr nah beieinander...",
+        "⚡ Kontrollhinweis: Wusstest du, dass die IMDb Datenbank mittlerweile über 6 Millionen Titel listet?",
+        "📈 Insgesamt empfehle ich dir ‘{top}’. Der Treffer passt in der Gesamtschau am besten zu deiner Auswahl.",
+        "😊 Viel Spaß beim Anschauen!",
+    ),
+    card_lines=(
+        "### {idx}) {name} ({year})",
+        "{desc}",
+        "Genres: {genres}",
+        "Stil: {style} • Laufzeit: {runtime} Min",
+        "IMDb: {imdb:.1f}/10",
+        "Anzahl Bewertungen: {votes}",
+    ),
+    closing=(
+        "Danke. Bitte gib jetzt die **{code}** in das Textfeld unter dem Chatbot ein. "
+        "Danach kann es mit dem Fragebogen weitergehen."
+    ),
+    closing_style="success",
+    footnote="Hinweis: Die angezeigten Filmtitel und Inhalte sind fiktiv.",
+    footnote_catalog="Hinweis: Die angezeigten Filmtitel und Angaben stammen aus der IMDb-Datenbank.",
+    inputs_title="📋 Deine Filmauswahl",
+    genres_label="Wähle drei Genres:",
+    genres_hint="",
+    era_label="Ära / Erscheinungszeitraum",
+    style_label="Visueller Stil",
+    runtime_label="Gewünschte Laufzeit (Minuten, Bereich)",
+    rating_heading="**IMDb-Rating (Bereich)**",
+    rating_caption=(
+        "IMDb ist eine große Online-Filmdatenbank. "
+        "Das Rating (1–10) ist ein Durchschnittswert aus vielen Nutzerbewertungen "
+        "und dient als grober Hinweis darauf, wie positiv ein Film insgesamt bewertet wird."
+    ),
+    inputs_layout="plain",
+    radio_horizontal=False,
+    button_label="Empfehlung generieren 🎯",
+    button_type="secondary",
+    validation="error",
+    llm_style="locker, per Du, mit passenden Emojis",
+)
+
+VARIANTS = {v.name: v for v in (NEUTRAL, EMOJI)}
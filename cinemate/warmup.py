@@ -0,0 +1,76 @@
+"""Worker vor dem ersten Besucher aufwärmen (Pre-Start-Hook für ``streamlit run``).
+
+    python -m cinemate.warmup streamlit_app.py --server.port 8502
+
+``prestart`` importiert im selben Prozess die App samt NumPy und Ranking,
+legt Katalog, Caches, Ereignisprotokoll, LLM-Client und ggf. den Ranking-Pool
+an (dieselben ``st.cache_resource``-Einträge, die die Script-Runs später
+nutzen) und liest die Index- und Kombinationsseiten des Katalogs einmal.
+Danach startet Streamlit mit den übrigen Argumenten; der Port öffnet also erst,
+wenn der Worker warm ist. ``cinemate.serve`` startet seine Worker so und weicht
+bis dahin auf laufende Worker aus.
+
+Was davon Importzeit ist, zeigt ``benchmarks/bench_startup.py``.
+"""
+
+import logging
+import sys
+import time
+
+# Streamlit warnt außerhalb eines Script-Runs bei jedem cache_resource-Aufruf
+_CTX_LOGGER = "streamlit.runtime.scriptrunner_utils.script_run_context"
+
+
+def prestart() -> dict:
+    """Importe und prozessweite Ressourcen der App vorziehen; Dauer je Schritt in Sekunden."""
+    timings = {}
+    t = time.perf_counter()
+
+    def lap(name):
+        nonlocal t
+        now = time.perf_counter()
+        timings[name] = round(now - t, 4)
+        t = now
+
+    from cinemate import app, llm
+    from cinemate.store import touch_pages
+    lap("import")
+
+    ctx_log = logging.getLogger(_CTX_LOGGER)
+    level = ctx_log.level
+    ctx_log.setLevel(logging.ERROR)
+    try:
+        catalog = app.get_catalog()
+        if catalog is not None:
+            touch_pages(catalog)
+        lap("catalog")
+
+        app.get_result_cache()
+        app.get_script_cache()
+        app.get_session_registry()
+        app.get_event_log()
+        app.get_speculator()  # startet und wärmt auch den Ranking-Pool
+        if llm.enabled():
+            app.get_llm_cache()
+            llm.connect()
+        lap("resources")
+    finally:
+        ctx_log.setLevel(level)
+    return timings
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        sys.exit(__doc__)
+    timings = prestart()
+    print(f"cinemate.warmup: {sum(timings.values()):.2f} s {timings}", file=sys.stderr)
+
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", *argv]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
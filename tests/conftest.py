@@ -0,0 +1,59 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cinemate.catalog import GENRE_BITS, STYLES, Catalog  # noqa: E402
+from cinemate.textindex import GENRE_TERMS, TextIndex  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def catalog():
+    """Zufälliger kleiner Katalog (fester Seed) mit Textindex."""
+    rng = np.random.default_rng(7)
+    n = 3000
+    bits = np.array(list(GENRE_BITS.values()), dtype=np.uint8)
+    genres = np.zeros(n, dtype=np.uint8)
+    for row in range(n):
+        genres[row] = np.bitwise_or.reduce(rng.choice(bits, rng.integers(1, 4), replace=False))
+    terms = [term.split() for term in GENRE_TERMS.values()]
+    descs = [
+        " ".join(rng.choice(words) for words in terms if rng.random() < 0.4) or "film"
+        for _ in range(n)
+    ]
+    cat = Catalog(
+        [f"tt{i:07d}" for i in range(n)],
+        [f"Film {i}" for i in range(n)],
+        descs,
+        rng.integers(1920, 2025, n),
+        rng.integers(60, 200, n),
+        rng.integers(10, 100, n) / 10,
+        rng.integers(5, 2_000_000, n),
+        genres,
+        rng.integers(0, len(STYLES), n),
+    )
+    cat.text_index = TextIndex.build(descs)
+    return cat
+
+
+BASICS_HEADER = (
+    "tconst", "titleType", "primaryTitle", "isAdult", "startYear", "runtimeMinutes",
+    "genres", "averageRating", "numVotes", "description",
+)
+
+
+@pytest.fixture
+def basics_tsv(tmp_path):
+    """Schreibt Zeilen im Format von ``title.basics.tsv`` (mit Ratings) und liefert den Pfad."""
+    def write(rows, name="title.basics.tsv"):
+        path = tmp_path / name
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\t".join(BASICS_HEADER) + "\n")
+            for row in rows:
+                f.write("\t".join(str(v) for v in row) + "\n")
+        return str(path)
+    return write
@@ -0,0 +1,40 @@
+import pytest
+
+from cinemate import app
+from cinemate.speculate import ThreadRanking
+
+
+class FakePool:
+    def __init__(self, workers):
+        self.warmed = []
+
+    def warm(self, directory):
+        self.warmed.append(directory)
+
+
+class FakeCatalog:
+    path = "data/catalog"
+
+
+@pytest.fixture
+def resources(monkeypatch):
+    monkeypatch.setattr(app, "RANKING_WORKERS", 2)
+    monkeypatch.setattr(app, "RankingPool", FakePool)
+    for getter in (app._create_ranking_pool, app._create_speculator):
+        getter.clear()
+    yield
+    for getter in (app._create_ranking_pool, app._create_speculator):
+        getter.clear()
+
+
+def test_pool_starts_once_a_catalog_exists(monkeypatch, resources):
+    monkeypatch.setattr(app, "get_catalog", lambda: None)
+    assert app.get_ranking_pool() is None
+    assert isinstance(app.get_speculator().ranker, ThreadRanking)
+
+    monkeypatch.setattr(app, "get_catalog", FakeCatalog)
+    pool = app.get_ranking_pool()
+    assert isinstance(pool, FakePool)
+    assert pool.warmed == [FakeCatalog.path]
+    assert app.get_ranking_pool() is pool
+    assert app.get_speculator().ranker is pool
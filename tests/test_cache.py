@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from cinemate import cache as cache_module
+from cinemate.cache import ComputeAborted, ResultCache, SqliteStore
+
+WAITERS = 8
+
+
+def run_concurrently(cache, key, compute, started):
+    """Ein Anführer rechnet (bis ``started`` gesetzt ist), ``WAITERS`` weitere warten."""
+    results = [None] * (WAITERS + 1)
+
+    def call(i):
+        try:
+            results[i] = ("value", cache.get_or_compute(key, compute, wait=10))
+        except BaseException as e:
+            results[i] = ("error", e)
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(WAITERS + 1)]
+    threads[0].start()
+    assert started.wait(10)
+    for t in threads[1:]:
+        t.start()
+    deadline = time.monotonic() + 10
+    while cache.coalesced < WAITERS and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return threads, results
+
+
+def test_single_flight():
+    cache = ResultCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(10)
+        return [1, 2, 3]
+
+    threads, results = run_concurrently(cache, "k", compute, started)
+    release.set()
+    for t in threads:
+        t.join(10)
+    assert len(calls) == 1
+    assert cache.coalesced == WAITERS
+    assert all(r == ("value", [1, 2, 3]) for r in results)
+    assert cache.get_or_compute("k", compute) == [1, 2, 3]
+    assert len(calls) == 1
+
+
+def test_exception_reaches_all_callers_and_is_not_cached():
+    cache = ResultCache()
+    started, release = threading.Event(), threading.Event()
+    error = ValueError("kaputt")
+
+    def fail():
+        started.set()
+        release.wait(10)
+        raise error
+
+    threads, results = run_concurrently(cache, "k", fail, started)
+    release.set()
+    for t in threads:
+        t.join(10)
+    assert all(r == ("error", error) for r in results)
+    assert cache.get_or_compute("k", lambda: 42) == 42
+
+
+def test_aborted_leader_raises_compute_aborted_for_waiters():
+    cache = ResultCache()
+    started, release = threading.Event(), threading.Event()
+
+    def abort():
+        started.set()
+        release.wait(10)
+        raise KeyboardInterrupt
+
+    threads, results = run_concurrently(cache, "k", abort, started)
+    release.set()
+    for t in threads:
+        t.join(10)
+    assert isinstance(results[0][1], KeyboardInterrupt)
+    assert all(kind == "error" and isinstance(e, ComputeAborted) for kind, e in results[1:])
+
+
+def test_waiter_timeout():
+    cache = ResultCache()
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(10)
+        return 1
+
+    leader = threading.Thread(target=cache.get_or_compute, args=("k", slow))
+    leader.start()
+    assert started.wait(10)
+    with pytest.raises(TimeoutError):
+        cache.get_or_compute("k", slow, wait=0.01)
+    release.set()
+    leader.join(10)
+    assert cache.get("k") == 1
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    cache = ResultCache(maxsize=2, ttl=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" zuletzt benutzt -> "b" fliegt
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+    now = time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 11)
+    assert cache.get("a") is None
+
+
+def test_store_is_shared_between_caches(tmp_path):
+    path = str(tmp_path / "shared.sqlite")
+    key = ("llama", "02", None, "66e48f350042a81f", ("Horror", "Action", "Drama"), 0)
+    writer = ResultCache(store=SqliteStore(path, table="llm"))
+    assert writer.get_or_compute(key, lambda: "Schritt eins") == "Schritt eins"
+
+    # anderer Prozess bzw. Neustart: Treffer aus SQLite, ohne zu rechnen
+    reader = ResultCache(store=SqliteStore(path, table="llm"))
+    assert reader.get_or_compute(key, lambda: pytest.fail("darf nicht rechnen")) == "Schritt eins"
+    assert reader.store_hits == 1
+    assert ResultCache(store=SqliteStore(path, table="rows")).get(key) is None
+
+
+def test_store_entries_expire(tmp_path):
+    store = SqliteStore(str(tmp_path / "c.sqlite"), ttl=-1)
+    store.put(["k"], [1, 2])
+    assert store.get(["k"]) is None
+    store.purge()
+    assert store._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
@@ -0,0 +1,67 @@
+import numpy as np
+
+from cinemate.catalog import ERA_SPLIT_YEAR, ERAS, GENRES, MAX_RUNTIME, STYLES, era_of, genre_mask, load_tsv
+from cinemate.compiler import compile_bundle
+from cinemate.store import open_catalog
+
+ROWS = [
+    ("tt0000001", "movie", "Kurz", 0, 1999, 95, "Drama", 7.1, 1200, "Ein Drama."),
+    ("tt1145448", "movie", "Logistics", 0, 2012, 51420, "Drama", 6.4, 950, "Ein sehr langer Film."),
+    ("tt0000003", "movie", "Nur für Erwachsene", 1, 2005, 90, "Drama", 5.0, 300, ""),
+    ("tt0000004", "tvSeries", "Serie", 0, 2010, 45, "Comedy", 8.0, 5000, ""),
+]
+
+
+def check(catalog):
+    assert list(catalog.ids) == ["tt0000001", "tt1145448"]
+    assert catalog.runtime.dtype == np.int16
+    assert list(catalog.runtime) == [95, MAX_RUNTIME]
+
+
+def test_load_tsv_caps_runtime_and_skips_adult_titles(basics_tsv):
+    check(load_tsv(basics_tsv(ROWS)))
+
+
+def test_compile_bundle_caps_runtime_and_skips_adult_titles(basics_tsv, tmp_path):
+    target = str(tmp_path / "bundle")
+    assert compile_bundle([basics_tsv(ROWS)], target) == 2
+    check(open_catalog(target))
+
+
+def brute_force_query(catalog, genres, era, style, runtime, rating):
+    year_ok = (catalog.year < ERA_SPLIT_YEAR) if era == ERAS[0] else (catalog.year >= ERA_SPLIT_YEAR)
+    keep = (
+        ((catalog.genres & genre_mask(genres)) != 0)
+        & (catalog.style == STYLES.index(style))
+        & year_ok
+        & (catalog.runtime >= runtime[0]) & (catalog.runtime <= runtime[1])
+        & (catalog.rating >= np.float32(rating[0])) & (catalog.rating <= np.float32(rating[1]))
+    )
+    return np.flatnonzero(keep)
+
+
+def test_query_matches_brute_force_filter(catalog):
+    rng = np.random.default_rng(3)
+    for _ in range(300):
+        genres = tuple(rng.choice(GENRES, rng.integers(1, 4), replace=False))
+        runtime = tuple(sorted(rng.integers(55, 210, 2)))
+        rating = tuple(sorted(rng.integers(0, 101, 2) / 10))
+        era, style = ERAS[rng.integers(2)], STYLES[rng.integers(3)]
+        rows = catalog.query(genres, era, style, runtime, rating)
+        np.testing.assert_array_equal(np.sort(rows), brute_force_query(catalog, genres, era, style, runtime, rating))
+
+
+def test_query_hits_rating_bounds_exactly(catalog):
+    # 8.5 als float32 liegt unter 8.5 als float64; die Grenzen müssen trotzdem greifen
+    row = int(np.flatnonzero(np.isclose(catalog.rating, 8.5))[0])
+    genres, era = catalog.genre_names(row), era_of(int(catalog.year[row]))
+    style, runtime = STYLES[catalog.style[row]], (int(catalog.runtime[row]),) * 2
+    assert row in catalog.query(genres, era, style, runtime, (8.5, 8.5))
+
+
+def test_record_formats_a_catalog_row(basics_tsv):
+    catalog = load_tsv(basics_tsv([ROWS[0]]))
+    assert catalog.record(0) == {
+        "name": "Kurz", "year": 1999, "genres": ["Drama"], "style": "Realfilm",
+        "runtime": 95, "imdb": 7.1, "votes": 1200, "desc": "Ein Drama.",
+    }
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from cinemate import ranking
+from cinemate.combos import COMBOS, ComboTable
+
+RANGES = [
+    ((60, 200), (1.0, 10.0)),
+    ((90, 120), (6.0, 8.5)),
+    ((150, 200), (8.0, 10.0)),
+    ((60, 75), (1.0, 3.0)),
+]
+
+
+@pytest.fixture(scope="module")
+def table(catalog):
+    return ComboTable.build(catalog)
+
+
+def filtered_rank(catalog, genres, era, style, runtime, rating, k):
+    rows = catalog.query(genres, era, style, runtime, rating)
+    ids, _ = ranking.rank(catalog, genres, era, style, runtime, rating, k, rows, text=True)
+    return rows, ids
+
+
+@pytest.mark.parametrize("runtime, rating", RANGES)
+def test_best_matches_rank_over_filtered_rows(catalog, table, runtime, rating):
+    for genres, era, style in COMBOS:
+        rows, expected = filtered_rank(catalog, genres, era, style, runtime, rating, 3)
+        ids = table.best(genres, era, style, runtime, rating)
+        if len(rows) < 3:
+            assert ids is None
+        else:
+            np.testing.assert_array_equal(ids, expected)
+
+
+def test_short_list_falls_back(catalog):
+    table = ComboTable.build(catalog, limit=5)
+    for genres, era, style in COMBOS:
+        for runtime, rating in RANGES:
+            ids = table.best(genres, era, style, runtime, rating)
+            if ids is not None:
+                _, expected = filtered_rank(catalog, genres, era, style, runtime, rating, 3)
+                np.testing.assert_array_equal(ids, expected)
+
+
+def test_genre_order_and_unknown_combination(catalog, table):
+    genres, era, style = COMBOS[0]
+    runtime, rating = RANGES[0]
+    np.testing.assert_array_equal(
+        table.best(genres[::-1], era, style, runtime, rating),
+        table.best(genres, era, style, runtime, rating),
+    )
+    assert table.best(genres[:2], era, style, runtime, rating) is None
@@ -0,0 +1,59 @@
+import gzip
+import os
+import random
+
+import numpy as np
+import pytest
+
+from cinemate.catalog import Catalog, load_tsv
+from cinemate.compiler import compile_bundle
+from cinemate.store import BundleError, open_catalog
+
+IMDB_GENRES = ["Comedy", "Drama", "Action", "Sci-Fi", "Horror", "Thriller", "Animation", "Romance"]
+
+
+@pytest.fixture
+def dumps(tmp_path, basics_tsv):
+    """title.basics (gzip, ohne Ratings) und eine separate title.ratings mit Lücken."""
+    rnd = random.Random(5)
+    basics, ratings = [], []
+    for i in range(500):
+        tconst = f"tt{i:07d}"
+        genres = ",".join(rnd.sample(IMDB_GENRES, rnd.randint(1, 3)))
+        year = rnd.choice([r"\N", *range(1920, 2025)])
+        basics.append((tconst, "movie", f"Film {i} – Ü", 0, year, rnd.randint(60, 240), genres,
+                       r"\N", r"\N", f"Über {genres.lower()}"))
+        if rnd.random() < 0.9:
+            ratings.append(f"{tconst}\t{rnd.randint(10, 100) / 10}\t{rnd.randint(5, 2_000_000)}")
+    plain = basics_tsv(basics)
+    with open(plain, "rb") as src, gzip.open(plain + ".gz", "wb") as dst:
+        dst.write(src.read())
+    ratings_path = str(tmp_path / "title.ratings.tsv")
+    with open(ratings_path, "w", encoding="utf-8") as f:
+        f.write("tconst\taverageRating\tnumVotes\n" + "\n".join(ratings) + "\n")
+    return plain + ".gz", ratings_path
+
+
+def test_compiled_bundle_equals_in_memory_load(dumps, tmp_path):
+    target = str(tmp_path / "bundle")
+    rows = compile_bundle(list(dumps), target, chunk_rows=64)  # mehrere Blöcke
+    expected = load_tsv(*dumps)
+    compiled = open_catalog(target)
+
+    assert rows == len(expected) == len(compiled)
+    assert 0 < rows < 500  # ohne Jahr, Rating oder App-Genre übersprungen
+    for col in ("ids", "names", "descs"):
+        assert [getattr(compiled, col)[i] for i in range(rows)] == list(getattr(expected, col))
+    for col in Catalog.NUMERIC_COLUMNS:
+        np.testing.assert_array_equal(getattr(compiled, col), getattr(expected, col))
+    for name, arr in expected.index_arrays.items():
+        np.testing.assert_array_equal(compiled.index_arrays[name], arr)
+    assert compiled.text_index is not None and compiled.combo_table is not None
+    assert not [fn for fn in os.listdir(target) if fn.endswith((".raw", ".tmp"))]
+
+
+def test_compiler_never_writes_over_a_bundle(dumps, tmp_path):
+    target = str(tmp_path / "bundle")
+    compile_bundle(list(dumps), target)
+    with pytest.raises(BundleError):
+        compile_bundle(list(dumps), target)
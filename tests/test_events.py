@@ -0,0 +1,94 @@
+import json
+import sqlite3
+import threading
+
+from cinemate import events
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_jsonl_log_writes_every_event_in_order(tmp_path):
+    path = str(tmp_path / "logs" / "events.jsonl")
+    log = events.open_event_log(path)
+    for i in range(1200):
+        assert log.emit("step", session="s1", n=i)
+    log.close()
+    written = read_jsonl(path)
+    assert [e["n"] for e in written] == list(range(1200))
+    assert written[0]["kind"] == "step" and written[0]["session"] == "s1"
+    assert log.stats == {"queued": 0, "written": 1200, "dropped": 0, "failed": 0}
+    assert not log.emit("step")  # nach close verworfen
+
+
+def test_sqlite_log(tmp_path):
+    path = str(tmp_path / "events.sqlite")
+    log = events.open_event_log(path)
+    log.emit("recommendations", session="s1", sig="abc")
+    log.emit("completed", session="s1", films=[{"name": "Ü", "year": 2001}])
+    log.close()
+    rows = sqlite3.connect(path).execute("SELECT kind, session, data FROM events ORDER BY id").fetchall()
+    assert [(kind, session) for kind, session, _ in rows] == [("recommendations", "s1"), ("completed", "s1")]
+    assert json.loads(rows[1][2])["films"] == [{"name": "Ü", "year": 2001}]
+
+
+def test_jsonl_rotates_by_size(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    sink = events.JsonlSink(path, rotate_bytes=100)
+    sink.write([{"ts": 0, "kind": "x", "pad": "." * 120}])
+    sink.write([{"ts": 1, "kind": "y"}])
+    rotated = [p for p in tmp_path.iterdir() if p.name != "events.jsonl"]
+    assert len(rotated) == 1 and read_jsonl(rotated[0])[0]["kind"] == "x"
+    assert [e["kind"] for e in read_jsonl(path)] == ["y"]
+
+
+class BlockingSink:
+    def __init__(self):
+        self.release = threading.Event()
+        self.events = []
+
+    def write(self, batch):
+        self.release.wait(10)
+        self.events.extend(batch)
+
+    def close(self):
+        pass
+
+
+def test_full_queue_drops_instead_of_blocking():
+    sink = BlockingSink()
+    log = events.EventLog(sink, maxsize=2, batch_size=1)
+    results = [log.emit("e", n=i) for i in range(10)]
+    assert results.count(False) == log.dropped > 0
+    sink.release.set()
+    log.close()
+    assert len(sink.events) == results.count(True) == log.written
+
+
+class FailingSink:
+    def __init__(self):
+        self.calls = 0
+
+    def write(self, batch):
+        self.calls += 1
+        if self.calls == 1:
+            raise OSError("Platte voll")
+
+    def close(self):
+        pass
+
+
+def test_failed_batch_is_counted_and_writer_keeps_running():
+    sink = FailingSink()
+    log = events.EventLog(sink, batch_size=1)
+    log.emit("a")
+    log.emit("b")
+    log.close()
+    assert log.failed == 1 and log.written == 1
+
+
+def test_no_path_means_no_log():
+    assert events.open_event_log(None) is None
+    assert events.open_event_log("") is None
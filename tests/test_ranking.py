@@ -0,0 +1,47 @@
+import numpy as np
+
+from cinemate import ranking
+from cinemate.catalog import ERAS, STYLES
+
+QUERY = (("Drama", "Action", "Horror"), ERAS[1], STYLES[0], (90, 120), (6.0, 8.0))
+
+
+def test_top_k_is_sorted_and_breaks_ties_by_position():
+    scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9], dtype=np.float32)
+    assert list(ranking.top_k(scores, 2)) == [1, 4]
+    assert list(ranking.top_k(scores, 10)) == [1, 4, 0, 2, 3]
+    assert len(ranking.top_k(scores[:0], 3)) == 0
+
+
+def test_rank_matches_full_sort(catalog):
+    scores = ranking.score(catalog, *QUERY)
+    expected = np.lexsort((np.arange(len(scores)), -scores))[:5]
+    ids, top = ranking.rank(catalog, *QUERY, k=5)
+    np.testing.assert_array_equal(ids, expected)
+    np.testing.assert_array_equal(top, scores[expected])
+
+
+def test_score_of_rows_equals_full_score(catalog):
+    rows = np.arange(0, len(catalog), 7)
+    np.testing.assert_array_equal(ranking.score(catalog, *QUERY, rows=rows), ranking.score(catalog, *QUERY)[rows])
+
+
+def test_scores_stay_in_range(catalog):
+    scores = ranking.score(catalog, *QUERY)
+    assert scores.dtype == np.float32
+    assert scores.min() >= 0 and scores.max() <= 1 + 1e-6
+
+
+def test_best_matches_prefers_rows_that_pass_all_filters(catalog):
+    rows = catalog.query(*QUERY)
+    assert len(rows) >= 3
+    ids = ranking.best_matches(catalog, *QUERY)
+    assert set(ids) <= set(rows)
+
+
+def test_best_matches_falls_back_to_whole_catalog(catalog):
+    query = (("Komödie", "Drama", "Thriller"), ERAS[0], STYLES[2], (195, 199), (9.8, 9.9))
+    assert len(catalog.query(*query)) < 3
+    ids = ranking.best_matches(catalog, *query)
+    expected, _ = ranking.rank(catalog, *query, k=3, text=True)
+    np.testing.assert_array_equal(ids, expected)
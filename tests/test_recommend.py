@@ -0,0 +1,77 @@
+import os
+
+from cinemate.cache import ResultCache
+from cinemate.catalog import load_tsv
+from cinemate.recommend import recommend, rng_for, seed_for, submit_rows
+from cinemate.signature import Signature
+from cinemate.store import open_catalog, save_catalog
+
+SIG = Signature.from_inputs(["Drama", "Action", "Komödie"], "Modern (2000+)", "Realfilm", (60, 200), (1.0, 10.0))
+FILMS = [{"name": f"Film {i}", "desc": ""} for i in range(3)]
+ROWS = [
+    (f"tt{i:07d}", "movie", f"Titel {i}", 0, 2000 + i, 90 + i, "Drama,Action", 5 + i / 10, 1000 * i + 1, "")
+    for i in range(6)
+]
+
+
+def test_every_loaded_catalog_has_a_version(basics_tsv, tmp_path):
+    path = basics_tsv(ROWS)
+    tsv = load_tsv(path)
+    assert tsv.version is not None
+    assert load_tsv(path).version == tsv.version
+
+    directory = str(tmp_path / "bundle")
+    os.makedirs(directory)
+    save_catalog(tsv, directory)
+    os.remove(os.path.join(directory, "manifest.json"))  # Bundle aus der Zeit vor dem Manifest
+    assert open_catalog(directory).version is not None
+
+
+def test_changed_tsv_gets_a_new_version(basics_tsv):
+    old = load_tsv(basics_tsv(ROWS)).version
+    assert load_tsv(basics_tsv(ROWS[:4])).version != old
+
+
+def test_unversioned_catalog_is_not_cached(catalog):
+    cache = ResultCache()
+    assert catalog.version is None
+    assert len(recommend(SIG, FILMS, catalog, cache)) == 3
+    assert len(submit_rows(SIG, 3, catalog, cache).result()) == 3
+    assert len(cache) == 0
+
+
+def test_versioned_catalog_is_cached_per_version(basics_tsv):
+    catalog = load_tsv(basics_tsv(ROWS))
+    cache = ResultCache()
+    recommend(SIG, FILMS, catalog, cache)
+    assert cache.get((catalog.version, SIG.digest)) is not None
+
+
+def test_seed_is_pinned_per_signature_and_participant():
+    assert seed_for(SIG) == 7293086891980624379
+    assert seed_for(SIG, "p1") == 13693362391133183477
+    assert seed_for(SIG, "") == seed_for(SIG)
+
+
+def test_fictional_recommendations_are_reproducible():
+    first = recommend(SIG, FILMS, rng=rng_for(SIG, "p1"))
+    assert recommend(SIG, FILMS, rng=rng_for(SIG, "p1")) == first
+    assert recommend(SIG, FILMS, rng=rng_for(SIG, "p2")) != first
+    assert recommend(SIG, FILMS) == recommend(SIG, FILMS, rng=rng_for(SIG))
+
+
+def test_fictional_recommendations_respect_the_inputs():
+    sig = Signature.from_inputs(["Horror", "Drama", "Thriller"], "Klassiker (<2000)", "Animation", (90, 100), (7.0, 7.5))
+    for rec in recommend(sig, FILMS, rng=rng_for(sig, "p1"), genres=["Thriller", "Horror", "Drama"]):
+        assert 90 <= rec["runtime"] <= 100
+        assert 7.0 <= rec["imdb"] <= 7.5
+        assert 1970 <= rec["year"] <= 1999
+        assert rec["genres"] == ["Thriller", "Horror", "Drama"]
+        assert rec["style"] == "Animation"
+
+
+def test_catalog_recommendations_are_reproducible(basics_tsv):
+    catalog = load_tsv(basics_tsv(ROWS))
+    first = recommend(SIG, FILMS, catalog)
+    assert recommend(SIG, FILMS, catalog, ResultCache()) == first
+    assert len(first) == 3
@@ -0,0 +1,94 @@
+import os
+import subprocess
+
+import pytest
+
+from cinemate import reload
+from cinemate.store import open_catalog
+
+
+@pytest.fixture
+def failing_publish(monkeypatch):
+    calls = []
+
+    def run(cmd, check):
+        calls.append(cmd)
+        raise subprocess.CalledProcessError(1, cmd)
+
+    monkeypatch.setattr(reload.subprocess, "run", run)
+    monkeypatch.setattr(reload.time, "sleep", lambda seconds: None)
+    return calls
+
+
+def test_failed_publish_backs_off_until_sources_change(tmp_path, basics_tsv, failing_publish):
+    source = tmp_path
+    basics_tsv([("tt0000001", "movie", "A", 0, 2001, 90, "Drama", 7.0, 10, "")])
+    watcher = reload.CatalogWatcher(str(tmp_path / "catalog"), source=str(source), interval=60)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        watcher.check()
+    watcher.check()  # gleiche Dumps, Pause läuft noch
+    assert len(failing_publish) == 1
+
+    watcher._retry_at = 0.0  # Pause abgelaufen
+    with pytest.raises(subprocess.CalledProcessError):
+        watcher.check()
+    assert len(failing_publish) == 2
+    assert watcher._failures == 2
+
+    basics_tsv([("tt0000002", "movie", "Zweiter Titel", 0, 2002, 95, "Drama", 6.0, 20, "")])
+    with pytest.raises(subprocess.CalledProcessError):
+        watcher.check()  # neue Dumps: sofort neuer Versuch
+    assert len(failing_publish) == 3
+    assert watcher._failures == 1
+
+
+def film(i, runtime=90):
+    return (f"tt{i:07d}", "movie", f"Film {i}", 0, 2000 + i, runtime, "Drama,Action", 7.0, 100 + i, "")
+
+
+def test_publish_switches_current_and_prunes_old_versions(tmp_path, basics_tsv):
+    root = str(tmp_path / "catalog")
+    versions = []
+    for n in (3, 4, 5):
+        versions.append(reload.publish([basics_tsv([film(i) for i in range(n)])], root))
+    assert len(set(versions)) == 3
+    assert reload.current_version(root) == versions[-1]
+    kept = sorted(p.name for p in (tmp_path / "catalog").iterdir() if p.is_dir())
+    assert kept == versions[-reload.KEEP_VERSIONS:]
+    assert len(open_catalog(os.path.join(root, versions[-1]))) == 5
+
+
+def test_failed_publish_leaves_current_untouched(tmp_path, basics_tsv, monkeypatch):
+    root = str(tmp_path / "catalog")
+    version = reload.publish([basics_tsv([film(0), film(1), film(2)])], root)
+
+    def broken(sources, directory):
+        raise RuntimeError("Dump kaputt")
+
+    monkeypatch.setattr(reload, "compile_bundle", broken)
+    with pytest.raises(RuntimeError):
+        reload.publish([basics_tsv([film(9)])], root)
+    assert reload.current_version(root) == version
+    assert sorted(p.name for p in (tmp_path / "catalog").iterdir() if p.is_dir()) == [version]
+
+
+def test_watcher_swaps_in_new_versions(tmp_path, basics_tsv):
+    root = str(tmp_path / "catalog")
+    first = reload.publish([basics_tsv([film(0), film(1), film(2)])], root)
+    watcher = reload.CatalogWatcher(root)
+    old = watcher.catalog
+    assert watcher.version == old.version == first
+
+    watcher.check()
+    assert watcher.catalog is old  # unverändert
+
+    second = reload.publish([basics_tsv([film(i) for i in range(4)])], root)
+    watcher.check()
+    assert watcher.version == watcher.catalog.version == second
+    assert len(watcher.catalog) == 4 and len(old) == 3  # alter Handle bleibt benutzbar
+
+
+def test_watcher_reads_plain_tsv_and_missing_paths(tmp_path, basics_tsv):
+    assert len(reload.CatalogWatcher(basics_tsv([film(0)])).catalog) == 1
+    assert reload.CatalogWatcher(str(tmp_path / "fehlt")).catalog is None
@@ -0,0 +1,35 @@
+from concurrent.futures import Future
+
+from cinemate.metrics import Run
+from cinemate.script import PendingScript
+
+
+def pending(future):
+    def finish(rows, perf):
+        perf.count("finish")
+        return ("script", rows)
+
+    def fallback(perf):
+        perf.count("fallback")
+        return ("fallback", None)
+
+    return PendingScript("Eingaben", ("Schritt",), future, finish, fallback)
+
+
+def test_result_is_rendered_once_with_the_callers_metrics():
+    future = Future()
+    future.set_result([1, 2, 3])
+    script = pending(future)
+    follower, other = Run("app", "follower", 1), Run("app", "other", 1)
+    assert script.result(follower) == ("script", [1, 2, 3])
+    assert script.result(other) == ("script", [1, 2, 3])
+    assert follower.counters == {"finish": 1}
+    assert other.counters == {}
+
+
+def test_failed_ranking_falls_back_with_the_callers_metrics():
+    future = Future()
+    future.set_exception(RuntimeError("Pool weg"))
+    perf = Run("app", "follower", 1)
+    assert pending(future).result(perf) == ("fallback", None)
+    assert perf.counters == {"fallback": 1}
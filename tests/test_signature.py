@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from cinemate.signature import Signature
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUTS = (["Horror", "Action", "Drama"], "Modern (2000+)", "Realfilm", (92, 118), (6.5, 8.3))
+
+
+def test_genre_order_is_canonical():
+    a = Signature.from_inputs(*INPUTS)
+    b = Signature.from_inputs(["Drama", "Horror", "Action"], *INPUTS[1:])
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a.digest == b.digest
+    assert a.genres == ("Action", "Drama", "Horror")
+
+
+def test_ranges_snap_to_slider_steps():
+    sig = Signature.from_inputs(*INPUTS)
+    assert sig.runtime == (90, 120)
+    assert sig.rating == (65, 83)
+    assert sig == Signature.from_inputs(*INPUTS[:3], (91.0, 119), (6.5000001, 8.3))
+    assert sig.query() == (("Action", "Drama", "Horror"), "Modern (2000+)", "Realfilm", (90, 120), (6.5, 8.3))
+
+
+def test_different_inputs_differ():
+    sig = Signature.from_inputs(*INPUTS)
+    for other in (
+        Signature.from_inputs(["Horror", "Action", "Thriller"], *INPUTS[1:]),
+        Signature.from_inputs(INPUTS[0], "Klassiker (<2000)", *INPUTS[2:]),
+        Signature.from_inputs(*INPUTS[:3], (95, 120), INPUTS[4]),
+        Signature.from_inputs(*INPUTS[:4], (6.5, 8.4)),
+    ):
+        assert other != sig
+        assert other.digest != sig.digest
+
+
+def test_digest_is_stable_across_processes():
+    code = (
+        "from cinemate.signature import Signature\n"
+        f"print(Signature.from_inputs(*{INPUTS!r}).digest)\n"
+    )
+    digests = {
+        subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            env={"PYTHONHASHSEED": seed, "PYTHONPATH": ROOT},
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert digests == {Signature.from_inputs(*INPUTS).digest}
+
+
+def test_digest_is_pinned():
+    # Digests sind Schlüssel im gemeinsamen SQLite-Cache und in den Studienprotokollen
+    assert Signature.from_inputs(*INPUTS).digest == "66e48f350042a81f"
+
+
+def test_rating_range_and_immutability():
+    sig = Signature.from_inputs(*INPUTS)
+    assert sig.rating_range == (6.5, 8.3)
+    assert {sig: 1}[Signature.from_inputs(*INPUTS)] == 1
+    with pytest.raises(AttributeError):
+        sig.era = "Klassiker (<2000)"
@@ -0,0 +1,87 @@
+from concurrent.futures import Future
+
+import pytest
+
+from cinemate.cache import ResultCache
+from cinemate.catalog import ERAS, STYLES, load_tsv
+from cinemate.signature import Signature
+from cinemate.speculate import Speculator, ThreadRanking
+
+SIG_A = Signature.from_inputs(["Drama", "Action", "Horror"], ERAS[1], STYLES[0], (60, 200), (1.0, 10.0))
+SIG_B = Signature.from_inputs(["Drama", "Action", "Thriller"], ERAS[1], STYLES[0], (60, 200), (1.0, 10.0))
+
+
+class ManualRanking:
+    """Jobs bleiben in der Warteschlange, bis der Test sie startet bzw. beendet."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, catalog, query, k):
+        future = Future()
+        self.jobs.append(future)
+        return future
+
+
+@pytest.fixture
+def catalog(basics_tsv):
+    return load_tsv(basics_tsv([
+        (f"tt{i:07d}", "movie", f"Film {i}", 0, 2000 + i, 90 + i, "Drama,Action,Horror,Thriller", 7.0, 100 + i, "")
+        for i in range(6)
+    ]))
+
+
+@pytest.fixture
+def speculator():
+    return Speculator(ResultCache(), ManualRanking())
+
+
+def test_sessions_share_one_job(speculator, catalog):
+    key = speculator.speculate(SIG_A, 3, catalog)
+    assert speculator.speculate(SIG_A, 3, catalog) == key
+    assert len(speculator.ranker.jobs) == 1
+    assert speculator.stats == {"running": 1, "started": 1, "cancelled": 0}
+
+
+def test_job_is_cancelled_when_nobody_needs_it(speculator, catalog):
+    first = speculator.speculate(SIG_A, 3, catalog)
+    speculator.speculate(SIG_A, 3, catalog)  # zweite Session
+    speculator.speculate(SIG_B, 3, catalog, previous=first)  # erste Session wechselt
+    job_a = speculator.ranker.jobs[0]
+    assert not job_a.cancelled()
+
+    speculator.release(first)  # auch die zweite verzichtet
+    assert job_a.cancelled()
+    assert speculator.stats == {"running": 1, "started": 2, "cancelled": 1}
+    assert len(speculator.cache) == 0
+
+
+def test_running_job_is_not_cancelled_and_fills_the_cache(speculator, catalog):
+    key = speculator.speculate(SIG_A, 3, catalog)
+    job = speculator.ranker.jobs[0]
+    job.set_running_or_notify_cancel()
+    speculator.release(key)
+    assert not job.cancelled() and speculator.cancelled == 0
+
+    job.set_result([2, 1, 0])
+    assert speculator.cache.get(key) == [2, 1, 0]
+    assert speculator.stats["running"] == 0
+
+
+def test_click_takes_over_the_speculative_job(speculator, catalog):
+    key = speculator.speculate(SIG_A, 3, catalog)
+    clicked = speculator.rows(SIG_A, 3, catalog)
+    assert clicked is speculator.ranker.jobs[0]
+    speculator.release(key)  # die Auswahl ändert sich nach dem Klick
+    assert not clicked.cancelled()
+
+    clicked.set_result([5, 4, 3])
+    again = speculator.rows(SIG_A, 3, catalog)
+    assert again.done() and again.result() == [5, 4, 3]
+    assert len(speculator.ranker.jobs) == 1  # aus dem Cache, kein neuer Job
+
+
+def test_thread_ranking_computes_rows(catalog):
+    speculator = Speculator(ResultCache(), ThreadRanking(1))
+    rows = speculator.rows(SIG_A, 3, catalog).result(10)
+    assert len(rows) == 3 and all(isinstance(row, int) for row in rows)
@@ -0,0 +1,61 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from cinemate import ranking
+from cinemate.catalog import ERAS, STYLES, Catalog
+from cinemate.combos import ComboTable
+from cinemate.store import (
+    MANIFEST, BundleError, StringColumn, open_catalog, save_catalog, save_combo_table, save_text_index,
+)
+
+QUERY = (("Drama", "Action", "Horror"), ERAS[1], STYLES[0], (90, 120), (6.0, 8.0))
+
+
+@pytest.fixture
+def bundle(catalog, tmp_path):
+    directory = str(tmp_path / "bundle")
+    os.makedirs(directory)
+    save_catalog(catalog, directory)
+    save_text_index(catalog.text_index, directory)
+    save_combo_table(ComboTable.build(catalog), directory)
+    return directory
+
+
+def test_string_column_round_trip():
+    values = ["", "Amélie", "Das Boot", "千と千尋"]
+    column = StringColumn(*StringColumn.encode(values))
+    assert [column[i] for i in range(len(column))] == values
+
+
+def test_round_trip_keeps_columns_and_indexes(catalog, bundle):
+    opened = open_catalog(bundle)
+    assert opened.path == bundle and opened.version is not None
+    for col in Catalog.NUMERIC_COLUMNS:
+        loaded = getattr(opened, col)
+        assert not loaded.flags.owndata and not loaded.flags.writeable  # gemappt, keine Kopie
+        np.testing.assert_array_equal(loaded, getattr(catalog, col))
+    for name, arr in catalog.index_arrays.items():
+        np.testing.assert_array_equal(opened.index_arrays[name], arr)
+    assert opened.record(17) == catalog.record(17)
+    np.testing.assert_array_equal(opened.query(*QUERY), catalog.query(*QUERY))
+
+
+def test_round_trip_keeps_search_tables(catalog, bundle):
+    opened = open_catalog(bundle)
+    assert opened.text_index is not None and opened.combo_table is not None
+    expected, _ = ranking.rank(catalog, *QUERY, k=3, rows=catalog.query(*QUERY), text=True)
+    np.testing.assert_array_equal(ranking.best_matches(opened, *QUERY), expected)
+
+
+def test_incompatible_bundle_is_rejected(bundle):
+    path = os.path.join(bundle, MANIFEST)
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["genres"] = manifest["genres"][::-1]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    with pytest.raises(BundleError):
+        open_catalog(bundle)
@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_timing(scale):
+    return subprocess.run(
+        [sys.executable, "-c", "import cinemate.timing as t; print(t.TYPING_FPS)"],
+        capture_output=True, text=True, cwd=ROOT, env={**os.environ, "CINEMATE_TIME_SCALE": scale},
+    )
+
+
+@pytest.mark.parametrize("scale", ["0", "-1", "nan"])
+def test_non_positive_time_scale_is_rejected(scale):
+    proc = import_timing(scale)
+    assert proc.returncode != 0
+    assert "CINEMATE_TIME_SCALE muss größer als 0 sein" in proc.stderr
+
+
+def test_time_scale_keeps_frames_per_message():
+    assert float(import_timing("0.5").stdout) == 24.0